@@ -5,8 +5,9 @@ from sqlalchemy import pool
 
 from alembic import context
 
-from app.core.database import Base
+from app.core.base import Base
 from app.config import Config
+import app.models  # noqa: F401  registers every table on Base.metadata
 
 target_metadata = Base.metadata
 
@@ -15,6 +16,13 @@ config = context.config
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
 
+def include_name(name, type_, parent_names) -> bool:
+    """Keep the FTS5 search table and its shadow tables out of autogenerate."""
+    if type_ == "table":
+        return not name.startswith("books_fts")
+    return True
+
+
 def run_migrations_offline() -> None:
     url = Config.SQLALCHEMY_DATABASE_URL
     context.configure(
@@ -22,6 +30,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_name=include_name,
     )
 
     with context.begin_transaction():
@@ -36,7 +45,7 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection, target_metadata=target_metadata, include_name=include_name
         )
 
         with context.begin_transaction():
@@ -0,0 +1,38 @@
+"""Book change versions and change counters
+
+Revision ID: 5d2b8e7f1a93
+Revises: e41a7c2b9f05
+Create Date: 2026-10-18 06:20:00.000000
+
+Adds the change_counters table, seeded with the catalog-wide "books" counter,
+and a version column on books. Existing books start at version 0.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2b8e7f1a93'
+down_revision: Union[str, None] = 'e41a7c2b9f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    change_counters = op.create_table('change_counters',
+    sa.Column('name', sa.String(), nullable=False),
+    sa.Column('value', sa.BigInteger(), server_default='0', nullable=False),
+    sa.PrimaryKeyConstraint('name')
+    )
+    op.bulk_insert(change_counters, [{'name': 'books', 'value': 0}])
+    op.add_column('books', sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # A plain DROP COLUMN (SQLite 3.35+): a batch rebuild of books would drop its full-text search triggers.
+    op.drop_column('books', 'version')
+    op.drop_table('change_counters')
@@ -21,12 +21,77 @@ depends_on: Union[str, Sequence[str], None] = None
 def upgrade() -> None:
     """Upgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    pass
+    op.create_table('books',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('title', sa.String(), nullable=True),
+    sa.Column('author', sa.String(), nullable=True),
+    sa.Column('publication_year', sa.Integer(), nullable=True),
+    sa.Column('isbn', sa.String(), nullable=True),
+    sa.Column('copies_available', sa.Integer(), nullable=True),
+    sa.Column('description', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_books_author'), 'books', ['author'], unique=False)
+    op.create_index(op.f('ix_books_copies_available'), 'books', ['copies_available'], unique=False)
+    op.create_index(op.f('ix_books_id'), 'books', ['id'], unique=False)
+    op.create_index(op.f('ix_books_isbn'), 'books', ['isbn'], unique=True)
+    op.create_index(op.f('ix_books_publication_year'), 'books', ['publication_year'], unique=False)
+    op.create_index(op.f('ix_books_title'), 'books', ['title'], unique=False)
+    op.create_table('borrowed_books',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('reader_id', sa.Integer(), nullable=True),
+    sa.Column('book_id', sa.Integer(), nullable=True),
+    sa.Column('date_borrowed', sa.DateTime(), nullable=True),
+    sa.Column('date_returned', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_borrowed_books_id'), 'borrowed_books', ['id'], unique=False)
+    op.create_table('readers',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(), nullable=True),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_readers_email'), 'readers', ['email'], unique=True)
+    op.create_index(op.f('ix_readers_id'), 'readers', ['id'], unique=False)
+    op.create_index(op.f('ix_readers_name'), 'readers', ['name'], unique=False)
+    op.create_table('refresh_tokens',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=True),
+    sa.Column('token', sa.String(), nullable=True),
+    sa.Column('expires_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('token')
+    )
+    op.create_table('users',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('email', sa.String(), nullable=True),
+    sa.Column('password', sa.String(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_users_email'), 'users', ['email'], unique=True)
+    op.create_index(op.f('ix_users_id'), 'users', ['id'], unique=False)
     # ### end Alembic commands ###
 
 
 def downgrade() -> None:
     """Downgrade schema."""
     # ### commands auto generated by Alembic - please adjust! ###
-    pass
+    op.drop_index(op.f('ix_users_id'), table_name='users')
+    op.drop_index(op.f('ix_users_email'), table_name='users')
+    op.drop_table('users')
+    op.drop_table('refresh_tokens')
+    op.drop_index(op.f('ix_readers_name'), table_name='readers')
+    op.drop_index(op.f('ix_readers_id'), table_name='readers')
+    op.drop_index(op.f('ix_readers_email'), table_name='readers')
+    op.drop_table('readers')
+    op.drop_index(op.f('ix_borrowed_books_id'), table_name='borrowed_books')
+    op.drop_table('borrowed_books')
+    op.drop_index(op.f('ix_books_title'), table_name='books')
+    op.drop_index(op.f('ix_books_publication_year'), table_name='books')
+    op.drop_index(op.f('ix_books_isbn'), table_name='books')
+    op.drop_index(op.f('ix_books_id'), table_name='books')
+    op.drop_index(op.f('ix_books_copies_available'), table_name='books')
+    op.drop_index(op.f('ix_books_author'), table_name='books')
+    op.drop_table('books')
     # ### end Alembic commands ###
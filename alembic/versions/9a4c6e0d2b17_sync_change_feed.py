@@ -0,0 +1,50 @@
+"""Reader change versions, tombstones and change feed indexes
+
+Revision ID: 9a4c6e0d2b17
+Revises: 5d2b8e7f1a93
+Create Date: 2026-10-18 07:05:00.000000
+
+Adds readers.version with its "readers" change counter, the tombstones table
+recording deletes, and (version, id) indexes serving the sync change feed.
+Existing readers start at version 0.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c6e0d2b17'
+down_revision: Union[str, None] = '5d2b8e7f1a93'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("INSERT INTO change_counters (name, value) VALUES ('readers', 0)")
+    op.add_column('readers', sa.Column('version', sa.BigInteger(), server_default='0', nullable=False))
+    op.create_index('ix_readers_version', 'readers', ['version', 'id'], unique=False)
+    op.create_index('ix_books_version', 'books', ['version', 'id'], unique=False)
+
+    op.create_table('tombstones',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('entity', sa.String(), nullable=False),
+    sa.Column('entity_id', sa.Integer(), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_tombstones_feed', 'tombstones', ['entity', 'version', 'entity_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_tombstones_feed', table_name='tombstones')
+    op.drop_table('tombstones')
+
+    op.drop_index('ix_books_version', table_name='books')
+    op.drop_index('ix_readers_version', table_name='readers')
+    with op.batch_alter_table('readers') as batch_op:
+        batch_op.drop_column('version')
+    op.execute("DELETE FROM change_counters WHERE name = 'readers'")
@@ -0,0 +1,47 @@
+"""Loan hot path indexes and active loan counters
+
+Revision ID: c3f8a2d91e47
+Revises: 3b7e0f5c2a61
+Create Date: 2026-10-18 02:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a2d91e47'
+down_revision: Union[str, None] = '3b7e0f5c2a61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OPEN_LOAN = sa.text("date_returned IS NULL")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('readers', sa.Column('active_loans', sa.Integer(), server_default='0', nullable=False))
+    op.execute(
+        "UPDATE readers SET active_loans = ("
+        "SELECT count(borrowed_books.id) FROM borrowed_books "
+        "WHERE borrowed_books.reader_id = readers.id AND borrowed_books.date_returned IS NULL)"
+    )
+
+    op.create_index(
+        'ix_borrowed_books_open_loan', 'borrowed_books', ['reader_id', 'book_id'], unique=False,
+        sqlite_where=OPEN_LOAN, postgresql_where=OPEN_LOAN
+    )
+    op.create_index('ix_borrowed_books_reader_history', 'borrowed_books', ['reader_id', 'id'], unique=False)
+    op.create_index('ix_borrowed_books_book_id', 'borrowed_books', ['book_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_borrowed_books_book_id', table_name='borrowed_books')
+    op.drop_index('ix_borrowed_books_reader_history', table_name='borrowed_books')
+    op.drop_index('ix_borrowed_books_open_loan', table_name='borrowed_books')
+
+    with op.batch_alter_table('readers') as batch_op:
+        batch_op.drop_column('active_loans')
@@ -0,0 +1,124 @@
+"""
+Maintenance commands for the library catalog.
+
+Usage:
+    python -m app.cli import-books catalog.csv --batch-size 5000 --on-conflict upsert
+    python -m app.cli reconcile-loans
+    python -m app.cli purge-refresh-tokens
+"""
+import argparse
+import sys
+from typing import List, Optional
+
+from .config import Config, Settings
+from .core.catalog_io import CATALOG_FORMATS, detect_format, iter_book_records
+from .core.database import SessionLocal, create_tables
+from .core.tasks import purge_expired_refresh_tokens
+from .crud.book import BookCRUD, IMPORT_CONFLICT_POLICIES
+from .crud.reader import ReaderCRUD
+
+
+def import_books(args: argparse.Namespace) -> int:
+    """
+    Import books from a local CSV or NDJSON file and print the report as JSON.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Process exit code; 1 if any row failed to import.
+    """
+    fmt = args.format or detect_format(args.path)
+    db = SessionLocal()
+    try:
+        with open(args.path, encoding="utf-8-sig", errors="replace", newline="") as stream:
+            report = BookCRUD(db).bulk_import(
+                iter_book_records(stream, fmt), batch_size=args.batch_size, on_conflict=args.on_conflict
+            )
+    finally:
+        db.close()
+
+    print(report.model_dump_json(indent=2))
+    return 1 if report.failed else 0
+
+
+def reconcile_loans(args: argparse.Namespace) -> int:
+    """
+    Rebuild the readers' active loan counters from the loan history.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    db = SessionLocal()
+    try:
+        corrected = ReaderCRUD(db).reconcile_active_loans()
+    finally:
+        db.close()
+
+    print(f"Corrected active loan counters of {corrected} reader(s)")
+    return 0
+
+
+def purge_refresh_tokens(args: argparse.Namespace) -> int:
+    """
+    Delete expired refresh tokens in batches.
+
+    Args:
+        args (argparse.Namespace): Parsed command line arguments.
+
+    Returns:
+        int: Process exit code.
+    """
+    purged = purge_expired_refresh_tokens(batch_size=args.batch_size)
+    print(f"Purged {purged} expired refresh token(s)")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser with all maintenance subcommands.
+
+    Returns:
+        argparse.ArgumentParser: Configured parser.
+    """
+    parser = argparse.ArgumentParser(prog="python -m app.cli", description="Library catalog maintenance commands.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    importer = subparsers.add_parser("import-books", help="Bulk import books from a CSV or NDJSON file.")
+    importer.add_argument("path", help="Path to the file to import.")
+    importer.add_argument("--format", choices=CATALOG_FORMATS, help="File format; detected from the extension if omitted.")
+    importer.add_argument("--batch-size", type=int, default=Settings.BOOK_IMPORT_BATCH_SIZE, help="Rows per insert statement.")
+    importer.add_argument("--on-conflict", choices=IMPORT_CONFLICT_POLICIES, default="skip", help="How to handle existing ISBNs.")
+    importer.set_defaults(handler=import_books)
+
+    reconciler = subparsers.add_parser("reconcile-loans", help="Rebuild readers' active loan counters from borrowed_books.")
+    reconciler.set_defaults(handler=reconcile_loans)
+
+    purger = subparsers.add_parser("purge-refresh-tokens", help="Delete expired refresh tokens.")
+    purger.add_argument("--batch-size", type=int, default=Settings.REFRESH_TOKEN_PURGE_BATCH_SIZE, help="Tokens deleted per transaction.")
+    purger.set_defaults(handler=purge_refresh_tokens)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Entry point of the maintenance CLI.
+
+    Args:
+        argv (Optional[List[str]]): Command line arguments; defaults to sys.argv.
+
+    Returns:
+        int: Process exit code.
+    """
+    args = build_parser().parse_args(argv)
+    if not Config.SKIP_SCHEMA_CHECK:
+        create_tables()
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
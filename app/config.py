@@ -1,22 +1,165 @@
+import json
 import os
+import threading
+from typing import Any, Callable, List, Optional, Union
+
 from dotenv import load_dotenv
 
-load_dotenv()
+_environment_loaded = False
+_environment_lock = threading.Lock()
+
+
+def load_environment() -> None:
+    """
+    Load `.env` into the process environment once, on first use of any setting.
+    """
+    global _environment_loaded
+    with _environment_lock:
+        if not _environment_loaded:
+            load_dotenv()
+            _environment_loaded = True
+
+
+def as_bool(value: Union[str, bool]) -> bool:
+    """
+    Parse a boolean environment value ('1', 'true', 'yes' are true).
+
+    Args:
+        value (Union[str, bool]): Raw value or default.
+
+    Returns:
+        bool: Parsed value.
+    """
+    return value if isinstance(value, bool) else value.lower() in ('1', 'true', 'yes')
+
+
+def as_list(value: str) -> List[str]:
+    """
+    Parse a comma separated environment value, dropping empty items.
+
+    Args:
+        value (str): Raw value.
+
+    Returns:
+        List[str]: Stripped items.
+    """
+    return [item.strip() for item in value.split(',') if item.strip()]
+
+
+def as_echo(value: Union[str, bool]) -> Union[bool, str]:
+    """
+    Parse the SQLAlchemy echo level: a boolean or 'debug'.
+
+    Args:
+        value (Union[str, bool]): Raw value or default.
+
+    Returns:
+        Union[bool, str]: True, False or 'debug'.
+    """
+    if isinstance(value, str) and value.lower() == 'debug':
+        return 'debug'
+    return as_bool(value)
+
+
+class EnvVar:
+    """
+    Class attribute read from the environment variable of the same name on first access.
+
+    The parsed value is cached, so later accesses cost a dictionary lookup.
+    """
+
+    def __init__(self, default: Any = None, cast: Optional[Callable[[Any], Any]] = None, required: bool = False):
+        """
+        Initialize the descriptor.
+
+        Args:
+            default (Any): Value used when the variable is not set; also passed through `cast`.
+            cast (Optional[Callable[[Any], Any]]): Converts the raw value, e.g. `int`.
+            required (bool): Fail on access if the variable is not set.
+        """
+        self.default = default
+        self.cast = cast
+        self.required = required
+        self.name = None
+        self._value = None
+        self._loaded = False
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if not self._loaded:
+            load_environment()
+            raw = os.getenv(self.name)
+            if raw is None:
+                if self.required:
+                    raise RuntimeError(f"Environment variable {self.name} is not set")
+                raw = self.default
+            self._value = self.cast(raw) if self.cast is not None and raw is not None else raw
+            self._loaded = True
+        return self._value
+
 
 class Config:
     """
     Configuration class for application settings loaded from environment variables.
 
+    Values are read (and `.env` is loaded) on first access, not at import time.
+
     Attributes:
         SECRET_KEY (str): Secret key used for cryptographic operations.
         SQLALCHEMY_DATABASE_URL (str): Database connection URL for SQLAlchemy.
+        SQLALCHEMY_REPLICA_URLS (List[str]): Read replica URLs (comma separated); reads are spread
+            over them round-robin.
+        REPLICA_STICKY_SECONDS (int): After a client writes, how long its reads stay on the primary.
+        SQLALCHEMY_ASYNC (bool): Serve the async routers from an AsyncEngine (asyncpg/aiosqlite).
+        SQLALCHEMY_ECHO (Union[bool, str]): SQL logging: off, on (True) or "debug" to include result rows.
+        SQLALCHEMY_POOL_SIZE (int): Connections kept open in the pool of each engine.
+        SQLALCHEMY_MAX_OVERFLOW (int): Extra connections opened above the pool size under load.
+        SQLALCHEMY_POOL_TIMEOUT (float): Seconds to wait for a free connection before failing.
+        SQLALCHEMY_POOL_RECYCLE (int): Seconds after which a connection is replaced; -1 disables recycling.
+        SQLALCHEMY_POOL_PRE_PING (bool): Test connections on checkout and replace dead ones.
+        SQLALCHEMY_STATEMENT_TIMEOUT_MS (int): Server-side per-statement timeout on PostgreSQL; 0 disables it.
+        SQLALCHEMY_CONNECT_ARGS (dict): Extra DBAPI connect() arguments, given as a JSON object.
+        SQLITE_PRODUCTION_MODE (bool): On file SQLite databases, enable WAL and the tuned pragmas and
+            send all writes through a single serialized writer connection.
+        SQLITE_BUSY_TIMEOUT_MS (int): How long SQLite waits for a lock held by another connection.
+        SQLITE_MMAP_SIZE (int): Bytes of the database file SQLite may memory-map for reads.
         ALGORITHM (str): Algorithm used for token encoding (e.g., 'HS256').
         ACCESS_TOKEN_EXPIRE_MINUTES (int): Expiration time for access tokens in minutes.
+        AUTH_TRUST_TOKEN_CLAIMS (bool): Let read-only routes trust verified JWT claims without a user lookup.
+        PASSWORD_HASH_WORKERS (int): Threads dedicated to bcrypt hashing and verification.
+        PASSWORD_HASH_MAX_PENDING (int): Password jobs allowed to queue or run before new ones are rejected.
+        PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS (float): Longest a password job may wait for a worker.
+        SKIP_SCHEMA_CHECK (bool): Do not create missing tables on startup; for databases whose
+            schema is managed by migrations.
+        SQL_INSTRUMENTATION_SAMPLE_RATE (float): Share of requests (0..1) whose SQL statements are
+            counted and timed.
     """
-    SECRET_KEY = os.getenv('SECRET_KEY')
-    SQLALCHEMY_DATABASE_URL = os.getenv('SQLALCHEMY_DATABASE_URL')
-    ALGORITHM = os.getenv('ALGORITHM')
-    ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv('ACCESS_TOKEN_EXPIRE_MINUTES'))
+    SECRET_KEY = EnvVar()
+    SQLALCHEMY_DATABASE_URL = EnvVar(required=True)
+    SQLALCHEMY_REPLICA_URLS = EnvVar(default='', cast=as_list)
+    REPLICA_STICKY_SECONDS = EnvVar(default=5, cast=int)
+    SQLALCHEMY_ASYNC = EnvVar(default=False, cast=as_bool)
+    SQLALCHEMY_ECHO = EnvVar(default=False, cast=as_echo)
+    SQLALCHEMY_POOL_SIZE = EnvVar(default=5, cast=int)
+    SQLALCHEMY_MAX_OVERFLOW = EnvVar(default=10, cast=int)
+    SQLALCHEMY_POOL_TIMEOUT = EnvVar(default=30, cast=float)
+    SQLALCHEMY_POOL_RECYCLE = EnvVar(default=1800, cast=int)
+    SQLALCHEMY_POOL_PRE_PING = EnvVar(default=True, cast=as_bool)
+    SQLALCHEMY_STATEMENT_TIMEOUT_MS = EnvVar(default=0, cast=int)
+    SQLALCHEMY_CONNECT_ARGS = EnvVar(default='{}', cast=json.loads)
+    SQLITE_PRODUCTION_MODE = EnvVar(default=False, cast=as_bool)
+    SQLITE_BUSY_TIMEOUT_MS = EnvVar(default=5000, cast=int)
+    SQLITE_MMAP_SIZE = EnvVar(default=256 * 1024 * 1024, cast=int)
+    ALGORITHM = EnvVar()
+    ACCESS_TOKEN_EXPIRE_MINUTES = EnvVar(cast=int, required=True)
+    AUTH_TRUST_TOKEN_CLAIMS = EnvVar(default=False, cast=as_bool)
+    PASSWORD_HASH_WORKERS = EnvVar(default=min(4, os.cpu_count() or 1), cast=int)
+    PASSWORD_HASH_MAX_PENDING = EnvVar(default=64, cast=int)
+    PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS = EnvVar(default=5, cast=float)
+    SKIP_SCHEMA_CHECK = EnvVar(default=False, cast=as_bool)
+    SQL_INSTRUMENTATION_SAMPLE_RATE = EnvVar(default=1.0, cast=float)
 
     class Config:
         """
@@ -33,5 +176,38 @@ class Settings:
 
     Attributes:
         REFRESH_TOKEN_EXPIRE_DAYS (int): Expiration time for refresh tokens in days.
+        REFRESH_TOKEN_PURGE_INTERVAL_SECONDS (int): Pause between background purges of expired refresh tokens.
+        REFRESH_TOKEN_PURGE_BATCH_SIZE (int): Expired refresh tokens deleted per purge transaction.
+        MAX_ACTIVE_LOANS (int): Maximum number of books a reader may hold at the same time.
+        PRINCIPAL_CACHE_MAX_ENTRIES (int): Maximum number of authenticated users cached in process.
+        PRINCIPAL_CACHE_TTL_SECONDS (int): How long an authenticated user is served from the cache; also how long
+            other worker processes may keep accepting access tokens of a revoked session.
+        CART_MAX_OPERATIONS (int): Maximum number of operations in one batch checkout/return request.
+        PAGE_DEFAULT_LIMIT (int): Page size used when a list request does not specify one.
+        PAGE_MAX_LIMIT (int): Largest page size a client may request.
+        BOOK_IMPORT_BATCH_SIZE (int): Default number of rows inserted per statement during bulk import.
+        BOOK_EXPORT_BATCH_SIZE (int): Number of rows fetched from the server-side cursor per chunk during export.
+        BOOK_CACHE_MAX_ENTRIES (int): Maximum number of entries in the in-process book lookup cache.
+        BOOK_CACHE_MAX_BYTES (int): Approximate memory budget of the book lookup cache.
+        BOOK_CACHE_TTL_SECONDS (int): How long a cached book may be served before it is reloaded.
+        SQL_N_PLUS_ONE_THRESHOLD (int): Executions of the same statement in one request that flag a likely N+1.
+        SYNC_PAGE_DEFAULT_LIMIT (int): Changes per entity in a sync page when the request does not specify it.
+        SYNC_PAGE_MAX_LIMIT (int): Largest number of changes per entity a sync page may hold.
     """
     REFRESH_TOKEN_EXPIRE_DAYS: int = 30
+    REFRESH_TOKEN_PURGE_INTERVAL_SECONDS: int = 3600
+    REFRESH_TOKEN_PURGE_BATCH_SIZE: int = 1000
+    MAX_ACTIVE_LOANS: int = 3
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 30
+    CART_MAX_OPERATIONS: int = 50
+    PAGE_DEFAULT_LIMIT: int = 50
+    PAGE_MAX_LIMIT: int = 500
+    BOOK_IMPORT_BATCH_SIZE: int = 1000
+    BOOK_EXPORT_BATCH_SIZE: int = 1000
+    BOOK_CACHE_MAX_ENTRIES: int = 10000
+    BOOK_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    BOOK_CACHE_TTL_SECONDS: int = 60
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5
+    SYNC_PAGE_DEFAULT_LIMIT: int = 500
+    SYNC_PAGE_MAX_LIMIT: int = 5000
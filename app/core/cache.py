@@ -0,0 +1,195 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe in-process LRU cache with a per-entry time to live.
+
+    Memory is bounded twice: by the number of entries and by an approximate byte
+    budget computed from the size each entry is stored with. When either limit is
+    exceeded the least recently used entries are evicted.
+
+    Loads through `get_or_load` are protected against a write racing the load: if
+    any key is invalidated while a value is being loaded, that value is returned
+    to the caller but not cached, so a stale row can never outlive the
+    invalidation that should have removed it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float, max_bytes: Optional[int] = None):
+        """
+        Initialize an empty cache.
+
+        Args:
+            max_entries (int): Maximum number of entries kept.
+            ttl_seconds (float): Lifetime of an entry after it is stored.
+            max_bytes (Optional[int]): Approximate memory budget; unlimited if None.
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self._invalidations = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Return a cached value, or None if it is missing or expired.
+
+        Args:
+            key (Hashable): Cache key.
+
+        Returns:
+            Optional[Any]: Cached value, or None.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value, size = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int = 0, generation: Optional[int] = None) -> None:
+        """
+        Store a value, evicting least recently used entries if a limit is exceeded.
+
+        Args:
+            key (Hashable): Cache key.
+            value (Any): Value to store; treated as immutable by the cache.
+            size (int): Approximate size of the value in bytes.
+            generation (Optional[int]): Value of `generation()` taken before the value
+                was loaded; if anything was invalidated since, the value is not stored.
+        """
+        with self._lock:
+            if generation is not None and generation != self._invalidations:
+                return
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value, size)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Optional[Any]],
+        sizeof: Callable[[Any], int] = lambda value: 0
+    ) -> Optional[Any]:
+        """
+        Return a cached value, loading and caching it on a miss.
+
+        Args:
+            key (Hashable): Cache key.
+            loader (Callable[[], Optional[Any]]): Loads the value; None results are not cached.
+            sizeof (Callable[[Any], int]): Estimates the size of a loaded value in bytes.
+
+        Returns:
+            Optional[Any]: Cached or freshly loaded value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.generation()
+        value = loader()
+        if value is not None:
+            self.set(key, value, size=sizeof(value), generation=generation)
+        return value
+
+    async def get_or_load_async(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Optional[Any]]],
+        sizeof: Callable[[Any], int] = lambda value: 0
+    ) -> Optional[Any]:
+        """
+        Async counterpart of `get_or_load` for loaders that are coroutines.
+
+        Args:
+            key (Hashable): Cache key.
+            loader (Callable[[], Awaitable[Optional[Any]]]): Loads the value; None results are not cached.
+            sizeof (Callable[[Any], int]): Estimates the size of a loaded value in bytes.
+
+        Returns:
+            Optional[Any]: Cached or freshly loaded value.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.generation()
+        value = await loader()
+        if value is not None:
+            self.set(key, value, size=sizeof(value), generation=generation)
+        return value
+
+    def generation(self) -> int:
+        """
+        Return the invalidation counter, to be passed back to `set` after a load.
+
+        Returns:
+            int: Number of invalidations performed so far.
+        """
+        with self._lock:
+            return self._invalidations
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """
+        Remove entries so the next lookup goes to the source.
+
+        Args:
+            *keys (Hashable): Keys to remove; missing keys are ignored.
+        """
+        with self._lock:
+            self._invalidations += 1
+            for key in keys:
+                if key in self._entries:
+                    self._remove(key)
+
+    def clear(self) -> None:
+        """Remove every entry; counters are kept."""
+        with self._lock:
+            self._invalidations += 1
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return the cache counters.
+
+        Returns:
+            Dict[str, int]: Hits, misses, evictions, current entries and approximate bytes.
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        """Drop an entry and release its size from the budget; caller holds the lock."""
+        _, _, size = self._entries.pop(key)
+        self._bytes -= size
@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, Sequence, TextIO, Tuple, Union
+
+CATALOG_FORMATS = ("csv", "ndjson")
+
+# Columns written by the catalog export, in output order; the import accepts the same set.
+EXPORT_COLUMNS = ("id", "title", "author", "publication_year", "isbn", "copies_available", "description")
+
+MEDIA_TYPES = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+
+
+def detect_format(filename: str) -> str:
+    """
+    Guess the catalog file format from a file name.
+
+    Args:
+        filename (str): Name of the uploaded or local file.
+
+    Returns:
+        str: Either "csv" or "ndjson".
+
+    Raises:
+        ValueError: If the extension is not recognised.
+    """
+    name = (filename or "").lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".ndjson", ".jsonl")):
+        return "ndjson"
+    raise ValueError("Cannot detect file format, pass format=csv or format=ndjson")
+
+
+def iter_book_records(stream: TextIO, fmt: str) -> Iterator[Tuple[int, Union[Dict[str, Any], str]]]:
+    """
+    Lazily read book records from a CSV or NDJSON text stream.
+
+    CSV rows are yielded as dictionaries with empty cells dropped, so missing
+    values fall back to schema defaults. NDJSON lines are yielded as raw strings
+    and parsed later by pydantic, which also reports malformed JSON per row.
+
+    Args:
+        stream (TextIO): Text stream positioned at the start of the file.
+        fmt (str): Either "csv" or "ndjson".
+
+    Yields:
+        Tuple[int, Union[Dict[str, Any], str]]: 1-based record number and the record.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt == "csv":
+        for row, record in enumerate(csv.DictReader(stream), start=1):
+            yield row, {key: value for key, value in record.items() if key and value not in ("", None)}
+    elif fmt == "ndjson":
+        row = 0
+        for line in stream:
+            if not line.strip():
+                continue
+            row += 1
+            yield row, line
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
+
+
+def iter_export_chunks(batches: Iterable[Sequence[Sequence[Any]]], fmt: str) -> Iterator[str]:
+    """
+    Serialize batches of catalog rows into CSV or NDJSON text chunks.
+
+    Each batch becomes one chunk, so a streaming response flushes once per batch
+    instead of once per row. The CSV header is emitted before the first batch is
+    fetched.
+
+    Args:
+        batches (Iterable[Sequence[Sequence[Any]]]): Batches of rows whose values follow EXPORT_COLUMNS.
+        fmt (str): Either "csv" or "ndjson".
+
+    Yields:
+        str: Serialized text chunk.
+
+    Raises:
+        ValueError: If the format is not supported.
+    """
+    if fmt == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        yield buffer.getvalue()
+        for batch in batches:
+            buffer.seek(0)
+            buffer.truncate()
+            writer.writerows(batch)
+            yield buffer.getvalue()
+    elif fmt == "ndjson":
+        for batch in batches:
+            yield "".join(
+                json.dumps(dict(zip(EXPORT_COLUMNS, row)), ensure_ascii=False, separators=(",", ":")) + "\n"
+                for row in batch
+            )
+    else:
+        raise ValueError(f"Unsupported format: {fmt}")
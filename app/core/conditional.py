@@ -0,0 +1,128 @@
+import hashlib
+import re
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+# Clients may keep a copy but must revalidate it (cheaply, with If-None-Match) before reuse.
+CACHE_CONTROL = "private, no-cache"
+
+VERSION_ETAG = re.compile(r'^"v(\d+)"$')
+
+
+class VersionConflict(Exception):
+    """Raised when a conditional write finds the row at another version than it expected."""
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Build a strong entity tag from the values that determine a response body.
+
+    Args:
+        *parts (Any): Version numbers and request parameters the body depends on.
+
+    Returns:
+        str: Quoted ETag header value.
+    """
+    digest = hashlib.blake2b(repr(parts).encode("utf-8"), digest_size=12).hexdigest()
+    return f'"{digest}"'
+
+
+def version_etag(version: int) -> str:
+    """
+    Build the strong entity tag of a single versioned row.
+
+    Unlike `make_etag`, the tag can be turned back into the version, which is
+    what lets If-Match become a `WHERE version = ?` guard.
+
+    Args:
+        version (int): Change version of the row.
+
+    Returns:
+        str: Quoted ETag header value.
+    """
+    return f'"v{version}"'
+
+
+def resolve_expected_version(if_match: Optional[str], version: Optional[int] = None) -> Optional[int]:
+    """
+    Resolve the version a conditional write expects the row to be at.
+
+    Args:
+        if_match (Optional[str]): If-Match header carrying a tag from `version_etag`;
+            "*" only requires the row to exist, which the caller checks with `if_match_any`.
+        version (Optional[int]): Version passed explicitly, used without If-Match.
+
+    Returns:
+        Optional[int]: Expected version, or None for an unconditional write.
+
+    Raises:
+        VersionConflict: If the header cannot match any version of the row (a weak,
+            foreign or malformed tag, or several tags).
+    """
+    if if_match is None:
+        return version
+    if if_match.strip() == "*":
+        return None
+    match = VERSION_ETAG.match(if_match.strip())
+    if match is None:
+        raise VersionConflict("If-Match must be a single ETag returned for this resource")
+    return int(match.group(1))
+
+
+def if_match_any(if_match: Optional[str]) -> bool:
+    """
+    Tell whether If-Match is "*", which any current representation satisfies.
+
+    A write under `If-Match: *` to a row that does not exist must fail with 412
+    (RFC 9110, section 13.1.1) rather than report a missing resource.
+
+    Args:
+        if_match (Optional[str]): If-Match header.
+
+    Returns:
+        bool: True if the header is "*".
+    """
+    return if_match is not None and if_match.strip() == "*"
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Check a request's If-None-Match header against the current ETag.
+
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so a tag
+    that went through a proxy as W/"..." still matches.
+
+    Args:
+        request (Request): Incoming request.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        bool: True if the client's copy is current.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in header.split(","))
+
+
+def conditional_response(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Tag the response and short-circuit it when the client's copy is current.
+
+    Args:
+        request (Request): Incoming request.
+        response (Response): Response the route's result will be rendered into.
+        etag (str): Current ETag of the resource.
+
+    Returns:
+        Optional[Response]: A bodiless 304 response to return instead of the
+        resource, or None if the full response has to be produced.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
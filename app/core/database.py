@@ -1,17 +1,80 @@
-from sqlalchemy import create_engine
+from functools import lru_cache
+from typing import Any, AsyncIterator, List, Tuple, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import sessionmaker, Session
 
 from app.models.user import *
 from app.config import Config
+from app.core.engine import create_engines
+from app.core.routing import RoutingSession
+
+@lru_cache(maxsize=None)
+def get_engines() -> Tuple[Engine, List[Engine]]:
+    """
+    Return the process-wide engines, creating them on first use.
+
+    Nothing connects to the database at import time; the first session (or an
+    explicit call, e.g. from the application lifespan) creates the engines.
+
+    Returns:
+        Tuple[Engine, List[Engine]]: Engine taking all writes (and the only engine
+        unless reads are split off) and the engines serving reads outside write
+        transactions: replicas, the SQLite read pool, or the write engine itself.
+    """
+    return create_engines(Config.SQLALCHEMY_DATABASE_URL, Config.SQLALCHEMY_REPLICA_URLS)
+
+
+def get_engine() -> Engine:
+    """
+    Return the write engine, creating the engines on first use.
+
+    Returns:
+        Engine: Engine taking all writes.
+    """
+    return get_engines()[0]
+
+
+@lru_cache(maxsize=None)
+def get_sessionmaker() -> sessionmaker:
+    """
+    Return the routing session factory bound to the engines.
+
+    Returns:
+        sessionmaker: Factory of RoutingSession instances.
+    """
+    engine, read_engines = get_engines()
+    return sessionmaker(
+        class_=RoutingSession,
+        writer=engine,
+        readers=read_engines,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False  # Prevents objects from expiring after commit, useful in web apps
+    )
+
+
+class LazySessionFactory:
+    """
+    Drop-in for the sessionmaker that only creates the engines when the first session is opened.
+    """
+
+    def __call__(self, **kwargs: Any) -> Session:
+        """
+        Open a new session.
+
+        Args:
+            **kwargs (Any): Options passed to the sessionmaker.
+
+        Returns:
+            Session: New RoutingSession.
+        """
+        return get_sessionmaker()(**kwargs)
 
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URL, echo=True)
 
-SessionLocal = sessionmaker(
-    bind=engine,
-    autocommit=False,
-    autoflush=False,
-    expire_on_commit=False  # Prevents objects from expiring after commit, useful in web apps
-)
+SessionLocal = LazySessionFactory()
 
 
 def get_db() -> Session:
@@ -33,6 +96,106 @@ def get_db() -> Session:
         db.close()
 
 
+RequestSession = Union[Session, AsyncSession]
+
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """
+    Rewrite a database URL to use the async driver of its dialect.
+
+    Args:
+        url (str): Sync database URL, e.g. `postgresql://...` or `sqlite:///library.db`.
+
+    Raises:
+        ValueError: If the dialect has no supported async driver.
+
+    Returns:
+        str: URL with the async driver, e.g. `postgresql+asyncpg://...`.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No async driver configured for '{backend}' databases")
+    return parsed.set(drivername=f"{backend}+{ASYNC_DRIVERS[backend]}").render_as_string(hide_password=False)
+
+
+@lru_cache(maxsize=None)
+def get_async_engines() -> Tuple[AsyncEngine, List[AsyncEngine]]:
+    """
+    Return the process-wide AsyncEngines, creating them on first use.
+
+    They mirror `get_engines` with the async drivers: in SQLite production mode
+    writes go through a single-connection `BEGIN IMMEDIATE` writer and reads
+    through a separate pool, and configured replicas serve reads.
+
+    Returns:
+        Tuple[AsyncEngine, List[AsyncEngine]]: Engine taking all writes and the engines serving reads.
+    """
+    return create_engines(
+        to_async_url(Config.SQLALCHEMY_DATABASE_URL),
+        [to_async_url(url) for url in Config.SQLALCHEMY_REPLICA_URLS],
+        is_async=True
+    )
+
+
+def get_async_engine() -> AsyncEngine:
+    """
+    Return the async write engine, creating the async engines on first use.
+
+    Returns:
+        AsyncEngine: Engine using the async driver of the configured database.
+    """
+    return get_async_engines()[0]
+
+
+@lru_cache(maxsize=None)
+def get_async_sessionmaker() -> async_sessionmaker:
+    """
+    Return the AsyncSession factory bound to the async engines.
+
+    The sessions wrap a `RoutingSession`, so they route writes, reads and
+    read-your-writes pins exactly like `SessionLocal`.
+
+    Returns:
+        async_sessionmaker: Factory configured like `SessionLocal`.
+    """
+    engine, read_engines = get_async_engines()
+    return async_sessionmaker(
+        sync_session_class=RoutingSession,
+        writer=engine.sync_engine,
+        readers=[read_engine.sync_engine for read_engine in read_engines],
+        autoflush=False,
+        expire_on_commit=False
+    )
+
+
+async def get_request_db() -> AsyncIterator[RequestSession]:
+    """
+    Yield the session used by async routes, selected by `SQLALCHEMY_ASYNC`.
+
+    With the async stack enabled this is an AsyncSession whose queries never
+    block the event loop. Otherwise it is a regular Session; async routes then
+    run their CRUD calls on the thread pool (see `app.crud.async_crud`).
+
+    Yields:
+        RequestSession: Session for the current request.
+    """
+    if Config.SQLALCHEMY_ASYNC:
+        async with get_async_sessionmaker()() as db:
+            yield db
+    else:
+        db = SessionLocal()
+        try:
+            yield db
+        finally:
+            await run_in_threadpool(db.close)
+
+
 def create_tables() -> None:
     """
     Create all tables in the database using the metadata from SQLAlchemy models.
@@ -40,10 +203,7 @@ def create_tables() -> None:
     This function will create tables that do not yet exist in the database
     according to the schema defined by SQLAlchemy models' Base metadata.
 
-    It uses the engine bound to your database URL.
+    It uses the engine bound to your database URL. It runs on application startup
+    unless `SKIP_SCHEMA_CHECK` is set.
     """
-    Base.metadata.create_all(bind=engine)
-
-
-# Initialize tables on application startup
-create_tables()
+    Base.metadata.create_all(bind=get_engine())
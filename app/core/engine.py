@@ -0,0 +1,293 @@
+"""
+Engine construction from `Config` and connection pool instrumentation.
+"""
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, Pool, QueuePool
+
+from ..config import Config
+
+
+class PoolWaitStats:
+    """
+    Thread-safe accumulator of the time spent waiting for pooled connections.
+    """
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def record(self, seconds: float) -> None:
+        """
+        Record one checkout.
+
+        Args:
+            seconds (float): Time the checkout waited for a connection.
+        """
+        with self._lock:
+            self.checkouts += 1
+            self.wait_seconds_total += seconds
+            self.wait_seconds_max = max(self.wait_seconds_max, seconds)
+
+    def snapshot(self) -> Dict[str, float]:
+        """
+        Return the counters.
+
+        Returns:
+            Dict[str, float]: Checkouts and total/max wait in seconds.
+        """
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "wait_seconds_total": self.wait_seconds_total,
+                "wait_seconds_max": self.wait_seconds_max,
+            }
+
+
+class WaitTimingPoolMixin:
+    """
+    Pool mixin timing every checkout, including connection creation and waits for a free slot.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.wait_stats = PoolWaitStats()
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            self.wait_stats.record(time.perf_counter() - started)
+
+
+class InstrumentedQueuePool(WaitTimingPoolMixin, QueuePool):
+    """QueuePool recording checkout wait times."""
+
+
+class InstrumentedAsyncQueuePool(WaitTimingPoolMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool recording checkout wait times."""
+
+
+def is_memory_database(url: str) -> bool:
+    """
+    Tell whether a URL points to an in-memory SQLite database.
+
+    Args:
+        url (str): Database URL.
+
+    Returns:
+        bool: True for `sqlite://`, `sqlite:///:memory:` and `mode=memory` URLs.
+    """
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and (
+        parsed.database in (None, "", ":memory:") or parsed.query.get("mode") == "memory"
+    )
+
+
+def engine_options(url: str, is_async: bool = False) -> Dict[str, Any]:
+    """
+    Build `create_engine` keyword arguments for a URL from the configuration.
+
+    Pool sizing only applies to pooled (non in-memory) databases, and the
+    statement timeout is passed to PostgreSQL through the driver's connect
+    arguments: `options` for psycopg2, `server_settings` for asyncpg.
+
+    Args:
+        url (str): Database URL the engine is created for.
+        is_async (bool): Whether the options are for an AsyncEngine.
+
+    Returns:
+        Dict[str, Any]: Keyword arguments for `create_engine`/`create_async_engine`.
+    """
+    connect_args = dict(Config.SQLALCHEMY_CONNECT_ARGS)
+    options: Dict[str, Any] = {"echo": Config.SQLALCHEMY_ECHO, "pool_pre_ping": Config.SQLALCHEMY_POOL_PRE_PING}
+
+    if not is_memory_database(url):
+        options.update(
+            poolclass=InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+            pool_size=Config.SQLALCHEMY_POOL_SIZE,
+            max_overflow=Config.SQLALCHEMY_MAX_OVERFLOW,
+            pool_timeout=Config.SQLALCHEMY_POOL_TIMEOUT,
+            pool_recycle=Config.SQLALCHEMY_POOL_RECYCLE,
+        )
+
+    timeout = Config.SQLALCHEMY_STATEMENT_TIMEOUT_MS
+    if timeout and make_url(url).get_backend_name() == "postgresql":
+        if is_async:
+            connect_args.setdefault("server_settings", {})["statement_timeout"] = str(timeout)
+        else:
+            connect_args["options"] = f"{connect_args.get('options', '')} -c statement_timeout={timeout}".strip()
+
+    if connect_args:
+        options["connect_args"] = connect_args
+    return options
+
+
+def build_engine(url: str, is_async: bool = False, **overrides: Any) -> Union[Engine, AsyncEngine]:
+    """
+    Create an engine with the configured options.
+
+    Args:
+        url (str): Database URL; it must name an async driver when `is_async` is set.
+        is_async (bool): Whether to create an AsyncEngine.
+        **overrides (Any): Options replacing those from `engine_options`.
+
+    Returns:
+        Union[Engine, AsyncEngine]: The new engine.
+    """
+    options = engine_options(url, is_async=is_async)
+    options.update(overrides)
+    return create_async_engine(url, **options) if is_async else create_engine(url, **options)
+
+
+def sync_engine_of(engine: Union[Engine, AsyncEngine]) -> Engine:
+    """
+    Return the Engine that sessions bind to and event listeners attach to.
+
+    Args:
+        engine (Union[Engine, AsyncEngine]): Sync or async engine.
+
+    Returns:
+        Engine: The engine itself, or the `sync_engine` of an AsyncEngine.
+    """
+    return engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+
+def use_sqlite_production_mode(url: str) -> bool:
+    """
+    Tell whether SQLite production mode applies to a URL.
+
+    Args:
+        url (str): Database URL.
+
+    Returns:
+        bool: True if the mode is enabled and the URL is a file SQLite database.
+    """
+    return (
+        Config.SQLITE_PRODUCTION_MODE
+        and make_url(url).get_backend_name() == "sqlite"
+        and not is_memory_database(url)
+    )
+
+
+def apply_sqlite_pragmas(engine: Engine) -> None:
+    """
+    Configure every new connection of a SQLite engine for concurrent use.
+
+    WAL lets readers proceed while a write is in progress, `synchronous=NORMAL`
+    is durable across application crashes in WAL mode while avoiding an fsync
+    per commit, `busy_timeout` makes lock waits block instead of failing at once,
+    and `mmap_size` serves reads from the page cache without extra copies.
+
+    Args:
+        engine (Engine): Sync engine, or the `sync_engine` of an AsyncEngine.
+    """
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute(f"PRAGMA busy_timeout={Config.SQLITE_BUSY_TIMEOUT_MS}")
+        cursor.execute(f"PRAGMA mmap_size={Config.SQLITE_MMAP_SIZE}")
+        cursor.close()
+
+
+def create_sqlite_writer_engine(url: str, is_async: bool = False) -> Union[Engine, AsyncEngine]:
+    """
+    Create the engine that serializes all writes to a SQLite database.
+
+    Its pool holds exactly one connection, so concurrent writers queue in the
+    pool (in process, without polling) instead of racing for SQLite's file lock
+    and failing with "database is locked". Transactions start with
+    `BEGIN IMMEDIATE` so the write lock is taken up front, which also keeps other
+    processes writing to the same file from deadlocking on a lock upgrade.
+
+    Args:
+        url (str): File SQLite database URL.
+        is_async (bool): Whether to create an AsyncEngine (aiosqlite URL); its
+            coroutines then wait for the connection without blocking the event loop.
+
+    Returns:
+        Union[Engine, AsyncEngine]: Single-connection writer engine.
+    """
+    writer = build_engine(url, is_async=is_async, pool_size=1, max_overflow=0)
+    apply_sqlite_pragmas(sync_engine_of(writer))
+
+    @event.listens_for(sync_engine_of(writer), "connect")
+    def disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(sync_engine_of(writer), "begin")
+    def begin_immediate(connection):
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return writer
+
+
+def create_engines(url: str, replica_urls: Sequence[str] = (), is_async: bool = False) -> Tuple[Any, List[Any]]:
+    """
+    Create the write engine and the read engines for a database.
+
+    Reads go to the replicas when any are configured, to a separate read pool
+    in SQLite production mode, and to the write engine otherwise. The sync and
+    the async stack are built the same way, so both route through
+    `RoutingSession` and serialize SQLite writes on one connection.
+
+    Args:
+        url (str): Primary database URL.
+        replica_urls (Sequence[str]): Read replica URLs.
+        is_async (bool): Whether to create AsyncEngines; the URLs must then name async drivers.
+
+    Returns:
+        Tuple[Any, List[Any]]: Engine for writes and engines for reads, all
+        Engines or all AsyncEngines.
+    """
+    sqlite_production_mode = use_sqlite_production_mode(url)
+    if sqlite_production_mode:
+        engine = create_sqlite_writer_engine(url, is_async=is_async)
+    else:
+        engine = build_engine(url, is_async=is_async)
+
+    if replica_urls:
+        return engine, [build_engine(replica, is_async=is_async) for replica in replica_urls]
+    if not sqlite_production_mode:
+        return engine, [engine]
+
+    read_engine = build_engine(url, is_async=is_async)
+    apply_sqlite_pragmas(sync_engine_of(read_engine))
+    return engine, [read_engine]
+
+
+def pool_stats(engine: Engine) -> Dict[str, Any]:
+    """
+    Return live statistics of an engine's connection pool.
+
+    Args:
+        engine (Engine): Sync engine, or the `sync_engine` of an AsyncEngine.
+
+    Returns:
+        Dict[str, Any]: Pool class, size, checked in/out and overflow connections,
+        plus checkout wait times for instrumented pools.
+    """
+    pool: Pool = engine.pool
+    stats: Dict[str, Any] = {"pool": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        stats.update(
+            size=pool.size(),
+            checked_in=pool.checkedin(),
+            checked_out=pool.checkedout(),
+            overflow=max(pool.overflow(), 0),
+            timeout=pool.timeout(),
+        )
+    if isinstance(pool, WaitTimingPoolMixin):
+        stats.update(pool.wait_stats.snapshot())
+    return stats
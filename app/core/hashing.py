@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Dict
+
+from fastapi import HTTPException, status
+
+from ..config import Config
+
+
+class PasswordHasher:
+    """
+    Bounded worker pool for CPU-heavy password hashing.
+
+    bcrypt takes hundreds of milliseconds per call and releases the GIL while it
+    runs, so jobs are executed on dedicated threads and awaited from the event
+    loop instead of blocking it. Admission is bounded: once `max_pending` jobs are
+    queued or running new ones are rejected with 503, and a job that is still
+    queued `queue_timeout` seconds after submission is cancelled and its caller
+    gets a 503 at that deadline; the cancelled job never occupies a worker.
+    """
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float):
+        """
+        Initialize the pool.
+
+        Args:
+            workers (int): Number of worker threads.
+            max_pending (int): Maximum number of queued plus running jobs.
+            queue_timeout (float): Maximum time in seconds a job may wait for a worker.
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._in_flight = 0
+        self.completed = 0
+        self.rejected = 0
+        self.timed_out = 0
+        self.wait_seconds_total = 0.0
+        self.hash_seconds_total = 0.0
+        self.hash_seconds_max = 0.0
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        """
+        Run a password function on the pool and await its result.
+
+        Args:
+            func (Callable[..., Any]): Function to run, e.g. `pwd_context.verify`.
+            *args (Any): Positional arguments for the function.
+
+        Raises:
+            HTTPException: 503 if the pool is saturated or the job was still queued
+                after `queue_timeout` seconds.
+
+        Returns:
+            Any: Result of the function.
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise self._busy()
+            self._pending += 1
+
+        future = self._executor.submit(self._call, time.perf_counter(), func, *args)
+        future.add_done_callback(self._release)
+        result = asyncio.wrap_future(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(result), self.queue_timeout)
+        except asyncio.TimeoutError:
+            if not future.cancel():
+                # A worker picked the job up just now; it is no longer queued, so let it finish.
+                return await result
+            with self._lock:
+                self.timed_out += 1
+            raise self._busy()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+    def stats(self) -> Dict[str, float]:
+        """
+        Return the pool counters.
+
+        Returns:
+            Dict[str, float]: Queue depth, jobs in flight, completed/rejected/timed out
+            counts and accumulated wait and hash times in seconds.
+        """
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "queue_depth": self._pending - self._in_flight,
+                "in_flight": self._in_flight,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "timed_out": self.timed_out,
+                "wait_seconds_total": self.wait_seconds_total,
+                "hash_seconds_total": self.hash_seconds_total,
+                "hash_seconds_max": self.hash_seconds_max,
+            }
+
+    def _call(self, enqueued_at: float, func: Callable[..., Any], *args: Any) -> Any:
+        """Run one job on a worker thread."""
+        started_at = time.perf_counter()
+        with self._lock:
+            self.wait_seconds_total += started_at - enqueued_at
+            self._in_flight += 1
+        try:
+            return func(*args)
+        finally:
+            elapsed = time.perf_counter() - started_at
+            with self._lock:
+                self._in_flight -= 1
+                self.completed += 1
+                self.hash_seconds_total += elapsed
+                self.hash_seconds_max = max(self.hash_seconds_max, elapsed)
+
+    def _release(self, future: Future) -> None:
+        """Free the admission slot once a job finished, failed or was cancelled."""
+        with self._lock:
+            self._pending -= 1
+
+    @staticmethod
+    def _busy() -> HTTPException:
+        """Build the error returned while the pool is saturated."""
+        return HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Authentication service is busy, please retry",
+            headers={"Retry-After": "1"},
+        )
+
+
+@lru_cache(maxsize=None)
+def get_password_hasher() -> PasswordHasher:
+    """
+    Return the process-wide password hashing pool, creating it on first use.
+
+    Returns:
+        PasswordHasher: Pool sized from the configuration.
+    """
+    return PasswordHasher(
+        workers=Config.PASSWORD_HASH_WORKERS,
+        max_pending=Config.PASSWORD_HASH_MAX_PENDING,
+        queue_timeout=Config.PASSWORD_HASH_QUEUE_TIMEOUT_SECONDS
+    )
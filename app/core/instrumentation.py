@@ -0,0 +1,163 @@
+"""
+Per-request SQL statistics: statement count, database time and N+1 detection.
+
+Cursor events of every engine (sync and async) are recorded into the
+`RequestStats` of the request being served, which `SQLInstrumentationMiddleware`
+creates for a sampled share of requests. The middleware reports the figures in
+a `Server-Timing` header and as structured log fields.
+"""
+import logging
+import random
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import Config, Settings
+
+logger = logging.getLogger("app.sql")
+
+
+@dataclass
+class RequestStats:
+    """
+    SQL statistics of one request.
+
+    The object is mutated in place, so statements executed by routes running on
+    the thread pool are recorded into the same instance.
+
+    Attributes:
+        statements (int): Number of statements executed (an executemany counts once).
+        db_seconds (float): Time spent executing statements.
+        executions (Counter): Executions per distinct SQL string.
+    """
+    statements: int = 0
+    db_seconds: float = 0.0
+    executions: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, seconds: float) -> None:
+        """
+        Record one executed statement.
+
+        Args:
+            statement (str): SQL string as sent to the driver.
+            seconds (float): Execution time.
+        """
+        self.statements += 1
+        self.db_seconds += seconds
+        self.executions[statement] += 1
+
+    def repeated_statements(self, threshold: int = Settings.SQL_N_PLUS_ONE_THRESHOLD) -> List[Dict[str, Any]]:
+        """
+        Return statements executed at least `threshold` times, a likely N+1 pattern.
+
+        Args:
+            threshold (int): Minimum number of identical executions.
+
+        Returns:
+            List[Dict[str, Any]]: Statement text and execution count, most repeated first.
+        """
+        return [
+            {"statement": statement, "count": count}
+            for statement, count in self.executions.most_common()
+            if count >= threshold
+        ]
+
+
+request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def start_statement_timer(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Remember when a statement started if the current request is instrumented."""
+    if request_stats.get() is not None:
+        context._instrumentation_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def record_statement(conn, cursor, statement, parameters, context, executemany) -> None:
+    """Add a finished statement to the statistics of the current request."""
+    stats = request_stats.get()
+    started = getattr(context, "_instrumentation_started", None)
+    if stats is not None and started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+class SQLInstrumentationMiddleware:
+    """
+    Measure the SQL work of sampled requests.
+
+    Sampled responses carry `Server-Timing: db;dur=<ms>;desc="<n> queries", app;dur=<ms>`,
+    and every sampled request is logged to `app.sql` with the fields `method`,
+    `path`, `status`, `duration_ms`, `db_statements`, `db_ms` and `n_plus_one`.
+    Requests with repeated identical statements are logged as warnings.
+    """
+
+    def __init__(self, app: ASGIApp, sample_rate: Optional[float] = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): Wrapped application.
+            sample_rate (Optional[float]): Share of requests to instrument;
+                `SQL_INSTRUMENTATION_SAMPLE_RATE` if None.
+        """
+        self.app = app
+        self.sample_rate = Config.SQL_INSTRUMENTATION_SAMPLE_RATE if sample_rate is None else sample_rate
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or random.random() >= self.sample_rate:
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = request_stats.set(stats)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                MutableHeaders(scope=message).append(
+                    "server-timing",
+                    f'db;dur={stats.db_seconds * 1000:.2f};desc="{stats.statements} queries", '
+                    f"app;dur={(time.perf_counter() - started) * 1000:.2f}"
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            request_stats.reset(token)
+            self._log(scope, status, time.perf_counter() - started, stats)
+
+    @staticmethod
+    def _log(scope: Scope, status: int, duration: float, stats: RequestStats) -> None:
+        """Emit the structured log record of a finished request."""
+        repeated = stats.repeated_statements()
+        fields = {
+            "method": scope["method"],
+            "path": scope["path"],
+            "status": status,
+            "duration_ms": round(duration * 1000, 2),
+            "db_statements": stats.statements,
+            "db_ms": round(stats.db_seconds * 1000, 2),
+            "n_plus_one": repeated,
+        }
+        if repeated:
+            logger.warning(
+                "Likely N+1: %s %s repeated %d statement(s)", fields["method"], fields["path"], len(repeated),
+                extra=fields
+            )
+        else:
+            logger.info(
+                "%s %s %s: %d statement(s), %.2f ms in database", fields["method"], fields["path"], status,
+                stats.statements, fields["db_ms"], extra=fields
+            )
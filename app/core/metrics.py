@@ -0,0 +1,325 @@
+"""
+Minimal Prometheus metrics: counters and histograms, plus gauges computed at scrape time.
+
+Observations cost a lock, a dictionary lookup and (for histograms) a bisect, so
+metrics can stay on at thousands of requests per second. Everything is exposed
+in the Prometheus text format (version 0.0.4) by `REGISTRY.render()`.
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+Labels = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def escape_label(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    """Render a label set, e.g. `{method="GET",status="200"}`."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{escape_label(str(value))}"' for name, value in labels.items()) + "}"
+
+
+def render_family(name: str, kind: str, documentation: str, samples: Iterable[Sample]) -> List[str]:
+    """
+    Render one metric family.
+
+    Args:
+        name (str): Metric name.
+        kind (str): Prometheus type: counter, gauge or histogram.
+        documentation (str): Help text.
+        samples (Iterable[Sample]): Label sets and values.
+
+    Returns:
+        List[str]: Lines of the family, including HELP and TYPE.
+    """
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{format_labels(labels)} {value}" for labels, value in samples)
+    return lines
+
+
+class Counter:
+    """
+    Monotonic counter with a fixed set of label names.
+    """
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Initialize the counter.
+
+        Args:
+            name (str): Metric name, e.g. `http_requests_total`.
+            documentation (str): Help text.
+            labelnames (Sequence[str]): Label names; `inc` takes the values in this order.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Labels, float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labelvalues: str, amount: float = 1.0) -> None:
+        """
+        Increase the counter of a label set.
+
+        Args:
+            *labelvalues (str): Label values in `labelnames` order.
+            amount (float): Increment.
+        """
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0.0) + amount
+
+    def collect(self) -> List[str]:
+        """Render the counter."""
+        with self._lock:
+            values = list(self._values.items())
+        return render_family(
+            self.name, "counter", self.documentation,
+            ((dict(zip(self.labelnames, labels)), value) for labels, value in values)
+        )
+
+
+class Histogram:
+    """
+    Histogram with fixed buckets and a fixed set of label names.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        """
+        Initialize the histogram.
+
+        Args:
+            name (str): Metric name, e.g. `http_request_duration_seconds`.
+            documentation (str): Help text.
+            labelnames (Sequence[str]): Label names; `observe` takes the values in this order.
+            buckets (Sequence[float]): Sorted upper bounds; +Inf is added automatically.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self._series: Dict[Labels, List] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labelvalues: str) -> None:
+        """
+        Record one observation.
+
+        Args:
+            value (float): Observed value, e.g. a duration in seconds.
+            *labelvalues (str): Label values in `labelnames` order.
+        """
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labelvalues)
+            if series is None:
+                series = self._series[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def collect(self) -> List[str]:
+        """Render the histogram with cumulative buckets, sum and count."""
+        with self._lock:
+            series = [(labels, list(counts), total, count) for labels, (counts, total, count) in self._series.items()]
+
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total, count in series:
+            label_map = dict(zip(self.labelnames, labels))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{format_labels({**label_map, 'le': le})} {cumulative}")
+            lines.append(f"{self.name}_sum{format_labels(label_map)} {total}")
+            lines.append(f"{self.name}_count{format_labels(label_map)} {count}")
+        return lines
+
+
+class Registry:
+    """
+    Collection of metrics and scrape-time collectors rendered together.
+    """
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._collectors: List[Callable[[], List[str]]] = []
+
+    def register(self, collector: Callable[[], List[str]]) -> Callable[[], List[str]]:
+        """
+        Add a metric's `collect` method or a function returning rendered lines.
+
+        Args:
+            collector (Callable[[], List[str]]): Produces the lines of one or more families.
+
+        Returns:
+            Callable[[], List[str]]: The collector, so this can be used as a decorator.
+        """
+        self._collectors.append(collector)
+        return collector
+
+    def render(self) -> str:
+        """
+        Render every registered metric.
+
+        Returns:
+            str: Exposition in the Prometheus text format.
+        """
+        lines: List[str] = []
+        for collector in self._collectors:
+            lines.extend(collector())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+REQUESTS = Counter(
+    "http_requests_total", "HTTP requests by method, route template and status code.", ("method", "route", "status")
+)
+REQUEST_ERRORS = Counter("http_request_errors_total", "HTTP responses with a 4xx or 5xx status code.", ("status",))
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds", "HTTP request latency by method and route template.", ("method", "route")
+)
+for metric in (REQUESTS, REQUEST_ERRORS, REQUEST_DURATION):
+    REGISTRY.register(metric.collect)
+
+
+@REGISTRY.register
+def collect_pool_metrics() -> List[str]:
+    """Connection pool gauges of the engines created by this process."""
+    from .database import get_async_engines, get_engines
+    from .engine import pool_stats
+
+    pools = []
+    if get_engines.cache_info().currsize:
+        engine, read_engines = get_engines()
+        pools.append(("write", pool_stats(engine)))
+        if read_engines != [engine]:
+            pools.extend((f"read{index}", pool_stats(read_engine)) for index, read_engine in enumerate(read_engines))
+    if get_async_engines.cache_info().currsize:
+        async_engine, async_read_engines = get_async_engines()
+        pools.append(("async", pool_stats(async_engine.sync_engine)))
+        if async_read_engines != [async_engine]:
+            pools.extend(
+                (f"async_read{index}", pool_stats(read_engine.sync_engine))
+                for index, read_engine in enumerate(async_read_engines)
+            )
+
+    families = (
+        ("db_pool_size", "gauge", "Configured pool size.", "size"),
+        ("db_pool_checked_out", "gauge", "Connections currently in use.", "checked_out"),
+        ("db_pool_checked_in", "gauge", "Idle connections in the pool.", "checked_in"),
+        ("db_pool_overflow", "gauge", "Connections open above the pool size.", "overflow"),
+        ("db_pool_checkouts_total", "counter", "Connection checkouts.", "checkouts"),
+        ("db_pool_wait_seconds_total", "counter", "Time spent waiting for a connection.", "wait_seconds_total"),
+    )
+    lines: List[str] = []
+    for name, kind, documentation, key in families:
+        lines.extend(render_family(
+            name, kind, documentation,
+            (({"pool": pool}, stats[key]) for pool, stats in pools if key in stats)
+        ))
+    return lines
+
+
+@REGISTRY.register
+def collect_password_hash_metrics() -> List[str]:
+    """Queue, throughput and latency figures of the password hashing pool."""
+    from .hashing import get_password_hasher
+
+    stats = get_password_hasher().stats()
+    families = (
+        ("password_hash_queue_depth", "gauge", "Password jobs waiting for a worker.", "queue_depth"),
+        ("password_hash_in_flight", "gauge", "Password jobs running.", "in_flight"),
+        ("password_hash_completed_total", "counter", "Password jobs completed.", "completed"),
+        ("password_hash_rejected_total", "counter", "Password jobs rejected because the pool was full.", "rejected"),
+        ("password_hash_timed_out_total", "counter", "Password jobs dropped after waiting too long.", "timed_out"),
+        ("password_hash_wait_seconds_total", "counter", "Time password jobs spent queued.", "wait_seconds_total"),
+        ("password_hash_seconds_total", "counter", "Time spent hashing and verifying passwords.", "hash_seconds_total"),
+    )
+    lines: List[str] = []
+    for name, kind, documentation, key in families:
+        lines.extend(render_family(name, kind, documentation, [({}, stats[key])]))
+    return lines
+
+
+@REGISTRY.register
+def collect_cache_metrics() -> List[str]:
+    """Hit, miss, eviction and size figures of the in-process caches."""
+    from ..crud.book import book_cache
+    from .security import principal_cache
+
+    caches = (("book", book_cache.stats()), ("principal", principal_cache.stats()))
+    families = (
+        ("cache_hits_total", "counter", "Cache lookups served from memory.", "hits"),
+        ("cache_misses_total", "counter", "Cache lookups that went to the database.", "misses"),
+        ("cache_evictions_total", "counter", "Entries evicted to respect the cache limits.", "evictions"),
+        ("cache_entries", "gauge", "Entries currently cached.", "entries"),
+        ("cache_bytes", "gauge", "Approximate memory used by cached entries.", "bytes"),
+    )
+    lines: List[str] = []
+    for name, kind, documentation, key in families:
+        lines.extend(render_family(name, kind, documentation, (({"cache": cache}, stats[key]) for cache, stats in caches)))
+    return lines
+
+
+class MetricsMiddleware:
+    """
+    Count and time every HTTP request by method, route template and status code.
+
+    The route template (e.g. `/api/books/{book_id}`) comes from the route FastAPI
+    matched, so label cardinality stays bounded; requests that matched no route
+    are labelled `unmatched`.
+    """
+
+    def __init__(self, app: ASGIApp):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): Wrapped application.
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            template = getattr(route, "path_format", None) or "unmatched"
+            method = scope["method"]
+            REQUEST_DURATION.observe(time.perf_counter() - started, method, template)
+            REQUESTS.inc(method, template, str(status))
+            if status >= 400:
+                REQUEST_ERRORS.inc(str(status))
@@ -0,0 +1,53 @@
+import base64
+import json
+from typing import Any, List, Optional, Sequence, Tuple
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """
+    Encode the keyset position of the last returned row into an opaque cursor.
+
+    Args:
+        values (List[Any]): Sort key values of the last row, ending with its ID.
+
+    Returns:
+        str: URL-safe cursor string to be passed back as `after`.
+    """
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int, types: Optional[Sequence[Tuple[type, ...]]] = None) -> List[Any]:
+    """
+    Decode a cursor produced by `encode_cursor`.
+
+    Args:
+        cursor (str): Cursor string received from the client.
+        size (int): Expected number of values in the cursor.
+        types (Optional[Sequence[Tuple[type, ...]]]): Accepted types of each value, e.g.
+            `[(str, type(None)), (int,)]`; values are not type-checked if None.
+
+    Returns:
+        List[Any]: Sort key values of the last row seen by the client.
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the expected size or types.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    if types is not None and not all(_is_instance(value, accepted) for value, accepted in zip(values, types)):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _is_instance(value: Any, accepted: Tuple[type, ...]) -> bool:
+    """Check a decoded cursor value against its accepted types; JSON booleans are not integers."""
+    if isinstance(value, bool):
+        return bool in accepted
+    return isinstance(value, accepted)
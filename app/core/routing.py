@@ -0,0 +1,184 @@
+"""
+Session routing between the write engine and the read engines (read pool or replicas).
+"""
+import itertools
+import re
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Mapper, Session, SessionTransaction
+from sqlalchemy.sql import ClauseElement
+from sqlalchemy.sql.dml import UpdateBase
+from sqlalchemy.sql.elements import TextClause
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from ..config import Config
+
+WRITE_SQL = re.compile(r"^\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+PRIMARY_COOKIE = "read_primary_until"
+
+
+@dataclass
+class RoutingState:
+    """
+    Routing information shared by all sessions of one request.
+
+    The object is mutated in place, so changes made by sessions running on the
+    thread pool are visible to the middleware on the event loop.
+
+    Attributes:
+        force_primary (bool): Send every read of the request to the write engine.
+        wrote (bool): Whether the request wrote to the write engine.
+    """
+    force_primary: bool = False
+    wrote: bool = False
+
+
+routing_state: ContextVar[Optional[RoutingState]] = ContextVar("routing_state", default=None)
+
+# Shared round-robin position over the read engines; `next()` on a count is atomic.
+_read_transactions = itertools.count()
+
+
+def is_write(clause: Optional[ClauseElement]) -> bool:
+    """
+    Tell whether a statement modifies data.
+
+    Args:
+        clause (Optional[ClauseElement]): Statement being executed, if known.
+
+    Returns:
+        bool: True for INSERT/UPDATE/DELETE constructs and textual DML.
+    """
+    if isinstance(clause, UpdateBase):
+        return True
+    return isinstance(clause, TextClause) and WRITE_SQL.match(clause.text) is not None
+
+
+class RoutingSession(Session):
+    """
+    Session that sends writes to the write engine and reads to the read engines.
+
+    Flushes and DML statements go to the writer. Once a transaction has written,
+    every later statement of that transaction is pinned to the writer as well, so
+    it reads its own uncommitted changes; the pin is released when the
+    transaction ends. Reads outside write transactions use one read engine per
+    transaction, picked round-robin, unless the request is pinned to the primary
+    for read-your-writes (see `ReadYourWritesMiddleware`). When the only read
+    engine is the writer this is a plain Session.
+    """
+
+    def __init__(self, writer: Engine, readers: Sequence[Engine], **kwargs: Any):
+        """
+        Initialize the session.
+
+        Args:
+            writer (Engine): Engine for flushes and DML.
+            readers (Sequence[Engine]): Engines for reads outside write transactions.
+            **kwargs (Any): Regular Session options.
+        """
+        super().__init__(**kwargs)
+        self.writer = writer
+        self.readers = list(readers)
+        self._single_engine = self.readers == [writer]
+
+    def get_bind(self, mapper: Optional[Mapper] = None, clause: Optional[ClauseElement] = None, **kwargs: Any) -> Engine:
+        """
+        Choose the engine for a statement.
+
+        Args:
+            mapper (Optional[Mapper]): Mapper the statement targets, if any.
+            clause (Optional[ClauseElement]): Statement being executed, if known.
+            **kwargs (Any): Other arguments passed by the ORM.
+
+        Returns:
+            Engine: Write engine for writes, pinned transactions and pinned requests;
+            the transaction's read engine otherwise.
+        """
+        if self._single_engine:
+            return self.writer
+
+        state = routing_state.get()
+        if self._flushing or self.info.get("wrote") or is_write(clause):
+            self.info["wrote"] = True
+            if state is not None:
+                state.wrote = True
+            return self.writer
+        if state is not None and state.force_primary:
+            return self.writer
+
+        if "reader" not in self.info:
+            self.info["reader"] = self.readers[next(_read_transactions) % len(self.readers)]
+        return self.info["reader"]
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def release_transaction_pins(session: RoutingSession, transaction: SessionTransaction) -> None:
+    """Release the writer pin and the chosen read engine once the outermost transaction ends."""
+    if transaction.parent is None:
+        session.info.pop("wrote", None)
+        session.info.pop("reader", None)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Keep a client's reads on the primary for a while after it wrote.
+
+    Replicas lag behind the primary, so a client that just borrowed a book could
+    otherwise read the old state back. When a request writes, the response sets
+    a short-lived cookie; while it is valid, every read of that client goes to
+    the primary. Clients that do not keep cookies fall back to replica reads.
+
+    Without configured replicas there is no lag to hide, so requests pass
+    through untouched; the configuration is read per request, not at import.
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: Optional[int] = None):
+        """
+        Initialize the middleware.
+
+        Args:
+            app (ASGIApp): Wrapped application.
+            sticky_seconds (Optional[int]): How long reads stay on the primary after a
+                write; defaults to `REPLICA_STICKY_SECONDS`.
+        """
+        self.app = app
+        self.sticky_seconds = Config.REPLICA_STICKY_SECONDS if sticky_seconds is None else sticky_seconds
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not Config.SQLALCHEMY_REPLICA_URLS:
+            await self.app(scope, receive, send)
+            return
+
+        state = RoutingState(force_primary=self._pinned(scope))
+        token = routing_state.set(state)
+
+        async def send_with_cookie(message: Message) -> None:
+            if message["type"] == "http.response.start" and state.wrote:
+                MutableHeaders(scope=message).append(
+                    "set-cookie",
+                    f"{PRIMARY_COOKIE}={time.time() + self.sticky_seconds:.3f}; "
+                    f"Max-Age={self.sticky_seconds}; Path=/; HttpOnly; SameSite=Lax"
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_cookie)
+        finally:
+            routing_state.reset(token)
+
+    @staticmethod
+    def _pinned(scope: Scope) -> bool:
+        """Tell whether the request carries a still valid read-your-writes cookie."""
+        value = HTTPConnection(scope).cookies.get(PRIMARY_COOKIE)
+        try:
+            return value is not None and float(value) > time.time()
+        except ValueError:
+            return False
@@ -1,5 +1,6 @@
+import secrets
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Dict
+from typing import Any, Optional, Dict, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -7,9 +8,11 @@ from jose import JWTError, jwt
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
-from .database import get_db
+from .cache import TTLCache
+from .database import RequestSession, get_db, get_request_db
+from .hashing import get_password_hasher
 from ..config import Config, Settings
-from ..crud.refresh_token import RefreshTokenCRUD
+from ..crud.refresh_token import RefreshTokenCRUD, hash_token, utcnow
 from ..models.user import User
 from ..schemas.token import TokenData
 
@@ -17,6 +20,26 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/refresh")
 
+# Authenticated users keyed by token subject (email); values are {"id", "email", "sessions"} dictionaries,
+# "sessions" holding the digests of the user's live refresh tokens. The cache is per process: evicting an
+# entry only affects this worker, other workers keep theirs until it expires.
+principal_cache = TTLCache(
+    max_entries=Settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl_seconds=Settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def invalidate_principal(email: str) -> None:
+    """
+    Drop a user from the principal cache so the next request reloads it.
+
+    Call it whenever the user is changed or deleted, or its tokens are revoked.
+
+    Args:
+        email (str): Email (token subject) of the user.
+    """
+    principal_cache.invalidate(email)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
@@ -45,6 +68,39 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the password hashing pool without blocking the event loop.
+
+    Args:
+        plain_password (str): Plain text password.
+        hashed_password (str): Hashed password.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated.
+
+    Returns:
+        bool: True if the passwords match, False otherwise.
+    """
+    return await get_password_hasher().run(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Hash a password on the password hashing pool without blocking the event loop.
+
+    Args:
+        password (str): Plain text password.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated.
+
+    Returns:
+        str: Hashed password.
+    """
+    return await get_password_hasher().run(get_password_hash, password)
+
+
 def authenticate_user(email: str, password: str, db: Session = Depends(get_db)) -> Optional[User]:
     """
     Authenticate user by email and password.
@@ -63,6 +119,32 @@ def authenticate_user(email: str, password: str, db: Session = Depends(get_db))
     return user_crud.authenticate_user(email, password)
 
 
+async def authenticate_user_async(email: str, password: str, db: RequestSession) -> Optional[User]:
+    """
+    Authenticate user by email and password without blocking the event loop.
+
+    The user is loaded through the async CRUD adapter and the password is
+    verified on the hashing pool.
+
+    Args:
+        email (str): User email.
+        password (str): User password.
+        db (RequestSession): Session from `get_request_db`.
+
+    Raises:
+        HTTPException: 503 if the hashing pool is saturated.
+
+    Returns:
+        Optional[User]: User object if authentication succeeds, otherwise None.
+    """
+    from ..crud.async_crud import AsyncUserCRUD
+
+    user = await AsyncUserCRUD(db).get_user_by_email(email)
+    if not user or not await verify_password_async(password, user.password):
+        return None
+    return user
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token with expiration.
@@ -80,9 +162,46 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return jwt.encode(to_encode, Config.SECRET_KEY, algorithm=Config.ALGORITHM)
 
 
+def create_session_access_token(data: dict, refresh_token: str) -> str:
+    """
+    Create an access token bound to the session of a refresh token.
+
+    The token carries the refresh token's digest as its `sid` claim and is
+    rejected by `get_current_user` as soon as that refresh token is rotated,
+    deleted or purged.
+
+    Args:
+        data (dict): Data to encode in the token (e.g., {'sub': email}).
+        refresh_token (str): Refresh token issued alongside the access token.
+
+    Returns:
+        str: Encoded JWT access token.
+    """
+    return create_access_token(data={**data, "sid": hash_token(refresh_token)})
+
+
+def encode_refresh_token(data: dict) -> Tuple[str, datetime]:
+    """
+    Encode a JWT refresh token without storing it.
+
+    Every token carries a random `jti`, so two tokens issued for the same user in
+    the same second still differ.
+
+    Args:
+        data (dict): Data to encode in the token (e.g., {'sub': email}).
+
+    Returns:
+        Tuple[str, datetime]: Encoded token and its expiration time (naive UTC).
+    """
+    expire = utcnow() + timedelta(days=Settings.REFRESH_TOKEN_EXPIRE_DAYS)
+    to_encode = data.copy()
+    to_encode.update({"exp": expire.replace(tzinfo=timezone.utc), "type": "refresh", "jti": secrets.token_hex(16)})
+    return jwt.encode(to_encode, Config.SECRET_KEY, algorithm=Config.ALGORITHM), expire
+
+
 def create_refresh_token(data: dict, db: Session) -> str:
     """
-    Create a JWT refresh token, store it in the database, and delete any previous token for the user.
+    Create a JWT refresh token, store its digest in the database, and revoke any previous token for the user.
 
     Args:
         data (dict): Data to encode in the token (e.g., {'sub': email}).
@@ -91,41 +210,42 @@ def create_refresh_token(data: dict, db: Session) -> str:
     Returns:
         str: Encoded JWT refresh token.
     """
-    expire = datetime.now(tz=timezone.utc) + timedelta(days=Settings.REFRESH_TOKEN_EXPIRE_DAYS)
-    to_encode = data.copy()
-    to_encode.update({"exp": expire, "type": "refresh"})
-    refresh_token = jwt.encode(to_encode, Config.SECRET_KEY, algorithm=Config.ALGORITHM)
+    refresh_token, expire = encode_refresh_token(data)
+    RefreshTokenCRUD(db).issue(user_id=data["sub"], refresh_token=refresh_token, expires_at=expire)
+    return refresh_token
+
+
+async def create_refresh_token_async(data: dict, db: RequestSession) -> str:
+    """
+    Async counterpart of `create_refresh_token` for the async routers.
 
-    token_crud = RefreshTokenCRUD(db)
-    last_token = token_crud.get(user_id=data["sub"])
-    if last_token:
-        token_crud.delete(last_token.token)
+    Args:
+        data (dict): Data to encode in the token (e.g., {'sub': email}).
+        db (RequestSession): Session from `get_request_db`.
 
-    token_crud.create({
-        "token": refresh_token,
-        "user_id": data["sub"],
-        "expires_at": expire
-    })
+    Returns:
+        str: Encoded JWT refresh token.
+    """
+    from ..crud.async_crud import AsyncRefreshTokenCRUD
 
+    refresh_token, expire = encode_refresh_token(data)
+    await AsyncRefreshTokenCRUD(db).issue(user_id=data["sub"], refresh_token=refresh_token, expires_at=expire)
     return refresh_token
 
 
-def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+def decode_access_token(token: str) -> Dict[str, Any]:
     """
-    Retrieve the current authenticated user based on the access token.
+    Verify an access token and return its claims.
 
     Args:
-        token (str): JWT access token extracted from the Authorization header.
-        db (Session): Database session.
+        token (str): JWT access token.
 
     Raises:
-        HTTPException: If token is invalid or user not found.
+        HTTPException: If the token is invalid, expired or has no subject.
 
     Returns:
-        User: User object.
+        Dict[str, Any]: Verified token claims.
     """
-    from ..crud.user import UserCRUD
-
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -133,57 +253,230 @@ def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(
     )
     try:
         payload = jwt.decode(token, Config.SECRET_KEY, algorithms=[Config.ALGORITHM])
-        email: Optional[str] = payload.get("sub")
-        if email is None:
-            raise credentials_exception
-        token_data = TokenData(email=email)
-    except JWTError:
+        TokenData(email=payload.get("sub"))
+    except (JWTError, ValueError):
         raise credentials_exception
-
-    user = UserCRUD(db).get_user_by_email(token_data.email)
-    if user is None:
+    if payload.get("sub") is None:
         raise credentials_exception
-    return user
+    return payload
+
+
+def get_current_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """
+    Retrieve the current authenticated user based on the access token.
+
+    Users are served from a short-lived in-process cache keyed by the token
+    subject, so most requests do not query the users table. The cached entry
+    also lists the user's live sessions; a token whose `sid` claim is not among
+    them was revoked and is rejected. Revoking tokens evicts the entry in the
+    process that revoked them, where this takes effect on the next request;
+    other worker processes may accept the token until their entry expires,
+    at most `PRINCIPAL_CACHE_TTL_SECONDS` later.
+
+    Args:
+        token (str): JWT access token extracted from the Authorization header.
+        db (Session): Database session.
+
+    Raises:
+        HTTPException: If token is invalid, its session was revoked or user not found.
+
+    Returns:
+        User: Detached User object carrying the id and email.
+    """
+    from ..crud.user import UserCRUD
+
+    claims = decode_access_token(token)
+    email = claims["sub"]
+
+    def load_principal() -> Optional[Dict[str, Any]]:
+        user = UserCRUD(db).get_user_by_email(email)
+        if not user:
+            return None
+        sessions = tuple(RefreshTokenCRUD(db).get_session_ids(email))
+        return {"id": user.id, "email": user.email, "sessions": sessions}
+
+    return principal_user(claims, principal_cache.get_or_load(email, load_principal))
+
+
+async def get_current_user_async(token: str = Depends(oauth2_scheme), db: RequestSession = Depends(get_request_db)) -> User:
+    """
+    Async counterpart of `get_current_user` for the async routers.
+
+    The user is loaded on the request's own session from `get_request_db`, so
+    an async route does not open a second, sync session just to authenticate.
+
+    Args:
+        token (str): JWT access token extracted from the Authorization header.
+        db (RequestSession): Session from `get_request_db`.
+
+    Raises:
+        HTTPException: If token is invalid, its session was revoked or user not found.
+
+    Returns:
+        User: Detached User object carrying the id and email.
+    """
+    from ..crud.async_crud import AsyncRefreshTokenCRUD, AsyncUserCRUD
+
+    claims = decode_access_token(token)
+    email = claims["sub"]
+
+    async def load_principal() -> Optional[Dict[str, Any]]:
+        user = await AsyncUserCRUD(db).get_user_by_email(email)
+        if not user:
+            return None
+        sessions = tuple(await AsyncRefreshTokenCRUD(db).get_session_ids(email))
+        return {"id": user.id, "email": user.email, "sessions": sessions}
+
+    return principal_user(claims, await principal_cache.get_or_load_async(email, load_principal))
+
+
+def principal_user(claims: Dict[str, Any], principal: Optional[Dict[str, Any]]) -> User:
+    """
+    Check a cached principal against the token claims and build the request's user.
+
+    Args:
+        claims (Dict[str, Any]): Verified access token claims.
+        principal (Optional[Dict[str, Any]]): Principal cache entry, None if the user does not exist.
+
+    Raises:
+        HTTPException: If the user does not exist or the token's session was revoked.
+
+    Returns:
+        User: Detached User object carrying the id and email.
+    """
+    session_id = claims.get("sid")
+    if principal is None or (session_id is not None and session_id not in principal["sessions"]):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return User(id=principal["id"], email=principal["email"])
+
+
+def get_read_only_user(token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)) -> User:
+    """
+    Retrieve the current user for read-only routes.
+
+    When `AUTH_TRUST_TOKEN_CLAIMS` is enabled the verified token claims are
+    trusted as is and no user lookup happens at all; the cost is that a deleted
+    user or a revoked session keeps read access until the access token expires. Otherwise this is the
+    same as `get_current_user`.
+
+    Args:
+        token (str): JWT access token extracted from the Authorization header.
+        db (Session): Database session.
+
+    Raises:
+        HTTPException: If token is invalid or user not found.
+
+    Returns:
+        User: Detached User object carrying the id (if present in the token) and email.
+    """
+    if Config.AUTH_TRUST_TOKEN_CLAIMS:
+        claims = decode_access_token(token)
+        return User(id=claims.get("uid"), email=claims["sub"])
+    return get_current_user(token, db)
+
+
+async def get_read_only_user_async(token: str = Depends(oauth2_scheme), db: RequestSession = Depends(get_request_db)) -> User:
+    """
+    Async counterpart of `get_read_only_user` for the async routers.
+
+    Args:
+        token (str): JWT access token extracted from the Authorization header.
+        db (RequestSession): Session from `get_request_db`.
+
+    Raises:
+        HTTPException: If token is invalid or user not found.
+
+    Returns:
+        User: Detached User object carrying the id (if present in the token) and email.
+    """
+    if Config.AUTH_TRUST_TOKEN_CLAIMS:
+        claims = decode_access_token(token)
+        return User(id=claims.get("uid"), email=claims["sub"])
+    return await get_current_user_async(token, db)
+
+
+def decode_refresh_token(refresh_token: str) -> Dict[str, Any]:
+    """
+    Verify a refresh token's signature and type and return the claims for its successor.
+
+    Args:
+        refresh_token (str): JWT refresh token.
+
+    Raises:
+        HTTPException: If the token is invalid, expired or not a refresh token.
+
+    Returns:
+        Dict[str, Any]: Claims ({'sub', 'uid'}) to issue the new token pair with.
+    """
+    try:
+        payload = jwt.decode(refresh_token, Config.SECRET_KEY, algorithms=[Config.ALGORITHM])
+    except JWTError:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    if payload.get("sub") is None or payload.get("type") != "refresh":
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    return {"sub": payload["sub"], "uid": payload.get("uid")}
 
 
 def refresh_tokens(refresh_token: str, db: Session = Depends(get_db)) -> Dict[str, str]:
     """
     Refresh access and refresh tokens given a valid refresh token.
 
+    The signature is checked before touching the database; the stored token is
+    then consumed and replaced in a single transaction.
+
     Args:
         refresh_token (str): JWT refresh token.
         db (Session): Database session.
 
     Raises:
-        HTTPException: If refresh token is invalid or expired.
+        HTTPException: If refresh token is invalid, expired or already used.
 
     Returns:
         Dict[str, str]: Dictionary containing new access token, refresh token, and token type.
     """
-    try:
-        token_crud = RefreshTokenCRUD(db)
+    claims = decode_refresh_token(refresh_token)
+    new_refresh_token, expire = encode_refresh_token(claims)
+    if not RefreshTokenCRUD(db).rotate(refresh_token, claims["sub"], new_refresh_token, expire):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
-        if not token_crud.get(refresh_token):
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
+    return {
+        "access_token": create_session_access_token(claims, new_refresh_token),
+        "refresh_token": new_refresh_token,
+        "token_type": "bearer"
+    }
 
-        payload = jwt.decode(refresh_token, Config.SECRET_KEY, algorithms=[Config.ALGORITHM])
-        email: Optional[str] = payload.get("sub")
-        if email is None:
-            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
-        token_crud.delete(refresh_token)
+async def refresh_tokens_async(refresh_token: str, db: RequestSession) -> Dict[str, str]:
+    """
+    Async counterpart of `refresh_tokens` for the async routers.
 
-        access_token = create_access_token(data={"sub": email})
-        new_refresh_token = create_refresh_token(data={"sub": email}, db=db)
+    Args:
+        refresh_token (str): JWT refresh token.
+        db (RequestSession): Session from `get_request_db`.
 
-        return {
-            "access_token": access_token,
-            "refresh_token": new_refresh_token,
-            "token_type": "bearer"
-        }
-    except JWTError:
+    Raises:
+        HTTPException: If refresh token is invalid, expired or already used.
+
+    Returns:
+        Dict[str, str]: Dictionary containing new access token, refresh token, and token type.
+    """
+    from ..crud.async_crud import AsyncRefreshTokenCRUD
+
+    claims = decode_refresh_token(refresh_token)
+    new_refresh_token, expire = encode_refresh_token(claims)
+    if not await AsyncRefreshTokenCRUD(db).rotate(refresh_token, claims["sub"], new_refresh_token, expire):
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token")
 
+    return {
+        "access_token": create_session_access_token(claims, new_refresh_token),
+        "refresh_token": new_refresh_token,
+        "token_type": "bearer"
+    }
+
 
 def is_email(email: str) -> bool:
     """
@@ -0,0 +1,51 @@
+import asyncio
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+
+from .database import SessionLocal
+from ..config import Settings
+from ..crud.refresh_token import RefreshTokenCRUD
+
+logger = logging.getLogger(__name__)
+
+
+def purge_expired_refresh_tokens(batch_size: int = Settings.REFRESH_TOKEN_PURGE_BATCH_SIZE) -> int:
+    """
+    Delete every expired refresh token using a dedicated session.
+
+    Args:
+        batch_size (int): Maximum number of tokens deleted per transaction.
+
+    Returns:
+        int: Number of tokens deleted.
+    """
+    db = SessionLocal()
+    try:
+        return RefreshTokenCRUD(db).purge_expired(batch_size)
+    finally:
+        db.close()
+
+
+async def purge_refresh_tokens_periodically(
+    interval: float = Settings.REFRESH_TOKEN_PURGE_INTERVAL_SECONDS,
+    batch_size: int = Settings.REFRESH_TOKEN_PURGE_BATCH_SIZE
+) -> None:
+    """
+    Purge expired refresh tokens forever, pausing `interval` seconds between runs.
+
+    The purge runs on the thread pool so the event loop is never blocked; a failed
+    run is logged and retried on the next tick. Cancel the task to stop it.
+
+    Args:
+        interval (float): Pause between purges in seconds.
+        batch_size (int): Maximum number of tokens deleted per transaction.
+    """
+    while True:
+        try:
+            purged = await run_in_threadpool(purge_expired_refresh_tokens, batch_size)
+            if purged:
+                logger.info("Purged %d expired refresh token(s)", purged)
+        except Exception:
+            logger.exception("Failed to purge expired refresh tokens")
+        await asyncio.sleep(interval)
@@ -0,0 +1,97 @@
+"""
+Awaitable front ends for the CRUD classes, used by the async routers.
+
+Each adapter wraps a CRUD class and exposes the same public methods as
+coroutines. What happens on await depends on the session it was built with:
+
+* AsyncSession (`SQLALCHEMY_ASYNC` enabled): the method runs through
+  `AsyncSession.run_sync`, i.e. the unchanged CRUD code executes on the event
+  loop while every database round trip is awaited on the async driver
+  (asyncpg/aiosqlite). No thread pool is involved.
+* Session: the method runs on the thread pool, so blocking driver calls never
+  stall the event loop.
+
+Keeping a single implementation of every query means the sync and async paths
+cannot drift apart.
+"""
+from functools import partial
+from typing import Any, Callable, Coroutine, Union
+
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from .book import BookCRUD
+from .reader import ReaderCRUD
+from .refresh_token import RefreshTokenCRUD
+from .user import UserCRUD
+
+
+class AsyncCRUD:
+    """
+    Base adapter turning the public methods of `crud_class` into coroutines.
+
+    Attributes:
+        crud_class (type): Sync CRUD class whose methods are exposed.
+    """
+
+    crud_class: type = None
+
+    def __init__(self, db: Union[Session, AsyncSession]):
+        """
+        Initialize the adapter with a request session.
+
+        Args:
+            db (Union[Session, AsyncSession]): Session from `get_request_db`.
+        """
+        self.db = db
+
+    def __getattr__(self, name: str) -> Callable[..., Coroutine[Any, Any, Any]]:
+        """
+        Return an awaitable version of a public CRUD method.
+
+        Args:
+            name (str): Method name, e.g. `borrow_book`.
+
+        Raises:
+            AttributeError: If the CRUD class has no such public method.
+
+        Returns:
+            Callable[..., Coroutine[Any, Any, Any]]: Coroutine function with the method's signature.
+        """
+        if name.startswith("_") or not callable(getattr(self.crud_class, name, None)):
+            raise AttributeError(f"{self.crud_class.__name__} has no method '{name}'")
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            if isinstance(self.db, AsyncSession):
+                return await self.db.run_sync(
+                    lambda session: getattr(self.crud_class(session), name)(*args, **kwargs)
+                )
+            return await run_in_threadpool(partial(getattr(self.crud_class(self.db), name), *args, **kwargs))
+
+        call.__name__ = name
+        return call
+
+
+class AsyncBookCRUD(AsyncCRUD):
+    """Awaitable BookCRUD; generator methods such as `iter_export` are not supported."""
+
+    crud_class = BookCRUD
+
+
+class AsyncReaderCRUD(AsyncCRUD):
+    """Awaitable ReaderCRUD."""
+
+    crud_class = ReaderCRUD
+
+
+class AsyncUserCRUD(AsyncCRUD):
+    """Awaitable UserCRUD."""
+
+    crud_class = UserCRUD
+
+
+class AsyncRefreshTokenCRUD(AsyncCRUD):
+    """Awaitable RefreshTokenCRUD."""
+
+    crud_class = RefreshTokenCRUD
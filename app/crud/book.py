@@ -1,8 +1,100 @@
-from typing import Dict, Any, Optional, List
+import re
+from typing import Dict, Any, Iterable, Iterator, Optional, List, Sequence, Set, Tuple, Union
+from pydantic import ValidationError
+from sqlalchemy import (
+    REAL, Float, Integer, Row, Select, and_, bindparam, cast, func, insert, literal, literal_column, or_, select, text,
+    tuple_, update
+)
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from ..schemas.book import BookCreate
-from ..models.book import Book
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from ..config import Settings
+from ..core.cache import TTLCache
+from ..core.conditional import VersionConflict
+from ..core.pagination import encode_cursor, decode_cursor
+from ..core.projection import fetch_all, select_entity
+from ..schemas.book import BookCreate, BookImportError, BookImportReport
+from .change_counter import ChangeCounterCRUD
+from ..models.book import Book, BOOK_SEARCH_VECTOR
+from ..models.tombstone import Tombstone
+
+# Columns a book listing may be ordered by; Book.id is always appended as a tie-breaker.
+SORTABLE_COLUMNS = {
+    "id": Book.id,
+    "title": Book.title,
+    "author": Book.author,
+    "publication_year": Book.publication_year,
+}
+
+# Dialects whose ascending indexes keep NULLs after every value; elsewhere NULLs come first.
+NULLS_LAST_DIALECTS = {"postgresql", "oracle"}
+
+
+def _cursor_types(column) -> Tuple[type, ...]:
+    """Python types a cursor may carry for a sort column; None too if the column is nullable."""
+    types = (column.type.python_type,)
+    return types + (type(None),) if column.nullable else types
+
+
+def _after_key(column, last_value: Any, last_id: int, nulls_first: bool):
+    """
+    Build the keyset condition selecting the rows that sort after (last_value, last_id).
+
+    A row comparison skips every row whose sort value is NULL, so the NULL group is
+    matched explicitly: it follows all values when NULLs sort last, and precedes
+    them when NULLs sort first.
+
+    Args:
+        column: Sort column.
+        last_value (Any): Sort value of the last row of the previous page; may be None.
+        last_id (int): ID of the last row of the previous page.
+        nulls_first (bool): Whether NULLs sort before every value.
+
+    Returns:
+        Condition for the WHERE clause of the next page.
+    """
+    if last_value is None:
+        in_null_group = and_(column.is_(None), Book.id > last_id)
+        return or_(in_null_group, column.is_not(None)) if nulls_first else in_null_group
+    after_value = tuple_(column, Book.id) > tuple_(last_value, last_id)
+    return after_value if nulls_first else or_(after_value, column.is_(None))
+
+
+# Read-through cache of book rows keyed by ("id", book_id), plus ("isbn", isbn) -> book_id.
+# Values are plain column dictionaries so they can be shared safely between sessions and threads.
+book_cache = TTLCache(
+    max_entries=Settings.BOOK_CACHE_MAX_ENTRIES,
+    ttl_seconds=Settings.BOOK_CACHE_TTL_SECONDS,
+    max_bytes=Settings.BOOK_CACHE_MAX_BYTES
+)
+
+
+def invalidate_book(*book_ids: int) -> None:
+    """
+    Drop books from the lookup cache after they were changed or deleted.
+
+    Call it after the transaction that changed the books has been committed.
+
+    Args:
+        *book_ids (int): IDs of the changed books.
+    """
+    book_cache.invalidate(*(("id", book_id) for book_id in book_ids))
+
+
+def _book_size(values: Dict[str, Any]) -> int:
+    """Approximate memory held by a cached book row."""
+    return 200 + sum(len(value) for value in values.values() if isinstance(value, str))
+
+
+# Change counter versioning the whole catalog; every write to `books` bumps it.
+BOOKS_COUNTER = "books"
+
+
+# What bulk import does with a row whose ISBN is already in the catalog (or earlier in the same file).
+IMPORT_CONFLICT_POLICIES = ("skip", "upsert", "report")
+
+# bm25() weights for the title, author and description columns of books_fts.
+SQLITE_RANK = "bm25(books_fts, 10.0, 5.0, 1.0)"
 
 
 class BookCRUD:
@@ -35,9 +127,12 @@ class BookCRUD:
                 author=book.author,
                 publication_year=book.publication_year,
                 isbn=book.isbn,
-                copies_available=book.copies_available
+                copies_available=book.copies_available,
+                description=book.description
             )
             self.db.add(db_book)
+            self.db.flush()
+            ChangeCounterCRUD(self.db).stamp(BOOKS_COUNTER, Book.__table__, Book.id == db_book.id)
             self.db.commit()
             self.db.refresh(db_book)
             return db_book
@@ -48,52 +143,363 @@ class BookCRUD:
             self.db.rollback()
             raise Exception(f"Failed to create book: {str(e)}")
 
-    def get_all(self) -> Optional[List[Book]]:
+    def get_all(self, fields: Optional[Sequence[str]] = None) -> List[Union[Book, Row]]:
         """
         Retrieve all book records from the database.
 
+        Args:
+            fields (Optional[Sequence[str]]): Columns to load as plain rows (see `select_entity`);
+                ORM objects are returned if None.
+
+        Returns:
+            List[Union[Book, Row]]: All books.
+
+        Raises:
+            ValueError: If a field is not a Book column.
+        """
+        return fetch_all(self.db, select_entity(Book, fields), fields)
+
+    def get_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        sort: str = "id",
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[Book, Row]], Optional[str]]:
+        """
+        Retrieve one page of books using keyset (cursor) pagination.
+
+        Rows are ordered by the sort column and then by ID, and the next page starts
+        strictly after the last row of the previous one, so every page is a bounded
+        index range scan regardless of how deep into the catalog it is. Books whose
+        sort column is NULL are listed together, in the position the database's
+        indexes keep them in: first on SQLite, last on PostgreSQL.
+
+        Args:
+            limit (int): Maximum number of books to return.
+            after (Optional[str]): Cursor returned with the previous page, if any.
+            sort (str): Name of the column to order by (see SORTABLE_COLUMNS).
+            fields (Optional[Sequence[str]]): Columns to load as plain rows (see `select_entity`);
+                ORM objects are returned if None.
+
+        Returns:
+            Tuple[List[Union[Book, Row]], Optional[str]]: Books of the page and the
+            cursor of the next page, or None if this is the last page.
+
+        Raises:
+            ValueError: If the sort column, a field or the cursor is invalid.
+        """
+        if sort not in SORTABLE_COLUMNS:
+            raise ValueError(f"Unsupported sort column: {sort}")
+
+        sort_column = SORTABLE_COLUMNS[sort]
+        nulls_first = self.db.get_bind().dialect.name not in NULLS_LAST_DIALECTS
+        query = select_entity(Book, fields, required=("id", sort))
+        if after:
+            if sort == "id":
+                (last_id,) = decode_cursor(after, 1, types=[(int,)])
+                query = query.where(Book.id > last_id)
+            else:
+                last_value, last_id = decode_cursor(after, 2, types=[_cursor_types(sort_column), (int,)])
+                query = query.where(_after_key(sort_column, last_value, last_id, nulls_first))
+
+        if sort == "id":
+            order_by = [Book.id]
+        else:
+            order_by = [sort_column.nulls_first() if nulls_first else sort_column.nulls_last(), Book.id]
+        books = fetch_all(self.db, query.order_by(*order_by).limit(limit + 1), fields)
+
+        next_cursor = None
+        if len(books) > limit:
+            books = books[:limit]
+            last = books[-1]
+            key = [last.id] if sort == "id" else [getattr(last, sort), last.id]
+            next_cursor = encode_cursor(key)
+        return books, next_cursor
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        after: Optional[str] = None,
+        fields: Optional[Sequence[str]] = None
+    ) -> Tuple[List[Union[Book, Row]], Optional[str]]:
+        """
+        Full-text search over book title, author and description.
+
+        Uses the FTS5 index on SQLite and the GIN `tsvector` index on PostgreSQL.
+        Every word of the query must match (as a prefix); results are ranked by
+        relevance, with title matches weighted above author and description.
+
+        Pages are keyed on (rank, id): the next page continues strictly after the
+        last match of the previous one, so the database keeps only `limit` ranked
+        matches per page however deep the client pages, and a book added between
+        two requests cannot shift a match onto a second page. Ranking still has to
+        score every match of the query, so very broad queries cost the same on
+        every page; narrow them rather than paging deep.
+
+        Args:
+            query (str): Free-text search query.
+            limit (int): Maximum number of books to return.
+            after (Optional[str]): Cursor returned with the previous page, if any.
+            fields (Optional[Sequence[str]]): Columns to load as plain rows (see `select_entity`);
+                ORM objects are returned if None.
+
+        Returns:
+            Tuple[List[Union[Book, Row]], Optional[str]]: Matching books ordered by
+            relevance and the cursor of the next page, or None if this is the last page.
+
+        Raises:
+            ValueError: If the cursor or a field is invalid.
+        """
+        last_rank, last_id = decode_cursor(after, 2, types=[(float, int), (int,)]) if after else (None, None)
+        books_query = select_entity(Book, fields)
+
+        terms = re.findall(r"\w+", query.lower())
+        if not terms:
+            return [], None
+
+        dialect = self.db.get_bind().dialect.name
+        matches = self.db.execute(self._ranked_matches(dialect, terms, last_rank, last_id).limit(limit + 1)).all()
+
+        next_cursor = None
+        if len(matches) > limit:
+            matches = matches[:limit]
+            next_cursor = encode_cursor([matches[-1].rank, matches[-1].book_id])
+        if not matches:
+            return [], None
+
+        position = {match.book_id: index for index, match in enumerate(matches)}
+        books = fetch_all(self.db, books_query.where(Book.id.in_(list(position))), fields)
+        books.sort(key=lambda book: position[book.id])
+        return books, next_cursor
+
+    @staticmethod
+    def _ranked_matches(dialect: str, terms: List[str], last_rank: Optional[float], last_id: Optional[int]) -> Select:
+        """
+        Build the query listing the IDs and ranks of the books matching every term, best first.
+
+        Args:
+            dialect (str): Name of the database dialect.
+            terms (List[str]): Lower-cased query words, each matched as a prefix.
+            last_rank (Optional[float]): Rank of the last match of the previous page, if any.
+            last_id (Optional[int]): ID of the last match of the previous page, if any.
+
         Returns:
-            Optional[Dict[str, Any]]: List of all book objects.
+            Select: Statement yielding `book_id` and `rank` rows in page order.
+        """
+        if dialect == "sqlite":
+            fts = text(
+                f"SELECT rowid AS book_id, {SQLITE_RANK} AS rank FROM books_fts WHERE books_fts MATCH :match"
+            ).bindparams(
+                match=" ".join(f'"{term}"*' for term in terms)
+            ).columns(book_id=Integer, rank=Float).subquery("matches")
+            statement = select(fts.c.book_id, fts.c.rank).order_by(fts.c.rank, fts.c.book_id)
+            if last_id is not None:
+                statement = statement.where(tuple_(fts.c.rank, fts.c.book_id) > tuple_(last_rank, last_id))
+            return statement
+
+        if dialect == "postgresql":
+            vector = literal_column(f"({BOOK_SEARCH_VECTOR})")
+            ts_query = func.to_tsquery("simple", " & ".join(f"{term}:*" for term in terms))
+            rank = func.ts_rank(vector, ts_query, type_=REAL)
+            statement = (
+                select(Book.id.label("book_id"), rank.label("rank"))
+                .where(vector.op("@@")(ts_query))
+                .order_by(rank.desc(), Book.id)
+            )
+            if last_id is not None:
+                # ts_rank is a real: compare in single precision so equal ranks stay equal.
+                last = cast(last_rank, REAL)
+                statement = statement.where(or_(rank < last, and_(rank == last, Book.id > last_id)))
+            return statement
+
+        statement = (
+            select(Book.id.label("book_id"), literal(0.0, Float).label("rank"))
+            .where(and_(*(
+                or_(Book.title.ilike(f"%{term}%"), Book.author.ilike(f"%{term}%"), Book.description.ilike(f"%{term}%"))
+                for term in terms
+            )))
+            .order_by(Book.id)
+        )
+        if last_id is not None:
+            statement = statement.where(Book.id > last_id)
+        return statement
+
+    def iter_export(self, columns: Sequence[str], batch_size: int) -> Iterator[Sequence[Tuple[Any, ...]]]:
+        """
+        Stream the whole catalog in ID order as batches of plain row tuples.
+
+        The query runs with `yield_per`, which uses a server-side cursor where the
+        driver supports one, and rows are not turned into ORM objects, so memory
+        use is bounded by the batch size rather than the catalog size.
+
+        Args:
+            columns (Sequence[str]): Names of the Book columns to fetch, in order.
+            batch_size (int): Number of rows fetched per batch.
+
+        Yields:
+            Sequence[Tuple[Any, ...]]: The next batch of rows.
         """
-        return self.db.query(Book).all()
+        table = Book.__table__
+        statement = (
+            select(*(table.c[name] for name in columns))
+            .order_by(table.c.id)
+            .execution_options(yield_per=batch_size)
+        )
+        result = self.db.execute(statement)
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
 
     def get_by_id(self, book_id: int) -> Optional[Book]:
         """
-        Retrieve a single book by its ID.
+        Retrieve a single book by its ID through the read-through cache.
+
+        The returned Book is built from the cached column values and was never
+        attached to a session: it is read-only data. Do not `add` or `merge` it
+        (merging would write the possibly stale cached values back over the row),
+        and do not rely on lazy loading or refresh; load the book with a query if
+        it is going to be modified through the ORM.
+
+        Args:
+            book_id (int): Unique identifier of the book.
+
+        Returns:
+            Optional[Book]: Detached Book if found, else None.
+        """
+        values = book_cache.get_or_load(("id", book_id), lambda: self._load_book(Book.id == book_id), _book_size)
+        return Book(**values) if values is not None else None
+
+    def get_by_isbn(self, isbn: str) -> Optional[Book]:
+        """
+        Retrieve a single book by its ISBN through the read-through cache.
+
+        The returned Book is detached read-only data, like the result of `get_by_id`.
+
+        Args:
+            isbn (str): ISBN of the book.
+
+        Returns:
+            Optional[Book]: Detached Book if found, else None.
+        """
+        book_id = book_cache.get(("isbn", isbn))
+        if book_id is not None:
+            book = self.get_by_id(book_id)
+            if book is not None and book.isbn == isbn:
+                return book
+            book_cache.invalidate(("isbn", isbn))
+
+        generation = book_cache.generation()
+        values = self._load_book(Book.isbn == isbn)
+        if values is None:
+            return None
+        book_cache.set(("id", values["id"]), values, size=_book_size(values), generation=generation)
+        book_cache.set(("isbn", isbn), values["id"], generation=generation)
+        return Book(**values)
+
+    def get_version(self, book_id: int) -> Optional[int]:
+        """
+        Return the change version of a book without loading the whole row.
+
+        A cached copy of the book answers without a query; otherwise only the
+        version column is read through the primary key.
 
         Args:
             book_id (int): Unique identifier of the book.
 
         Returns:
-            Optional[Dict[str, Any]]: Book object if found, else None.
+            Optional[int]: Version of the book, or None if it does not exist.
+        """
+        values = book_cache.get(("id", book_id))
+        if values is not None:
+            return values["version"]
+        return self.db.execute(select(Book.version).where(Book.id == book_id)).scalar()
+
+    def catalog_version(self) -> int:
+        """
+        Return the catalog-wide change version.
+
+        Returns:
+            int: Value of the "books" change counter.
+        """
+        return ChangeCounterCRUD(self.db).current(BOOKS_COUNTER)
+
+    def _load_book(self, condition) -> Optional[Dict[str, Any]]:
+        """
+        Load the columns of one book as a plain dictionary, bypassing the ORM.
+
+        Args:
+            condition: SQLAlchemy filter selecting the book.
+
+        Returns:
+            Optional[Dict[str, Any]]: Column values, or None if no book matches.
         """
-        return self.db.query(Book).filter(Book.id == book_id).first()
+        row = self.db.execute(select(Book.__table__).where(condition)).first()
+        return dict(row._mapping) if row is not None else None
 
-    def update(self, book_id: int, book: BookCreate) -> Optional[Dict[str, Any]]:
+    def update(self, book_id: int, book: BookCreate, expected_version: Optional[int] = None) -> Optional[Row]:
         """
         Update an existing book record by its ID.
 
+        The write is a guarded `UPDATE ... WHERE id = ? [AND version = ?]`, so a
+        concurrent edit cannot be silently overwritten and no row lock is held
+        across round trips. Only once it matched is the book stamped with a new
+        version, which returns the new row (RETURNING where the backend supports it).
+
         Args:
             book_id (int): Unique identifier of the book.
             book (BookCreate): Data schema containing updated book details.
+            expected_version (Optional[int]): Version the caller last saw; the update
+                only applies if the book is still at it. Unconditional if None.
 
         Returns:
-            Optional[Dict[str, Any]]: Updated book object if successful.
+            Optional[Row]: Updated book, or None if it does not exist.
 
         Raises:
+            VersionConflict: If the book has changed since `expected_version`.
             Exception: If update fails.
         """
+        table = Book.__table__
+        conditions = [table.c.id == book_id]
+        if expected_version is not None:
+            conditions.append(table.c.version == expected_version)
+
         try:
-            self.db.query(Book).filter(Book.id == book_id).update(book.model_dump())
+            statement = (
+                update(table)
+                .where(*conditions)
+                .values(book.model_dump())
+                .execution_options(synchronize_session=False)
+            )
+            if self.db.get_bind().dialect.update_returning:
+                matched = self.db.execute(statement.returning(table.c.id)).first() is not None
+            else:
+                matched = self.db.execute(statement).rowcount == 1
+
+            if not matched:
+                self.db.rollback()
+                if expected_version is not None and self.db.execute(
+                    select(table.c.id).where(table.c.id == book_id)
+                ).first() is not None:
+                    raise VersionConflict(f"Book {book_id} is no longer at version {expected_version}")
+                return None
+
+            updated = ChangeCounterCRUD(self.db).stamp_row(BOOKS_COUNTER, table, book_id)
             self.db.commit()
-            return self.db.query(Book).filter(Book.id == book_id).first()
+        except VersionConflict:
+            raise
         except Exception as e:
             self.db.rollback()
             raise Exception(f"Failed to update book: {str(e)}")
 
+        invalidate_book(book_id)
+        return updated
+
     def delete(self, book_id: int) -> None:
         """
-        Delete a book record by its ID.
+        Delete a book record by its ID, leaving a tombstone for the sync change feed.
 
         Args:
             book_id (int): Unique identifier of the book to delete.
@@ -102,8 +508,193 @@ class BookCRUD:
             Exception: If deletion fails.
         """
         try:
-            self.db.query(Book).filter(Book.id == book_id).delete()
+            if self.db.query(Book).filter(Book.id == book_id).delete():
+                tombstone = self.db.execute(insert(Tombstone).values(entity=BOOKS_COUNTER, entity_id=book_id, version=0))
+                ChangeCounterCRUD(self.db).stamp(
+                    BOOKS_COUNTER, Tombstone.__table__, Tombstone.id == tombstone.inserted_primary_key[0]
+                )
             self.db.commit()
+            invalidate_book(book_id)
         except Exception as e:
             self.db.rollback()
             raise Exception(f"Failed to delete book: {str(e)}")
+
+    def bulk_import(
+        self,
+        records: Iterable[Tuple[int, Union[Dict[str, Any], str]]],
+        batch_size: int,
+        on_conflict: str = "skip"
+    ) -> BookImportReport:
+        """
+        Import books from a stream of records using batched multi-row inserts.
+
+        Records are validated one by one and written in batches of `batch_size`
+        rows: one query looks up the ISBNs that already exist, the new rows go out
+        as a single executemany INSERT, and the batch is committed. Rows whose ISBN
+        already exists are handled according to `on_conflict` without aborting
+        the rest of the batch:
+
+        * ``skip`` - leave the existing book untouched and count the row as skipped;
+        * ``upsert`` - overwrite the existing book with the fields given in the row;
+        * ``report`` - leave the existing book untouched and list the row in `errors`.
+
+        Args:
+            records (Iterable[Tuple[int, Union[Dict[str, Any], str]]]): Record number and
+                record pairs, as produced by `iter_book_records`. A string record is
+                parsed as JSON.
+            batch_size (int): Number of rows written per statement and per commit.
+            on_conflict (str): One of IMPORT_CONFLICT_POLICIES.
+
+        Returns:
+            BookImportReport: Counters and the per-row error report.
+
+        Raises:
+            ValueError: If the conflict policy is unknown.
+        """
+        if on_conflict not in IMPORT_CONFLICT_POLICIES:
+            raise ValueError(f"Unsupported conflict policy: {on_conflict}")
+
+        report = BookImportReport()
+        batch: List[Tuple[int, BookCreate]] = []
+        for row, record in records:
+            try:
+                if isinstance(record, str):
+                    book = BookCreate.model_validate_json(record)
+                else:
+                    book = BookCreate.model_validate(record)
+            except ValidationError as e:
+                isbn = record.get("isbn") if isinstance(record, dict) else None
+                self._report_import_error(report, row, None if isbn is None else str(isbn), "; ".join(
+                    f"{'.'.join(map(str, error['loc'])) or 'record'}: {error['msg']}" for error in e.errors()
+                ))
+                continue
+
+            batch.append((row, book))
+            if len(batch) >= batch_size:
+                self._import_batch(batch, on_conflict, report)
+                batch = []
+
+        if batch:
+            self._import_batch(batch, on_conflict, report)
+        return report
+
+    def _import_batch(self, batch: List[Tuple[int, BookCreate]], on_conflict: str, report: BookImportReport) -> None:
+        """
+        Write one batch of validated books in a single transaction.
+
+        Args:
+            batch (List[Tuple[int, BookCreate]]): Record numbers and validated books.
+            on_conflict (str): One of IMPORT_CONFLICT_POLICIES.
+            report (BookImportReport): Report updated once the batch is committed.
+        """
+        table = Book.__table__
+        pending: Dict[str, Tuple[int, BookCreate]] = {}
+        conflicts: List[Tuple[int, BookCreate]] = []
+        for row, book in batch:
+            if book.isbn in pending:
+                conflicts.append((row, book))
+            else:
+                pending[book.isbn] = (row, book)
+
+        try:
+            existing = set(self.db.execute(select(table.c.isbn).where(table.c.isbn.in_(list(pending)))).scalars())
+            for isbn in existing:
+                conflicts.append(pending.pop(isbn))
+
+            inserted: Set[str] = set()
+            if pending:
+                inserted = self._insert_books([book.model_dump() for _, book in pending.values()])
+                conflicts.extend(entry for isbn, entry in pending.items() if isbn not in inserted)
+
+            updated_ids: List[int] = []
+            if conflicts and on_conflict == "upsert":
+                updated_ids = self._upsert_books([book for _, book in conflicts])
+
+            if inserted or updated_ids:
+                # Stamped last so the catalog counter is only locked for the stamp and the commit.
+                ChangeCounterCRUD(self.db).stamp(
+                    BOOKS_COUNTER, table, table.c.isbn.in_(inserted) | table.c.id.in_(updated_ids)
+                )
+            self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            for row, book in batch:
+                self._report_import_error(report, row, book.isbn, f"Failed to import book: {str(e)}")
+            return
+
+        if updated_ids:
+            invalidate_book(*updated_ids)
+        report.inserted += len(inserted)
+        report.updated += len(updated_ids)
+        if on_conflict == "skip":
+            report.skipped += len(conflicts)
+        elif on_conflict == "report":
+            for row, book in sorted(conflicts, key=lambda entry: entry[0]):
+                self._report_import_error(report, row, book.isbn, "Book with this ISBN already exists")
+
+    def _insert_books(self, rows: List[Dict[str, Any]]) -> Set[str]:
+        """
+        Insert new books with one executemany statement.
+
+        On SQLite and PostgreSQL the insert skips ISBNs that were created concurrently
+        (ON CONFLICT DO NOTHING) and returns the ISBNs it actually wrote.
+
+        Args:
+            rows (List[Dict[str, Any]]): Column values of the books to insert.
+
+        Returns:
+            Set[str]: ISBNs of the inserted books.
+        """
+        table = Book.__table__
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite":
+            statement = sqlite.insert(table).on_conflict_do_nothing(index_elements=["isbn"])
+        elif dialect == "postgresql":
+            statement = postgresql.insert(table).on_conflict_do_nothing(index_elements=["isbn"])
+        else:
+            self.db.execute(insert(table), rows)
+            return {row["isbn"] for row in rows}
+
+        return set(self.db.execute(statement.returning(table.c.isbn), rows).scalars())
+
+    def _upsert_books(self, books: List[BookCreate]) -> List[int]:
+        """
+        Overwrite existing books, matched by ISBN, with the fields given for them.
+
+        Rows are grouped by the set of fields they carry so that each group is a
+        single executemany UPDATE.
+
+        Args:
+            books (List[BookCreate]): Books to write, in file order.
+
+        Returns:
+            List[int]: IDs of the updated books, one per given book.
+        """
+        table = Book.__table__
+        ids = dict(self.db.execute(
+            select(table.c.isbn, table.c.id).where(table.c.isbn.in_({book.isbn for book in books}))
+        ).all())
+
+        groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        for book in books:
+            data = book.model_dump(exclude_unset=True)
+            groups.setdefault(tuple(sorted(data)), []).append({"book_id": ids[book.isbn], **data})
+
+        statement = update(table).where(table.c.id == bindparam("book_id"))
+        for params in groups.values():
+            self.db.execute(statement, params)
+        return [ids[book.isbn] for book in books]
+
+    @staticmethod
+    def _report_import_error(report: BookImportReport, row: int, isbn: Optional[str], error: str) -> None:
+        """
+        Record a rejected row in an import report.
+
+        Args:
+            report (BookImportReport): Report to update.
+            row (int): 1-based record number.
+            isbn (Optional[str]): ISBN of the record, if known.
+            error (str): Reason the row was rejected.
+        """
+        report.failed += 1
+        report.errors.append(BookImportError(row=row, isbn=isbn, error=error))
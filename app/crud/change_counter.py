@@ -0,0 +1,131 @@
+from typing import Optional
+from sqlalchemy import ColumnElement, Row, Table, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from ..models.change_counter import ChangeCounter
+
+
+class ChangeCounterCRUD:
+    """
+    Operations on the monotonically increasing change counters.
+
+    No method commits: a bump belongs to the transaction that makes the
+    change it versions, so the new version becomes visible together with it.
+
+    A bump locks the counter row until the transaction ends, which is what keeps
+    versions in commit order for the sync feed (see `SyncCRUD`) but also means
+    all writers of one counter queue behind each other from their bump to their
+    commit. A sequence would avoid the queue but hand out versions that commit
+    out of order, letting a sync skip a change. Writes therefore bump last:
+    they change their rows first and then `stamp` (or `stamp_row`) them right
+    before the commit, so the lock is held for one UPDATE and the commit.
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the CRUD with a database session.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+        """
+        self.db = db
+
+    def bump(self, name: str) -> int:
+        """
+        Increment a counter and return its new value.
+
+        The increment is a single `UPDATE ... SET value = value + 1`, with RETURNING
+        where the backend supports it. The row stays locked until the caller's
+        transaction ends, so versions are handed out in commit order; bump as
+        close to the commit as possible.
+
+        Args:
+            name (str): Counter name.
+
+        Returns:
+            int: The new version.
+        """
+        statement = (
+            update(ChangeCounter)
+            .where(ChangeCounter.name == name)
+            .values(value=ChangeCounter.value + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.get_bind().dialect.update_returning:
+            value = self.db.execute(statement.returning(ChangeCounter.value)).scalar()
+        else:
+            value = self.current(name) if self.db.execute(statement).rowcount else None
+        if value is not None:
+            return value
+
+        try:
+            with self.db.begin_nested():
+                self.db.execute(insert(ChangeCounter).values(name=name, value=1))
+            return 1
+        except IntegrityError:
+            return self.bump(name)
+
+    def stamp(self, name: str, table: Table, condition: ColumnElement[bool]) -> int:
+        """
+        Bump a counter and write the new version onto rows the transaction changed.
+
+        Call it after every other write of the transaction, right before the
+        commit, so the counter row is only locked for the stamp and the commit.
+        The stamped rows are already locked by the transaction, so the extra
+        UPDATE does not wait for other writers.
+
+        Args:
+            name (str): Counter name.
+            table (Table): Versioned table, e.g. `Book.__table__`.
+            condition (ColumnElement[bool]): Selects the changed rows, e.g. `table.c.id.in_(ids)`.
+
+        Returns:
+            int: The new version.
+        """
+        version = self.bump(name)
+        self.db.execute(
+            update(table)
+            .where(condition)
+            .values(version=version)
+            .execution_options(synchronize_session=False)
+        )
+        return version
+
+    def stamp_row(self, name: str, table: Table, row_id: int) -> Optional[Row]:
+        """
+        Stamp one changed row like `stamp` and return it with its new version.
+
+        The row comes back from the stamping UPDATE through RETURNING where the
+        backend supports it, and is selected again otherwise.
+
+        Args:
+            name (str): Counter name.
+            table (Table): Versioned table, e.g. `Book.__table__`.
+            row_id (int): Primary key of the changed row.
+
+        Returns:
+            Optional[Row]: All columns of the row, or None if it does not exist.
+        """
+        statement = (
+            update(table)
+            .where(table.c.id == row_id)
+            .values(version=self.bump(name))
+            .execution_options(synchronize_session=False)
+        )
+        if self.db.get_bind().dialect.update_returning:
+            return self.db.execute(statement.returning(*table.c)).first()
+        self.db.execute(statement)
+        return self.db.execute(select(table).where(table.c.id == row_id)).first()
+
+    def current(self, name: str) -> int:
+        """
+        Return the current value of a counter.
+
+        Args:
+            name (str): Counter name.
+
+        Returns:
+            int: Last version handed out; 0 if the counter was never bumped.
+        """
+        value = self.db.execute(select(ChangeCounter.value).where(ChangeCounter.name == name)).scalar()
+        return value or 0
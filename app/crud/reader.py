@@ -1,12 +1,26 @@
-from typing import Dict, Optional, List, Any
+from collections import Counter, defaultdict
+from typing import Dict, Optional, List, Any, Sequence, Tuple, Union
+from sqlalchemy import Row
+from sqlalchemy import Update, func, insert, select, update
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException
 from datetime import datetime, timezone
+from ..config import Settings
+from ..core.pagination import encode_cursor, decode_cursor
+from ..core.projection import fetch_all, select_entity
+from ..schemas.borrowed_books import CartItemResult, CartOperation
 from ..schemas.reader import ReaderCreate
 from ..models.reader import Reader
 from ..models.borrowed_books import BorrowedBooks
 from ..models.book import Book
+from ..models.tombstone import Tombstone
+from .book import BOOKS_COUNTER, invalidate_book
+from .change_counter import ChangeCounterCRUD
+
+
+# Change counter versioning the readers; every write to `readers` bumps it.
+READERS_COUNTER = "readers"
 
 
 class ReaderCRUD:
@@ -38,6 +52,8 @@ class ReaderCRUD:
         try:
             db_reader = Reader(**reader.model_dump())
             self.db.add(db_reader)
+            self.db.flush()
+            ChangeCounterCRUD(self.db).stamp(READERS_COUNTER, Reader.__table__, Reader.id == db_reader.id)
             self.db.commit()
             self.db.refresh(db_reader)
             return db_reader
@@ -48,23 +64,30 @@ class ReaderCRUD:
             self.db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to create reader: {str(e)}")
 
-    def get_by_id(self, reader_id: int) -> Optional[Reader]:
+    def get_by_id(self, reader_id: int, fields: Optional[Sequence[str]] = None) -> Optional[Union[Reader, Row]]:
         """
         Retrieve a reader by their ID.
 
         Args:
             reader_id (int): Reader's unique identifier.
+            fields (Optional[Sequence[str]]): Columns to load as a plain row (see
+                `select_entity`); an ORM object is returned if None.
 
         Returns:
-            Optional[Reader]: Reader object if found, otherwise None.
+            Optional[Union[Reader, Row]]: Reader if found, otherwise None.
 
         Raises:
-            HTTPException: If the reader ID is invalid.
+            HTTPException: If the reader ID or a field is invalid.
         """
         if not isinstance(reader_id, int) or reader_id <= 0:
             raise HTTPException(status_code=400, detail="Invalid reader ID")
 
-        return self.db.query(Reader).filter(Reader.id == reader_id).first()
+        try:
+            statement = select_entity(Reader, fields).where(Reader.id == reader_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        readers = fetch_all(self.db, statement, fields)
+        return readers[0] if readers else None
 
     def get_by_email(self, email: str) -> Optional[Reader]:
         """
@@ -102,50 +125,72 @@ class ReaderCRUD:
 
         return self.db.query(Reader).filter(Reader.name == username).first()
 
-    def get_all(self) -> Dict[int, Reader]:
+    def get_all(self, fields: Optional[Sequence[str]] = None) -> Dict[int, Union[Reader, Row]]:
         """
         Retrieve all readers from the database.
 
+        Args:
+            fields (Optional[Sequence[str]]): Columns to load as plain rows (see
+                `select_entity`); ORM objects are returned if None.
+
         Returns:
-            Dict[int, Reader]: Dictionary mapping reader IDs to Reader objects.
+            Dict[int, Union[Reader, Row]]: Dictionary mapping reader IDs to readers.
 
         Raises:
-            HTTPException: If a database error occurs.
+            HTTPException: If a field is invalid or a database error occurs.
         """
         try:
-            return {reader.id: reader for reader in self.db.query(Reader).all()}
+            statement = select_entity(Reader, fields)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            return {reader.id: reader for reader in fetch_all(self.db, statement, fields)}
         except SQLAlchemyError as e:
             raise HTTPException(status_code=500, detail=f"Failed to retrieve readers: {str(e)}")
 
-    def update(self, reader_id: int, reader_update: ReaderCreate) -> Optional[Reader]:
+    def update(self, reader_id: int, reader_update: ReaderCreate, expected_version: Optional[int] = None) -> Row:
         """
         Update an existing reader's information.
 
+        The write is a guarded `UPDATE ... WHERE id = ? [AND version = ?]`, so a
+        concurrent edit cannot be silently overwritten and no row lock is held
+        across round trips. Only once it matched is the reader stamped with a new
+        version, which returns the new row (RETURNING where the backend supports it).
+
         Args:
             reader_id (int): ID of the reader to update.
             reader_update (ReaderCreate): Updated reader data.
+            expected_version (Optional[int]): Version the caller last saw; the update
+                only applies if the reader is still at it. Unconditional if None.
 
         Returns:
-            Optional[Reader]: Updated Reader object if successful.
+            Row: Updated reader.
 
         Raises:
-            HTTPException: If the reader does not exist, or if an update fails.
+            HTTPException: 404 if the reader does not exist, 412 if it changed since
+                `expected_version`, 400 if the email is taken, or 500 if the update fails.
         """
         if not isinstance(reader_id, int) or reader_id <= 0:
             raise HTTPException(status_code=400, detail="Invalid reader ID")
 
-        try:
-            db_reader = self.get_by_id(reader_id)
-            if not db_reader:
-                raise HTTPException(status_code=404, detail="Reader not found")
+        table = Reader.__table__
+        conditions = [table.c.id == reader_id]
+        if expected_version is not None:
+            conditions.append(table.c.version == expected_version)
 
-            update_data = reader_update.model_dump(exclude_unset=True)
-            for key, value in update_data.items():
-                setattr(db_reader, key, value)
+        try:
+            matched = self._apply_guarded_update(
+                update(table).where(*conditions).values(reader_update.model_dump(exclude_unset=True))
+            )
+            if not matched:
+                self.db.rollback()
+                if self.db.execute(select(table.c.id).where(table.c.id == reader_id)).first() is None:
+                    raise HTTPException(status_code=404, detail="Reader not found")
+                raise HTTPException(status_code=412, detail="Reader was changed by someone else; reload it and retry")
 
+            updated = ChangeCounterCRUD(self.db).stamp_row(READERS_COUNTER, table, reader_id)
             self.db.commit()
-            self.db.refresh(db_reader)
-            return db_reader
+            return updated
         except IntegrityError:
             self.db.rollback()
             raise HTTPException(status_code=400, detail="Email already in use")
@@ -155,7 +200,7 @@ class ReaderCRUD:
 
     def delete(self, reader_id: int) -> bool:
         """
-        Delete a reader by ID.
+        Delete a reader by ID, leaving a tombstone for the sync change feed.
 
         Args:
             reader_id (int): Reader's ID.
@@ -171,6 +216,11 @@ class ReaderCRUD:
 
         try:
             deleted = self.db.query(Reader).filter(Reader.id == reader_id).delete()
+            if deleted:
+                tombstone = self.db.execute(insert(Tombstone).values(entity=READERS_COUNTER, entity_id=reader_id, version=0))
+                ChangeCounterCRUD(self.db).stamp(
+                    READERS_COUNTER, Tombstone.__table__, Tombstone.id == tombstone.inserted_primary_key[0]
+                )
             self.db.commit()
             return bool(deleted)
         except SQLAlchemyError as e:
@@ -189,10 +239,58 @@ class ReaderCRUD:
         """
         return self.db.query(BorrowedBooks).filter(BorrowedBooks.reader_id == reader_id).first() is not None
 
+    def _apply_guarded_update(self, statement: Update) -> bool:
+        """
+        Execute a conditional UPDATE that is expected to touch exactly one row.
+
+        The guard lives in the WHERE clause, so the check and the write happen
+        atomically in the database. RETURNING is used where the backend supports it,
+        otherwise the driver's row count decides.
+
+        Args:
+            statement (Update): UPDATE statement with its guard conditions.
+
+        Returns:
+            bool: True if the row matched the guard and was updated.
+        """
+        statement = statement.execution_options(synchronize_session=False)
+        if self.db.get_bind().dialect.update_returning:
+            table = statement.table
+            return self.db.execute(statement.returning(table.c.id)).first() is not None
+        return self.db.execute(statement).rowcount == 1
+
+    def _stamp_versions(self, reader_ids: Sequence[int], book_ids: Sequence[int]) -> None:
+        """
+        Give the changed readers and books new versions; the last writes before the commit.
+
+        Bumping here rather than alongside the guarded updates keeps the change
+        counters locked only for the stamp and the commit, so concurrent loans
+        queue on them for as short as possible. Readers are stamped before books,
+        in the same order everywhere, so the counter locks cannot deadlock.
+
+        Args:
+            reader_ids (Sequence[int]): Readers changed by the transaction.
+            book_ids (Sequence[int]): Books changed by the transaction.
+        """
+        counters = ChangeCounterCRUD(self.db)
+        if reader_ids:
+            counters.stamp(READERS_COUNTER, Reader.__table__, Reader.id.in_(reader_ids))
+        if book_ids:
+            counters.stamp(BOOKS_COUNTER, Book.__table__, Book.id.in_(book_ids))
+
     def borrow_book(self, reader_id: int, book_id: int) -> bool:
         """
         Register a book borrowing for the reader.
 
+        Both limits are enforced by guarded UPDATEs in one transaction: the reader's
+        `active_loans` counter is incremented only while it is below the borrowing
+        limit, and the available copy is taken with
+        `UPDATE books SET copies_available = copies_available - 1 WHERE id = ? AND copies_available > 0`.
+        Concurrent checkouts can therefore neither oversell a book nor push a reader
+        over the limit, and the happy path needs no SELECT at all. When a guard
+        fails, the rows are looked up to report the first error in the original
+        order: unknown reader, unknown book, no copies left, borrowing limit.
+
         Args:
             reader_id (int): Reader's ID.
             book_id (int): Book's ID.
@@ -202,35 +300,47 @@ class ReaderCRUD:
 
         Raises:
             HTTPException: If reader or book not found, borrowing limit exceeded,
-                           or the book is already borrowed.
+                           or no copies of the book are available.
         """
         try:
-            reader = self.get_by_id(reader_id)
-            if not reader:
-                raise HTTPException(status_code=404, detail="Reader not found")
-
-            book = self.db.query(Book).filter(Book.id == book_id).first()
-            if not book:
-                raise HTTPException(status_code=404, detail="Book not found")
-            if book.copies_available <= 0:
+            slot_taken = self._apply_guarded_update(
+                update(Reader)
+                .where(Reader.id == reader_id, Reader.active_loans < Settings.MAX_ACTIVE_LOANS)
+                .values(active_loans=Reader.active_loans + 1)
+            )
+            if not slot_taken:
+                self.db.rollback()
+                if not self.get_by_id(reader_id):
+                    raise HTTPException(status_code=404, detail="Reader not found")
+                copies = self.db.scalar(select(Book.copies_available).where(Book.id == book_id))
+                if copies is None:
+                    raise HTTPException(status_code=404, detail="Book not found")
+                if copies <= 0:
+                    raise HTTPException(status_code=400, detail="No available copies of the book")
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Reader has reached the borrowing limit of {Settings.MAX_ACTIVE_LOANS} books"
+                )
+
+            copy_taken = self._apply_guarded_update(
+                update(Book)
+                .where(Book.id == book_id, Book.copies_available > 0)
+                .values(copies_available=Book.copies_available - 1)
+            )
+            if not copy_taken:
+                self.db.rollback()
+                if self.db.query(Book.id).filter(Book.id == book_id).first() is None:
+                    raise HTTPException(status_code=404, detail="Book not found")
                 raise HTTPException(status_code=400, detail="No available copies of the book")
 
-            current_borrows = self.db.query(BorrowedBooks).filter(
-                BorrowedBooks.reader_id == reader_id,
-                BorrowedBooks.date_returned.is_(None)
-            ).count()
-            if current_borrows >= 3:
-                raise HTTPException(status_code=400, detail="Reader has reached the borrowing limit of 3 books")
-
-            borrow_record = BorrowedBooks(
+            self.db.execute(insert(BorrowedBooks).values(
                 reader_id=reader_id,
                 book_id=book_id,
                 date_borrowed=datetime.now(tz=timezone.utc)
-            )
-            book.copies_available -= 1
-
-            self.db.add(borrow_record)
+            ))
+            self._stamp_versions([reader_id], [book_id])
             self.db.commit()
+            invalidate_book(book_id)
             return True
         except IntegrityError:
             self.db.rollback()
@@ -243,6 +353,13 @@ class ReaderCRUD:
         """
         Process the return of a previously borrowed book.
 
+        The open loan is closed with a guarded UPDATE (`date_returned IS NULL`), then
+        the reader's loan slot and the copy are given back with relative updates,
+        so two concurrent returns of the same loan cannot both succeed. Readers are
+        written before books, in the same order as `borrow_book`, so concurrent
+        borrows and returns cannot deadlock on the rows or the change counters.
+        Like every loan write, the new versions are stamped last (see `_stamp_versions`).
+
         Args:
             reader_id (int): Reader's ID.
             book_id (int): Book's ID.
@@ -254,45 +371,324 @@ class ReaderCRUD:
             HTTPException: If reader/book not found, or book was not borrowed.
         """
         try:
-            reader = self.get_by_id(reader_id)
-            if not reader:
-                raise HTTPException(status_code=404, detail="Reader not found")
-
-            book = self.db.query(Book).filter(Book.id == book_id).first()
-            if not book:
-                raise HTTPException(status_code=404, detail="Book not found")
-
-            borrow_record = self.db.query(BorrowedBooks).filter(
+            open_loan = select(BorrowedBooks.id).where(
                 BorrowedBooks.reader_id == reader_id,
                 BorrowedBooks.book_id == book_id,
                 BorrowedBooks.date_returned.is_(None)
-            ).first()
-            if not borrow_record:
+            ).limit(1).scalar_subquery()
+            loan_closed = self._apply_guarded_update(
+                update(BorrowedBooks)
+                .where(BorrowedBooks.id == open_loan, BorrowedBooks.date_returned.is_(None))
+                .values(date_returned=datetime.now(tz=timezone.utc))
+            )
+            if not loan_closed:
+                self.db.rollback()
+                if not self.get_by_id(reader_id):
+                    raise HTTPException(status_code=404, detail="Reader not found")
+                if self.db.query(Book.id).filter(Book.id == book_id).first() is None:
+                    raise HTTPException(status_code=404, detail="Book not found")
                 raise HTTPException(status_code=400, detail="Book was not borrowed by this reader or already returned")
 
-            borrow_record.date_returned = datetime.now(tz=timezone.utc)
-            book.copies_available += 1
-
+            self.db.execute(
+                update(Reader)
+                .where(Reader.id == reader_id, Reader.active_loans > 0)
+                .values(active_loans=Reader.active_loans - 1)
+                .execution_options(synchronize_session=False)
+            )
+            self.db.execute(
+                update(Book)
+                .where(Book.id == book_id)
+                .values(copies_available=Book.copies_available + 1)
+                .execution_options(synchronize_session=False)
+            )
+            self._stamp_versions([reader_id], [book_id])
             self.db.commit()
+            invalidate_book(book_id)
             return True
         except SQLAlchemyError as e:
             self.db.rollback()
             raise HTTPException(status_code=500, detail=f"Failed to return book: {str(e)}")
 
-    def get_borrowed_books(self, reader_id: int) -> List[Dict[str, Any]]:
+    def process_cart(self, operations: List[CartOperation]) -> List[CartItemResult]:
+        """
+        Apply a batch of borrow/return operations in a single transaction.
+
+        The current state of every reader, book and open loan involved is loaded
+        with three set-based queries. The operations are then validated in order
+        against that state: a return earlier in the cart frees a copy and a loan
+        slot for a later borrow. Valid operations are written with one guarded
+        UPDATE per distinct reader and book, one UPDATE closing the returned loans
+        and one multi-row INSERT of the new loans. A return of a book borrowed
+        earlier in the same cart cancels that loan. Invalid operations are
+        reported and skipped.
+
+        Args:
+            operations (List[CartOperation]): Operations in the order they should be applied.
+
+        Returns:
+            List[CartItemResult]: Outcome of every operation, in request order.
+
+        Raises:
+            HTTPException: 409 if a reader or book changed concurrently and a guard
+                           failed (nothing is applied), 500 on database errors.
+        """
+        reader_ids = {operation.reader_id for operation in operations}
+        book_ids = {operation.book_id for operation in operations}
+        returns = [operation for operation in operations if operation.action == "return"]
+
+        try:
+            active_loans = dict(self.db.execute(
+                select(Reader.id, Reader.active_loans).where(Reader.id.in_(reader_ids))
+            ).all())
+            copies = dict(self.db.execute(
+                select(Book.id, Book.copies_available).where(Book.id.in_(book_ids))
+            ).all())
+            open_loans: Dict[Tuple[int, int], List[int]] = defaultdict(list)
+            if returns:
+                rows = self.db.execute(
+                    select(BorrowedBooks.id, BorrowedBooks.reader_id, BorrowedBooks.book_id)
+                    .where(
+                        BorrowedBooks.reader_id.in_({operation.reader_id for operation in returns}),
+                        BorrowedBooks.book_id.in_({operation.book_id for operation in returns}),
+                        BorrowedBooks.date_returned.is_(None)
+                    )
+                    .order_by(BorrowedBooks.id)
+                )
+                for loan_id, reader_id, book_id in rows:
+                    open_loans[(reader_id, book_id)].append(loan_id)
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Failed to process cart: {str(e)}")
+
+        results: List[CartItemResult] = []
+        reader_deltas: Counter = Counter()
+        book_deltas: Counter = Counter()
+        new_loans: List[Dict[str, Any]] = []
+        pending_loans: Dict[Tuple[int, int], List[Dict[str, Any]]] = defaultdict(list)
+        closed_loans: List[int] = []
+        now = datetime.now(tz=timezone.utc)
+
+        for operation in operations:
+            reader_id, book_id = operation.reader_id, operation.book_id
+            detail = None
+            if reader_id not in active_loans:
+                detail = "Reader not found"
+            elif book_id not in copies:
+                detail = "Book not found"
+            elif operation.action == "borrow":
+                if copies[book_id] <= 0:
+                    detail = "No available copies of the book"
+                elif active_loans[reader_id] >= Settings.MAX_ACTIVE_LOANS:
+                    detail = f"Reader has reached the borrowing limit of {Settings.MAX_ACTIVE_LOANS} books"
+                else:
+                    active_loans[reader_id] += 1
+                    copies[book_id] -= 1
+                    reader_deltas[reader_id] += 1
+                    book_deltas[book_id] -= 1
+                    loan = {"reader_id": reader_id, "book_id": book_id, "date_borrowed": now}
+                    new_loans.append(loan)
+                    pending_loans[(reader_id, book_id)].append(loan)
+            elif open_loans[(reader_id, book_id)]:
+                closed_loans.append(open_loans[(reader_id, book_id)].pop(0))
+            elif pending_loans[(reader_id, book_id)]:
+                new_loans.remove(pending_loans[(reader_id, book_id)].pop())
+            else:
+                detail = "Book was not borrowed by this reader or already returned"
+
+            if operation.action == "return" and detail is None:
+                active_loans[reader_id] -= 1
+                copies[book_id] += 1
+                reader_deltas[reader_id] -= 1
+                book_deltas[book_id] += 1
+
+            results.append(CartItemResult(
+                action=operation.action,
+                reader_id=reader_id,
+                book_id=book_id,
+                success=detail is None,
+                detail=detail
+            ))
+
+        if not new_loans and not closed_loans:
+            return results
+
+        try:
+            applied = True
+            for reader_id in sorted(reader_deltas):
+                delta = reader_deltas[reader_id]
+                if delta and applied:
+                    applied = self._apply_guarded_update(
+                        update(Reader)
+                        .where(
+                            Reader.id == reader_id,
+                            Reader.active_loans + delta >= 0,
+                            Reader.active_loans + delta <= Settings.MAX_ACTIVE_LOANS
+                        )
+                        .values(active_loans=Reader.active_loans + delta)
+                    )
+            for book_id in sorted(book_deltas):
+                delta = book_deltas[book_id]
+                if delta and applied:
+                    applied = self._apply_guarded_update(
+                        update(Book)
+                        .where(Book.id == book_id, Book.copies_available + delta >= 0)
+                        .values(copies_available=Book.copies_available + delta)
+                    )
+            if applied and closed_loans:
+                closed = self.db.execute(
+                    update(BorrowedBooks)
+                    .where(BorrowedBooks.id.in_(closed_loans), BorrowedBooks.date_returned.is_(None))
+                    .values(date_returned=now)
+                    .execution_options(synchronize_session=False)
+                )
+                applied = closed.rowcount == len(closed_loans)
+
+            if not applied:
+                self.db.rollback()
+                raise HTTPException(status_code=409, detail="Readers or books changed concurrently, retry the cart")
+
+            if new_loans:
+                self.db.execute(insert(BorrowedBooks), new_loans)
+            self._stamp_versions(
+                [reader_id for reader_id, delta in reader_deltas.items() if delta],
+                [book_id for book_id, delta in book_deltas.items() if delta]
+            )
+            self.db.commit()
+            invalidate_book(*(book_id for book_id, delta in book_deltas.items() if delta))
+            return results
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to process cart: {str(e)}")
+
+    def reconcile_active_loans(self) -> int:
+        """
+        Rebuild every reader's `active_loans` counter from the `borrowed_books` table.
+
+        Only readers whose counter has drifted are updated, and they get a new
+        version so the correction reaches the sync feed and the reader ETags.
+        Run it while the library is idle, since borrows committed during the
+        update may be counted against a stale snapshot.
+
+        Returns:
+            int: Number of readers whose counter was corrected.
+
+        Raises:
+            HTTPException: If a database error occurs.
+        """
+        try:
+            open_loans = select(func.count(BorrowedBooks.id)).where(
+                BorrowedBooks.reader_id == Reader.id,
+                BorrowedBooks.date_returned.is_(None)
+            ).scalar_subquery()
+            drifted = Reader.active_loans != open_loans
+            statement = (
+                update(Reader)
+                .values(active_loans=open_loans)
+                .execution_options(synchronize_session=False)
+            )
+            if self.db.get_bind().dialect.update_returning:
+                reader_ids = list(self.db.scalars(statement.where(drifted).returning(Reader.id)))
+            else:
+                reader_ids = list(self.db.scalars(select(Reader.id).where(drifted)))
+                if reader_ids:
+                    self.db.execute(statement.where(Reader.id.in_(reader_ids)))
+            self._stamp_versions(reader_ids, [])
+            self.db.commit()
+            return len(reader_ids)
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise HTTPException(status_code=500, detail=f"Failed to reconcile active loans: {str(e)}")
+
+    def get_borrowed_books(self, reader_id: int, fields: Optional[Sequence[str]] = None) -> List[Union[BorrowedBooks, Row]]:
         """
         Get a list of books borrowed by the reader.
 
         Args:
             reader_id (int): Reader's ID.
+            fields (Optional[Sequence[str]]): Loan columns to load as plain rows (see
+                `select_entity`); ORM objects are returned if None.
 
         Returns:
-            List[Dict[str, Any]]: List of borrowed book records.
+            List[Union[BorrowedBooks, Row]]: List of borrowed book records.
 
         Raises:
-            HTTPException: If a database error occurs.
+            HTTPException: If a field is invalid or a database error occurs.
         """
         try:
-            return self.db.query(BorrowedBooks).filter(BorrowedBooks.reader_id == reader_id).all()
+            statement = select_entity(BorrowedBooks, fields).where(BorrowedBooks.reader_id == reader_id)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        try:
+            return fetch_all(self.db, statement, fields)
         except SQLAlchemyError as e:
             raise HTTPException(status_code=500, detail=f"Failed to retrieve borrowed books: {str(e)}")
+
+    def get_loan_history(
+        self,
+        reader_id: int,
+        limit: int,
+        after: Optional[str] = None,
+        active: Optional[bool] = None,
+        borrowed_from: Optional[datetime] = None,
+        borrowed_to: Optional[datetime] = None
+    ) -> Tuple[List[Row], Optional[str]]:
+        """
+        Get one page of a reader's loan history, newest first, with book details.
+
+        The page is a single query: loans are joined with `books` to inline the
+        title and author, and keyset pagination on the loan ID walks the
+        (reader_id, id) index, so a reader with thousands of loans costs one
+        bounded query per page.
+
+        Args:
+            reader_id (int): Reader's ID.
+            limit (int): Maximum number of loans to return.
+            after (Optional[str]): Cursor returned with the previous page, if any.
+            active (Optional[bool]): True for open loans only, False for returned loans only.
+            borrowed_from (Optional[datetime]): Only loans borrowed at or after this moment.
+            borrowed_to (Optional[datetime]): Only loans borrowed before this moment.
+
+        Returns:
+            Tuple[List[Row], Optional[str]]: Loan rows (id, book_id, title, author,
+            date_borrowed, date_returned) and the cursor of the next page, or None
+            if this is the last page.
+
+        Raises:
+            HTTPException: If the cursor is invalid or a database error occurs.
+        """
+        query = (
+            select(
+                BorrowedBooks.id,
+                BorrowedBooks.book_id,
+                Book.title,
+                Book.author,
+                BorrowedBooks.date_borrowed,
+                BorrowedBooks.date_returned
+            )
+            .outerjoin(Book, Book.id == BorrowedBooks.book_id)
+            .where(BorrowedBooks.reader_id == reader_id)
+        )
+        if active is True:
+            query = query.where(BorrowedBooks.date_returned.is_(None))
+        elif active is False:
+            query = query.where(BorrowedBooks.date_returned.is_not(None))
+        if borrowed_from is not None:
+            query = query.where(BorrowedBooks.date_borrowed >= borrowed_from)
+        if borrowed_to is not None:
+            query = query.where(BorrowedBooks.date_borrowed < borrowed_to)
+        if after:
+            try:
+                (last_id,) = decode_cursor(after, 1, types=[(int,)])
+            except ValueError as e:
+                raise HTTPException(status_code=400, detail=str(e))
+            query = query.where(BorrowedBooks.id < last_id)
+
+        try:
+            loans = self.db.execute(query.order_by(BorrowedBooks.id.desc()).limit(limit + 1)).all()
+        except SQLAlchemyError as e:
+            raise HTTPException(status_code=500, detail=f"Failed to retrieve loan history: {str(e)}")
+
+        next_cursor = None
+        if len(loans) > limit:
+            loans = loans[:limit]
+            next_cursor = encode_cursor([loans[-1].id])
+        return loans, next_cursor
@@ -1,13 +1,67 @@
-from typing import Dict, Any, Optional
+import hashlib
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional
+from sqlalchemy import delete, insert, select
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
 from ..models.refresh_token import RefreshToken
 
 
+def hash_token(refresh_token: str) -> str:
+    """
+    Compute the digest under which a refresh token is stored.
+
+    Args:
+        refresh_token (str): The token string.
+
+    Returns:
+        str: SHA-256 hex digest of the token.
+    """
+    return hashlib.sha256(refresh_token.encode()).hexdigest()
+
+
+def utcnow() -> datetime:
+    """
+    Return the current time as naive UTC, the way `expires_at` is stored.
+
+    Returns:
+        datetime: Current UTC time without tzinfo.
+    """
+    return datetime.now(tz=timezone.utc).replace(tzinfo=None)
+
+
+def revoke_sessions(user_ids: Iterable[str]) -> None:
+    """
+    Drop users whose refresh tokens were revoked from the principal cache.
+
+    Access tokens are bound to the refresh token they were issued with (their
+    `sid` claim), so once the cached principal is reloaded without that token
+    they are rejected. Call it after the transaction that removed the tokens has
+    been committed.
+
+    Only the cache of the current process is cleared, so the revocation is
+    immediate within this process alone. Other worker processes keep serving
+    their cached entry, and accepting the revoked access tokens, until it
+    expires after `PRINCIPAL_CACHE_TTL_SECONDS`.
+
+    Args:
+        user_ids (Iterable[str]): Subjects (emails) whose tokens were revoked.
+    """
+    from ..core.security import invalidate_principal
+
+    for user_id in set(user_ids):
+        invalidate_principal(user_id)
+
+
 class RefreshTokenCRUD:
     """
     CRUD operations for the RefreshToken model.
-    Handles creation, retrieval, and deletion of refresh tokens.
+    Handles issuing, rotation, retrieval, deletion and purging of refresh tokens.
+
+    A user holds at most one refresh token: issuing or rotating a token revokes
+    every other token of the same user in the same transaction. Every path that
+    removes tokens evicts their owners from this process's principal cache once
+    committed, so access tokens of a revoked session stop working at once in
+    this process, and in other processes when their cache entry expires.
     """
 
     def __init__(self, db: Session):
@@ -19,39 +73,64 @@ class RefreshTokenCRUD:
         """
         self.database: Session = db
 
-    def create(self, refresh_token: Dict[str, Any]) -> Optional[RefreshToken]:
+    def issue(self, user_id: str, refresh_token: str, expires_at: datetime) -> None:
         """
-        Create a new refresh token. If a token with the same value already exists, it will be replaced.
+        Store a new refresh token for a user, revoking the user's previous tokens, in one commit.
 
         Args:
-            refresh_token (Dict[str, Any]): Dictionary with refresh token data.
-
-        Returns:
-            Optional[RefreshToken]: The newly created RefreshToken object.
+            user_id (str): Subject (email) of the user.
+            refresh_token (str): The new token string.
+            expires_at (datetime): Expiration time of the new token.
 
         Raises:
-            ValueError: If a token with the same value already exists.
-            Exception: If another error occurs during the operation.
+            Exception: If the tokens could not be written.
         """
         try:
-            db_token = RefreshToken(**refresh_token)
+            self._replace_user_tokens(user_id, refresh_token, expires_at)
+            self.database.commit()
+        except Exception as e:
+            self.database.rollback()
+            raise Exception(f"Failed to create refresh token: {str(e)}")
+        revoke_sessions([user_id])
 
-            existing_token = self.get(refresh_token=refresh_token["token"])
-            if existing_token:
-                self.delete(existing_token.token)
+    def rotate(self, refresh_token: str, user_id: str, new_refresh_token: str, expires_at: datetime) -> bool:
+        """
+        Exchange a presented refresh token for a new one in a single transaction.
 
-            self.database.add(db_token)
-            self.database.commit()
-            self.database.refresh(db_token)
-            return db_token
+        The presented token is consumed by a guarded DELETE on its digest, owner and
+        expiry, so a token can be redeemed exactly once even by concurrent requests.
 
-        except IntegrityError:
-            self.database.rollback()
-            raise ValueError("Refresh token already exists")
+        Args:
+            refresh_token (str): The token presented by the client.
+            user_id (str): Subject (email) the presented token was issued to.
+            new_refresh_token (str): The replacement token string.
+            expires_at (datetime): Expiration time of the replacement token.
+
+        Raises:
+            Exception: If the tokens could not be written.
 
+        Returns:
+            bool: True if the token was valid and has been rotated, False otherwise.
+        """
+        try:
+            consumed = self.database.execute(
+                delete(RefreshToken).where(
+                    RefreshToken.token_hash == hash_token(refresh_token),
+                    RefreshToken.user_id == user_id,
+                    RefreshToken.expires_at > utcnow()
+                )
+            ).rowcount
+            if consumed != 1:
+                self.database.rollback()
+                return False
+
+            self._replace_user_tokens(user_id, new_refresh_token, expires_at)
+            self.database.commit()
         except Exception as e:
             self.database.rollback()
-            raise Exception(f"Failed to create refresh token: {str(e)}")
+            raise Exception(f"Failed to rotate refresh token: {str(e)}")
+        revoke_sessions([user_id])
+        return True
 
     def get(self, refresh_token: str = None, user_id: str = None) -> Optional[RefreshToken]:
         """
@@ -71,9 +150,10 @@ class RefreshTokenCRUD:
             raise ValueError("Either refresh_token or user_id must be provided")
 
         if refresh_token:
-            return self.database.query(RefreshToken).filter(RefreshToken.token == refresh_token).first()
-
-        return self.database.query(RefreshToken).filter(RefreshToken.user_id == user_id).first()
+            condition = RefreshToken.token_hash == hash_token(refresh_token)
+        else:
+            condition = RefreshToken.user_id == user_id
+        return self.database.scalars(select(RefreshToken).where(condition).limit(1)).first()
 
     def delete(self, refresh_token: str) -> bool:
         """
@@ -89,10 +169,76 @@ class RefreshTokenCRUD:
             Exception: If an error occurs during deletion.
         """
         try:
-            result = self.database.query(RefreshToken).filter(RefreshToken.token == refresh_token).delete()
+            owners = self._delete_tokens(RefreshToken.token_hash == hash_token(refresh_token))
             self.database.commit()
-            return result > 0
-
         except Exception as e:
             self.database.rollback()
             raise Exception(f"Failed to delete refresh token: {str(e)}")
+        revoke_sessions(owners)
+        return len(owners) > 0
+
+    def purge_expired(self, batch_size: int) -> int:
+        """
+        Delete expired refresh tokens in batches, committing after each batch.
+
+        Small batches keep each transaction and its locks short, so the purge can
+        run alongside logins and refreshes.
+
+        Args:
+            batch_size (int): Maximum number of tokens deleted per transaction.
+
+        Returns:
+            int: Number of tokens deleted.
+        """
+        now = utcnow()
+        expired = (
+            select(RefreshToken.id)
+            .where(RefreshToken.expires_at <= now)
+            .order_by(RefreshToken.expires_at)
+            .limit(batch_size)
+            .scalar_subquery()
+        )
+
+        purged = 0
+        while True:
+            owners = self._delete_tokens(RefreshToken.id.in_(expired))
+            self.database.commit()
+            revoke_sessions(owners)
+            purged += len(owners)
+            if len(owners) < batch_size:
+                return purged
+
+    def get_session_ids(self, user_id: str) -> List[str]:
+        """
+        Return the digests of a user's unexpired refresh tokens.
+
+        These identify the user's live sessions: an access token is only accepted
+        while the digest in its `sid` claim is one of them.
+
+        Args:
+            user_id (str): Subject (email) of the user.
+
+        Returns:
+            List[str]: Token digests; normally at most one.
+        """
+        return list(self.database.scalars(
+            select(RefreshToken.token_hash).where(RefreshToken.user_id == user_id, RefreshToken.expires_at > utcnow())
+        ))
+
+    def _delete_tokens(self, condition) -> List[str]:
+        """Delete the tokens matching a condition and return their owners, one per token; the caller commits."""
+        statement = delete(RefreshToken).where(condition).execution_options(synchronize_session=False)
+        if self.database.get_bind().dialect.delete_returning:
+            return list(self.database.scalars(statement.returning(RefreshToken.user_id)))
+        owners = list(self.database.scalars(select(RefreshToken.user_id).where(condition)))
+        self.database.execute(statement)
+        return owners
+
+    def _replace_user_tokens(self, user_id: str, refresh_token: str, expires_at: datetime) -> None:
+        """Revoke the user's tokens and insert the new one; the caller commits."""
+        self.database.execute(delete(RefreshToken).where(RefreshToken.user_id == user_id))
+        self.database.execute(
+            insert(RefreshToken).values(
+                user_id=user_id, token_hash=hash_token(refresh_token), expires_at=expires_at
+            )
+        )
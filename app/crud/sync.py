@@ -0,0 +1,154 @@
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+from ..core.pagination import decode_cursor, encode_cursor
+from ..models.book import Book
+from ..models.reader import Reader
+from ..models.tombstone import Tombstone
+from .book import BOOKS_COUNTER
+from .change_counter import ChangeCounterCRUD
+from .reader import READERS_COUNTER
+
+# Entities in the change feed, keyed by the name of their change counter, in sync token order.
+SYNC_ENTITIES: Dict[str, Type[Any]] = {
+    BOOKS_COUNTER: Book,
+    READERS_COUNTER: Reader,
+}
+
+# Position in the feed of one entity: (version, id) of the last change delivered.
+Position = Tuple[int, int]
+
+
+def encode_sync_token(positions: Dict[str, Position]) -> str:
+    """
+    Encode the feed positions of every entity into an opaque sync token.
+
+    Args:
+        positions (Dict[str, Position]): Position per entity name.
+
+    Returns:
+        str: URL-safe token.
+    """
+    return encode_cursor([value for entity in SYNC_ENTITIES for value in positions[entity]])
+
+
+def decode_sync_token(token: Optional[str]) -> Dict[str, Position]:
+    """
+    Decode a sync token; no token means the start of the feed (a full sync).
+
+    Args:
+        token (Optional[str]): Token returned by a previous sync.
+
+    Returns:
+        Dict[str, Position]: Position per entity name.
+
+    Raises:
+        ValueError: If the token is malformed.
+    """
+    if not token:
+        return {entity: (0, 0) for entity in SYNC_ENTITIES}
+    try:
+        values = decode_cursor(token, 2 * len(SYNC_ENTITIES))
+    except ValueError:
+        raise ValueError("Invalid sync token")
+    if not all(isinstance(value, int) and value >= 0 for value in values):
+        raise ValueError("Invalid sync token")
+    return {entity: (values[2 * i], values[2 * i + 1]) for i, entity in enumerate(SYNC_ENTITIES)}
+
+
+class SyncCRUD:
+    """
+    Change feed of books and readers for offline clients.
+
+    Every write stamps the rows it touches with a fresh value of the entity's
+    change counter and every delete leaves a tombstone with one, so the changes
+    after a position are a (version, id) range scan of the table and of the
+    tombstones, and a client syncs in O(changes) rather than O(catalog).
+    """
+
+    def __init__(self, db: Session):
+        """
+        Initialize the CRUD with a database session.
+
+        Args:
+            db (Session): SQLAlchemy database session.
+        """
+        self.db = db
+
+    def get_changes(self, token: Optional[str], limit: int) -> Dict[str, Any]:
+        """
+        Return one page of changes of every entity after the token's positions.
+
+        Args:
+            token (Optional[str]): Token returned by the previous page or sync; None
+                starts from the beginning.
+            limit (int): Maximum number of changes per entity.
+
+        Returns:
+            Dict[str, Any]: Upserted rows and deleted IDs per entity, the token of the
+            next page under `next_token` and whether more changes are pending
+            under `has_more`.
+
+        Raises:
+            ValueError: If the token is malformed.
+        """
+        positions = decode_sync_token(token)
+        changes: Dict[str, Any] = {}
+        has_more = False
+        for entity, model in SYNC_ENTITIES.items():
+            upserted, deleted, positions[entity], more = self._entity_changes(entity, model, positions[entity], limit)
+            changes[entity] = {"upserted": upserted, "deleted": deleted}
+            has_more = has_more or more
+        changes["next_token"] = encode_sync_token(positions)
+        changes["has_more"] = has_more
+        return changes
+
+    def _entity_changes(
+        self, entity: str, model: Type[Any], after: Position, limit: int
+    ) -> Tuple[List[Any], List[int], Position, bool]:
+        """
+        Collect the changes of one entity after a position.
+
+        The entity's counter is read first and both queries stop at its value.
+        Versions are handed out under the counter's row lock, so every change up
+        to that value has committed; a transaction committing during the sync can
+        only carry a higher version and is picked up by the next sync.
+
+        Args:
+            entity (str): Entity (change counter) name.
+            model (Type[Any]): Mapped class of the entity.
+            after (Position): Last position delivered to the client.
+            limit (int): Maximum number of changes.
+
+        Returns:
+            Tuple[List[Any], List[int], Position, bool]: Upserted rows, deleted IDs,
+            the new position and whether more changes are pending.
+        """
+        high = ChangeCounterCRUD(self.db).current(entity)
+        table = model.__table__
+        key = tuple_(table.c.version, table.c.id)
+        rows = self.db.execute(
+            select(table)
+            .where(key > tuple_(*after), table.c.version <= high)
+            .order_by(table.c.version, table.c.id)
+            .limit(limit + 1)
+        ).all()
+        tombstone_key = tuple_(Tombstone.version, Tombstone.entity_id)
+        tombstones = self.db.execute(
+            select(Tombstone.version, Tombstone.entity_id)
+            .where(Tombstone.entity == entity, tombstone_key > tuple_(*after), Tombstone.version <= high)
+            .order_by(Tombstone.version, Tombstone.entity_id)
+            .limit(limit + 1)
+        ).all()
+
+        merged = sorted(
+            [((row.version, row.id), row) for row in rows]
+            + [((version, entity_id), None) for version, entity_id in tombstones],
+            key=lambda change: change[0]
+        )
+        page = merged[:limit]
+        upserted = [row for _, row in page if row is not None]
+        deleted = [position[1] for position, row in page if row is None]
+        position = page[-1][0] if page else after
+        return upserted, deleted, position, len(merged) > limit
@@ -3,7 +3,7 @@ from sqlalchemy.orm import Session
 from ..models.user import User
 from ..schemas.user import UserCreate
 from ..core.database import get_db
-from ..core.security import get_password_hash, verify_password
+from ..core.security import get_password_hash, invalidate_principal, verify_password
 
 
 class UserCRUD:
@@ -21,17 +21,19 @@ class UserCRUD:
         """
         self.db: Session = db or get_db()
 
-    def create_user(self, user: UserCreate) -> User:
+    def create_user(self, user: UserCreate, hashed_password: Optional[str] = None) -> User:
         """
         Create a new user with hashed password.
 
         Args:
             user (UserCreate): User data to be created.
+            hashed_password (Optional[str]): Password hash computed by the caller, e.g. on the
+                hashing pool; the password is hashed here if omitted.
 
         Returns:
             User: The newly created user instance.
         """
-        hashed_password = get_password_hash(user.password)
+        hashed_password = hashed_password or get_password_hash(user.password)
         db_user = User(
             email=user.email,
             password=hashed_password
@@ -39,6 +41,7 @@ class UserCRUD:
         self.db.add(db_user)
         self.db.commit()
         self.db.refresh(db_user)
+        invalidate_principal(db_user.email)
         return db_user
 
     def get_user_by_email(self, email: str) -> Optional[User]:
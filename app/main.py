@@ -1,11 +1,49 @@
+import asyncio
+from contextlib import asynccontextmanager, suppress
+
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.config import Config
+from app.core.database import create_tables
+from app.core.instrumentation import SQLInstrumentationMiddleware
+from app.core.metrics import MetricsMiddleware
+from app.core.responses import FastJSONResponse
+from app.core.routing import ReadYourWritesMiddleware
+from app.core.tasks import purge_refresh_tokens_periodically
+
 from app.routers.auth import router as auth_router
 from app.routers.reader import router as reader_router
 from app.routers.books import router as book_router
+from app.routers.metrics import router as metrics_router
+from app.routers.ops import router as ops_router
+from app.routers.sync import router as sync_router
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Prepare the database and start background maintenance tasks; stop them on shutdown.
+
+    Missing tables are created here rather than at import time, unless
+    `SKIP_SCHEMA_CHECK` says migrations manage the schema.
 
-app = FastAPI()
+    Args:
+        app (FastAPI): The application instance.
+    """
+    if not Config.SKIP_SCHEMA_CHECK:
+        await run_in_threadpool(create_tables)
+    purge_task = asyncio.create_task(purge_refresh_tokens_periodically())
+    try:
+        yield
+    finally:
+        purge_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await purge_task
+
+
+app = FastAPI(lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
@@ -15,6 +53,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+app.add_middleware(ReadYourWritesMiddleware)
+
+app.add_middleware(SQLInstrumentationMiddleware)
+app.add_middleware(MetricsMiddleware)
+
 app.include_router(
     auth_router,
     prefix="/api/auth",
@@ -32,3 +75,20 @@ app.include_router(
     prefix="/api/books",
     tags=["books"]
 )
+
+app.include_router(
+    sync_router,
+    prefix="/api/sync",
+    tags=["sync"]
+)
+
+app.include_router(
+    ops_router,
+    prefix="/api/ops",
+    tags=["ops"]
+)
+
+app.include_router(
+    metrics_router,
+    tags=["ops"]
+)
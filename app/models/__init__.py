@@ -1,5 +1,7 @@
 from .book import *
 from .borrowed_books import *
+from .change_counter import *
 from .refresh_token import *
 from .reader import *
+from .tombstone import *
 from .user import *
\ No newline at end of file
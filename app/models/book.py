@@ -1,6 +1,37 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import BigInteger, Column, Index, Integer, String, DDL, event
 from ..core.base import Base
 
+# Text that full-text search runs over; the PostgreSQL index and the search query
+# must use exactly the same expression for the planner to pick the GIN index.
+BOOK_SEARCH_VECTOR = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(author, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+)
+
+# SQLite keeps an external-content FTS5 table in sync with `books` through triggers,
+# so every write path (ORM, bulk inserts, raw SQL) updates the index.
+SQLITE_SEARCH_DDL = [
+    "CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5("
+    "title, author, description, content='books', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    "CREATE TRIGGER IF NOT EXISTS books_fts_ai AFTER INSERT ON books BEGIN "
+    "INSERT INTO books_fts(rowid, title, author, description) "
+    "VALUES (new.id, new.title, new.author, new.description); END",
+    "CREATE TRIGGER IF NOT EXISTS books_fts_ad AFTER DELETE ON books BEGIN "
+    "INSERT INTO books_fts(books_fts, rowid, title, author, description) "
+    "VALUES ('delete', old.id, old.title, old.author, old.description); END",
+    "CREATE TRIGGER IF NOT EXISTS books_fts_au AFTER UPDATE OF title, author, description ON books BEGIN "
+    "INSERT INTO books_fts(books_fts, rowid, title, author, description) "
+    "VALUES ('delete', old.id, old.title, old.author, old.description); "
+    "INSERT INTO books_fts(rowid, title, author, description) "
+    "VALUES (new.id, new.title, new.author, new.description); END",
+]
+
+POSTGRESQL_SEARCH_DDL = [
+    f"CREATE INDEX IF NOT EXISTS ix_books_search ON books USING gin (({BOOK_SEARCH_VECTOR}))",
+]
+
 
 class Book(Base):
     """
@@ -18,9 +49,21 @@ class Book(Base):
         Number of copies currently available for borrowing. Defaults to 1.
     description : str
         Free-text description or annotation of the book.
+    version : int
+        Value of the "books" change counter when the book last changed (see
+        ChangeCounter); drives the ETags of book responses and positions the
+        book in the sync change feed.
+
+    Indexes
+    -------
+    ix_books_version
+        (version, id): books changed after a position of the sync change feed.
     """
 
     __tablename__ = "books"
+    __table_args__ = (
+        Index("ix_books_version", "version", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, index=True)
@@ -29,3 +72,11 @@ class Book(Base):
     isbn = Column(String, unique=True, index=True)
     copies_available = Column(Integer, index=True, default=1)
     description = Column(String)
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+for statement in SQLITE_SEARCH_DDL:
+    event.listen(Book.__table__, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+
+for statement in POSTGRESQL_SEARCH_DDL:
+    event.listen(Book.__table__, "after_create", DDL(statement).execute_if(dialect="postgresql"))
@@ -1,7 +1,9 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime
+from sqlalchemy import Column, Integer, DateTime, Index, text
 from ..core.base import Base
 
+OPEN_LOAN = text("date_returned IS NULL")
+
 
 class BorrowedBooks(Base):
     """
@@ -15,9 +17,27 @@ class BorrowedBooks(Base):
         Timestamp when the book was borrowed. Defaults to current time.
     date_returned : datetime or None
         Timestamp when the book was returned. Can be null if not returned yet.
+
+    Indexes
+    -------
+    ix_borrowed_books_open_loan
+        Partial index on (reader_id, book_id) over open loans only: serves the
+        active loans of a reader and the open loan of a (reader, book) pair.
+    ix_borrowed_books_reader_history
+        (reader_id, id): a reader's full loan history in ID order.
+    ix_borrowed_books_book_id
+        Loans of a book.
     """
 
     __tablename__ = "borrowed_books"
+    __table_args__ = (
+        Index(
+            "ix_borrowed_books_open_loan", "reader_id", "book_id",
+            sqlite_where=OPEN_LOAN, postgresql_where=OPEN_LOAN
+        ),
+        Index("ix_borrowed_books_reader_history", "reader_id", "id"),
+        Index("ix_borrowed_books_book_id", "book_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     reader_id = Column(Integer)
@@ -0,0 +1,28 @@
+from sqlalchemy import BigInteger, Column, DDL, String, event
+from ..core.base import Base
+
+# Counters that exist from the start; `ChangeCounterCRUD.bump` creates any other on first use.
+CHANGE_COUNTERS = ("books", "readers")
+
+
+class ChangeCounter(Base):
+    """
+    name : str
+        Primary key: what the counter versions, e.g. "books" for the whole catalog.
+    value : int
+        Last version handed out. Bumped inside every transaction that changes the
+        versioned rows, so it only ever grows and identifies a state of the data.
+    """
+
+    __tablename__ = "change_counters"
+
+    name = Column(String, primary_key=True)
+    value = Column(BigInteger, nullable=False, default=0, server_default="0")
+
+
+for counter in CHANGE_COUNTERS:
+    event.listen(
+        ChangeCounter.__table__,
+        "after_create",
+        DDL(f"INSERT INTO change_counters (name, value) VALUES ('{counter}', 0)")
+    )
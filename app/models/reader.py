@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import BigInteger, Column, Index, Integer, String
 from ..core.base import Base
 
 
@@ -10,13 +10,29 @@ class Reader(Base):
         Reader’s full name. Indexed for search.
     email : str
         Reader’s email address. Must be unique.
+    active_loans : int
+        Number of books the reader currently holds. Maintained by borrow/return
+        so the borrowing limit can be enforced without counting loans.
+    version : int
+        Value of the "readers" change counter when the reader last changed (see
+        ChangeCounter); positions the reader in the sync change feed.
+
+    Indexes
+    -------
+    ix_readers_version
+        (version, id): readers changed after a position of the sync change feed.
     """
 
     __tablename__ = "readers"
+    __table_args__ = (
+        Index("ix_readers_version", "version", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
     email = Column(String, unique=True, index=True)
+    active_loans = Column(Integer, nullable=False, default=0, server_default="0")
+    version = Column(BigInteger, nullable=False, default=0, server_default="0")
 
     def model_dump(self):
         """
@@ -6,17 +6,26 @@ class RefreshToken(Base):
     """
     id : int
         Primary key, auto-incremented.
-    user_id : int
-        ID of the user the token belongs to.
-    token : str
-        Unique refresh token string.
+    user_id : str
+        Subject (email) of the user the token belongs to.
+    token_hash : str
+        SHA-256 hex digest of the refresh token; the token itself is never stored.
     expires_at : datetime
-        Expiration date and time of the token.
+        Expiration date and time of the token (naive UTC).
+
+    Indexes
+    -------
+    ix_refresh_tokens_token_hash
+        Unique: looks up and rotates a presented token.
+    ix_refresh_tokens_user_id
+        Revokes all tokens of a user.
+    ix_refresh_tokens_expires_at
+        Finds expired tokens for the periodic purge.
     """
 
     __tablename__ = "refresh_tokens"
 
     id = Column(Integer, primary_key=True)
-    user_id = Column(Integer)
-    token = Column(String, unique=True)
-    expires_at = Column(DateTime)
+    user_id = Column(String, nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True, index=True)
+    expires_at = Column(DateTime, nullable=False, index=True)
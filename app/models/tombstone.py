@@ -0,0 +1,30 @@
+from sqlalchemy import BigInteger, Column, Index, Integer, String
+from ..core.base import Base
+
+
+class Tombstone(Base):
+    """
+    id : int
+        Primary key, auto-incremented.
+    entity : str
+        Kind of the deleted row: "books" or "readers", the name of its change counter.
+    entity_id : int
+        ID the deleted row had.
+    version : int
+        Value of the entity's change counter bumped by the delete.
+
+    Indexes
+    -------
+    ix_tombstones_feed
+        (entity, version, entity_id): the deletes of an entity after a sync position.
+    """
+
+    __tablename__ = "tombstones"
+    __table_args__ = (
+        Index("ix_tombstones_feed", "entity", "version", "entity_id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    entity = Column(String, nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    version = Column(BigInteger, nullable=False)
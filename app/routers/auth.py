@@ -1,63 +1,66 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.schemas.token import TokenRefresh
+from app.schemas.token import TokenCreate, TokenRefresh
 from app.core.security import (
-    authenticate_user,
-    create_access_token,
-    create_refresh_token,
-    refresh_tokens,
+    authenticate_user_async,
+    get_password_hash_async,
+    create_session_access_token,
+    create_refresh_token_async,
+    refresh_tokens_async,
     is_email
 )
-from app.core.database import get_db
-from ..crud.user import UserCRUD
-from ..schemas.user import UserCreate
+from app.core.database import RequestSession, get_request_db
+from ..crud.async_crud import AsyncUserCRUD
+from ..schemas.user import UserCreate, UserRead
 
 router = APIRouter()
 
 
-@router.post("/register")
-async def register(user: UserCreate, db: Session = Depends(get_db)):
+@router.post("/register", response_model=UserRead)
+async def register(user: UserCreate, db: RequestSession = Depends(get_request_db)):
     """
     Register a new user.
 
     Args:
         user (UserCreate): User registration data containing email and password.
-        db (Session): Database session dependency.
+        db (RequestSession): Database session dependency.
 
     Returns:
-        User: Created user object.
+        UserRead: Created user, without the password hash.
 
     Raises:
         HTTPException 400: If email format is invalid or email already registered.
+        HTTPException 503: If the password hashing pool is saturated.
     """
-    crud = UserCRUD(db)
+    crud = AsyncUserCRUD(db)
 
     if not is_email(user.email):
         raise HTTPException(status_code=400, detail="Invalid email")
 
-    db_user = crud.get_user_by_email(email=user.email)
+    db_user = await crud.get_user_by_email(email=user.email)
     if db_user:
         raise HTTPException(status_code=400, detail="Email already registered")
 
-    return crud.create_user(user=user)
+    hashed_password = await get_password_hash_async(user.password)
+    return await crud.create_user(user=user, hashed_password=hashed_password)
 
 
-@router.post("/login")
-async def login(form_data: UserCreate, db: Session = Depends(get_db)):
+@router.post("/login", response_model=TokenCreate)
+async def login(form_data: UserCreate, db: RequestSession = Depends(get_request_db)):
     """
     Authenticate user and issue access and refresh tokens.
 
     Args:
         form_data (UserCreate): User login data (email and password).
-        db (Session): Database session dependency.
+        db (RequestSession): Database session dependency.
 
     Returns:
-        dict: Dictionary containing access_token, refresh_token, and token_type.
+        TokenCreate: Access token, refresh token and token type.
 
     Raises:
         HTTPException 401: If authentication fails due to incorrect email or password.
+        HTTPException 503: If the password hashing pool is saturated.
     """
-    user = authenticate_user(form_data.email, form_data.password, db)
+    user = await authenticate_user_async(form_data.email, form_data.password, db)
     if not user:
         raise HTTPException(
             status_code=401,
@@ -65,8 +68,8 @@ async def login(form_data: UserCreate, db: Session = Depends(get_db)):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    access_token = create_access_token(data={"sub": user.email})
-    refresh_token = create_refresh_token(data={"sub": user.email}, db=db)
+    refresh_token = await create_refresh_token_async(data={"sub": user.email, "uid": user.id}, db=db)
+    access_token = create_session_access_token({"sub": user.email, "uid": user.id}, refresh_token)
 
     return {
         "access_token": access_token,
@@ -75,19 +78,19 @@ async def login(form_data: UserCreate, db: Session = Depends(get_db)):
     }
 
 
-@router.post("/refresh")
-async def refresh_token(token: TokenRefresh, db: Session = Depends(get_db)):
+@router.post("/refresh", response_model=TokenCreate)
+async def refresh_token(token: TokenRefresh, db: RequestSession = Depends(get_request_db)):
     """
     Refresh access and refresh tokens.
 
     Args:
         token (TokenRefresh): Refresh token schema with the current refresh token.
-        db (Session): Database session dependency.
+        db (RequestSession): Database session dependency.
 
     Returns:
-        dict: New access and refresh tokens.
+        TokenCreate: New access and refresh tokens.
 
     Raises:
-        HTTPException: If token refresh fails (handled inside `refresh_tokens` function).
+        HTTPException: If token refresh fails (handled inside `refresh_tokens_async`).
     """
-    return refresh_tokens(token.refresh_token, db)
+    return await refresh_tokens_async(token.refresh_token, db)
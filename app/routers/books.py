@@ -1,12 +1,29 @@
-from fastapi import APIRouter, Depends
-from ..core.database import get_db
-from ..core.security import get_current_user
+import io
+from datetime import datetime
+from typing import List, Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response, UploadFile
+from fastapi.responses import StreamingResponse
+from ..config import Settings
+from ..core.catalog_io import EXPORT_COLUMNS, MEDIA_TYPES, detect_format, iter_book_records, iter_export_chunks
+from ..core.conditional import (
+    VersionConflict,
+    conditional_response,
+    if_match_any,
+    make_etag,
+    resolve_expected_version,
+    version_etag
+)
+from ..core.database import SessionLocal, get_db
+from ..core.projection import parse_fields
+from ..core.security import get_current_user, get_read_only_user
 
 from ..models.book import Book
-from ..schemas.book import BookCreate
+from ..models.borrowed_books import BorrowedBooks
+from ..schemas.book import BookCreate, BookImportReport, BookPage, BookRead
 from ..crud.book import BookCRUD
 
-from ..schemas.borrowed_books import BorrowedBookCreate
+from ..schemas.borrowed_books import BorrowedBookCreate, CartItemResult, CartRequest, LoanHistoryPage, LoanRead
 from ..crud.reader import ReaderCRUD
 
 from ..schemas.user import UserCreate
@@ -14,22 +31,61 @@ from ..schemas.user import UserCreate
 router = APIRouter()
 
 
-@router.get("/")
-def get_books(db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+@router.get("/", response_model=BookPage, response_model_exclude_unset=True)
+def get_books(
+    request: Request,
+    response: Response,
+    limit: int = Query(Settings.PAGE_DEFAULT_LIMIT, ge=1, le=Settings.PAGE_MAX_LIMIT),
+    after: Optional[str] = None,
+    sort: str = "id",
+    fields: Optional[str] = None,
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_read_only_user)
+):
     """
-    Retrieve all books from the database.
+    Retrieve one page of books using cursor pagination.
+
+    The response carries an ETag derived from the catalog version and the query
+    parameters; a request whose If-None-Match still matches it gets a 304 after a
+    single counter lookup, without running the page query.
 
     Args:
+        request (Request): Incoming request, for If-None-Match.
+        response (Response): Response whose ETag header is set.
+        limit (int): Maximum number of books in the page.
+        after (Optional[str]): `next_cursor` value from the previous page.
+        sort (str): Column to order by: id, title, author or publication_year.
+        fields (Optional[str]): Comma-separated book columns to return; all columns if omitted.
         db (Session): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        List[Book]: List of all book records.
-    """
-    return BookCRUD(db).get_all()
-
+        BookPage: Books of the page under `items` and the cursor of the next page under
+        `next_cursor` (None on the last page), or an empty 304 response.
 
-@router.post("/")
+    Raises:
+        HTTPException 400: If the sort column, a field or the cursor is invalid.
+    """
+    crud = BookCRUD(db)
+    try:
+        columns = parse_fields(fields, Book.__table__)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # The version is read before the page, so the body is never older than its ETag.
+    etag = make_etag("books", crud.catalog_version(), limit, after, sort, columns)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    try:
+        books, next_cursor = crud.get_page(limit=limit, after=after, sort=sort, fields=columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": books, "next_cursor": next_cursor}
+
+
+@router.post("/", response_model=BookRead)
 def create_book(book: BookCreate, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
     """
     Create a new book entry.
@@ -40,25 +96,157 @@ def create_book(book: BookCreate, db=Depends(get_db), current_user: UserCreate =
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        Book: Created book object.
+        BookRead: Created book.
     """
     return BookCRUD(db).create(book)
 
 
-@router.get("/{book_id}")
-def get_book(book_id: int, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+@router.post("/import/", response_model=BookImportReport)
+def import_books(
+    file: UploadFile,
+    format: Optional[Literal["csv", "ndjson"]] = None,
+    batch_size: int = Query(Settings.BOOK_IMPORT_BATCH_SIZE, ge=1, le=10000),
+    on_conflict: Literal["skip", "upsert", "report"] = "skip",
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_current_user)
+):
+    """
+    Bulk import books from an uploaded CSV or NDJSON file.
+
+    The file is read record by record and written in batches, so memory use does
+    not depend on the file size. Invalid rows and ISBN conflicts are reported per
+    row without aborting the import.
+
+    Args:
+        file (UploadFile): CSV file with a header row, or NDJSON file with one book per line.
+        format (Optional[str]): "csv" or "ndjson"; detected from the file name if omitted.
+        batch_size (int): Number of rows inserted per statement and per commit.
+        on_conflict (str): What to do with an existing ISBN: skip, upsert or report.
+        db (Session): Database session dependency.
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        BookImportReport: Import counters and the per-row error report.
+
+    Raises:
+        HTTPException 400: If the file format cannot be determined.
+    """
+    try:
+        fmt = format or detect_format(file.filename)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        return BookCRUD(db).bulk_import(iter_book_records(stream, fmt), batch_size=batch_size, on_conflict=on_conflict)
+    finally:
+        stream.detach()
+
+
+@router.get("/export")
+def export_books(format: Literal["csv", "ndjson"] = "ndjson", current_user: UserCreate = Depends(get_read_only_user)):
+    """
+    Stream the whole catalog as NDJSON or CSV.
+
+    Rows are read through a server-side cursor and sent in chunks as they are
+    fetched, so the response starts immediately and memory stays flat however
+    large the catalog is. The stream owns its session because request-scoped
+    dependencies are closed before a streaming body is sent.
+
+    Args:
+        format (str): "ndjson" (default) or "csv".
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        StreamingResponse: Catalog rows in the requested format.
+    """
+    def stream():
+        db = SessionLocal()
+        try:
+            batches = BookCRUD(db).iter_export(EXPORT_COLUMNS, batch_size=Settings.BOOK_EXPORT_BATCH_SIZE)
+            yield from iter_export_chunks(batches, format)
+        finally:
+            db.close()
+
+    return StreamingResponse(
+        stream(),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="books.{format}"'}
+    )
+
+
+@router.get("/search", response_model=BookPage, response_model_exclude_unset=True)
+def search_books(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(Settings.PAGE_DEFAULT_LIMIT, ge=1, le=Settings.PAGE_MAX_LIMIT),
+    after: Optional[str] = None,
+    fields: Optional[str] = None,
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_read_only_user)
+):
+    """
+    Full-text search over book title, author and description.
+
+    Args:
+        q (str): Search query; every word must match.
+        limit (int): Maximum number of books in the page.
+        after (Optional[str]): `next_cursor` value from the previous page.
+        fields (Optional[str]): Comma-separated book columns to return; all columns if omitted.
+        db (Session): Database session dependency.
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        BookPage: Books ranked by relevance under `items` and the cursor of the next page
+        under `next_cursor` (None on the last page).
+
+    Raises:
+        HTTPException 400: If a field or the cursor is invalid.
+    """
+    try:
+        columns = parse_fields(fields, Book.__table__)
+        books, next_cursor = BookCRUD(db).search(q, limit=limit, after=after, fields=columns)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"items": books, "next_cursor": next_cursor}
+
+
+@router.get("/{book_id}", response_model=Optional[BookRead])
+def get_book(
+    book_id: int,
+    request: Request,
+    response: Response,
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_read_only_user)
+):
     """
     Retrieve a book by its ID.
 
+    The response carries an ETag derived from the book's version; a request
+    whose If-None-Match still matches it gets a 304 after a version lookup,
+    without loading or serializing the book.
+
     Args:
         book_id (int): ID of the book to retrieve.
+        request (Request): Incoming request, for If-None-Match.
+        response (Response): Response whose ETag header is set.
         db (Session): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        Optional[Book]: Book object if found, else None.
+        Optional[BookRead]: Book if found, else None; or an empty 304 response.
     """
-    return BookCRUD(db).get_by_id(book_id)
+    crud = BookCRUD(db)
+    version = crud.get_version(book_id)
+    if version is None:
+        return None
+    not_modified = conditional_response(request, response, version_etag(version))
+    if not_modified is not None:
+        return not_modified
+
+    book = crud.get_by_id(book_id)
+    if book is not None and book.version != version:
+        response.headers["ETag"] = version_etag(book.version)
+    return book
 
 
 @router.delete("/{book_id}")
@@ -77,24 +265,51 @@ def delete_book(book_id: int, db=Depends(get_db), current_user: UserCreate = Dep
     return BookCRUD(db).delete(book_id)
 
 
-@router.put("/{book_id}")
-def update_book(book_id: int, book: BookCreate, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+@router.put("/{book_id}", response_model=Optional[BookRead])
+def update_book(
+    book_id: int,
+    book: BookCreate,
+    response: Response,
+    expected_version: Optional[int] = None,
+    if_match: Optional[str] = Header(None),
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_current_user)
+):
     """
     Update book information by ID.
 
+    Send the book's ETag in If-Match (or its `version` as `expected_version`) to
+    make the update conditional: it is rejected with 412 if someone else changed
+    the book in the meantime, instead of overwriting their edit.
+
     Args:
         book_id (int): ID of the book to update.
         book (BookCreate): New book data.
+        response (Response): Response whose ETag header is set.
+        expected_version (Optional[int]): Version the client last saw; ignored if If-Match is sent.
+        if_match (Optional[str]): ETag the client last saw, from GET /api/books/{book_id}.
         db (Session): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        Optional[Book]: Updated book object or None if not found.
-    """
-    return BookCRUD(db).update(book_id, book)
+        Optional[BookRead]: Updated book or None if not found.
 
-
-@router.post("/borrow/")
+    Raises:
+        HTTPException 412: If the book is no longer at the expected version, or
+            does not exist under `If-Match: *`.
+    """
+    try:
+        updated = BookCRUD(db).update(book_id, book, expected_version=resolve_expected_version(if_match, expected_version))
+    except VersionConflict:
+        raise HTTPException(status_code=412, detail="Book was changed by someone else; reload it and retry")
+    if updated is None and if_match_any(if_match):
+        raise HTTPException(status_code=412, detail="Book does not exist")
+    if updated is not None:
+        response.headers["ETag"] = version_etag(updated.version)
+    return updated
+
+
+@router.post("/borrow/", response_model=bool)
 def borrow_book(borrowed_book: BorrowedBookCreate, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
     """
     Borrow a book for a reader.
@@ -113,7 +328,7 @@ def borrow_book(borrowed_book: BorrowedBookCreate, db=Depends(get_db), current_u
     return ReaderCRUD(db).borrow_book(borrowed_book.reader_id, borrowed_book.book_id)
 
 
-@router.post("/return/")
+@router.post("/return/", response_model=bool)
 def return_book(borrowed_book: BorrowedBookCreate, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
     """
     Return a borrowed book for a reader.
@@ -132,17 +347,87 @@ def return_book(borrowed_book: BorrowedBookCreate, db=Depends(get_db), current_u
     return ReaderCRUD(db).return_borrowed_book(borrowed_book.reader_id, borrowed_book.book_id)
 
 
-@router.get("/readers/{reader_id}/borrowed/")
-def get_borrowed_books(reader_id: int, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+@router.post("/cart/", response_model=List[CartItemResult])
+def process_cart(cart: CartRequest, db=Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+    """
+    Borrow and/or return several books in one transaction.
+
+    Args:
+        cart (CartRequest): Borrow/return operations, applied in the given order.
+        db (Session): Database session dependency.
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        List[CartItemResult]: Per-operation outcome, in request order.
+
+    Raises:
+        HTTPException 409: If a reader or book changed concurrently; nothing is applied.
+    """
+    return ReaderCRUD(db).process_cart(cart.operations)
+
+
+@router.get("/readers/{reader_id}/borrowed/", response_model=List[LoanRead], response_model_exclude_unset=True)
+def get_borrowed_books(
+    reader_id: int,
+    fields: Optional[str] = None,
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_read_only_user)
+):
     """
     Get all books currently borrowed by a reader.
 
     Args:
         reader_id (int): ID of the reader.
+        fields (Optional[str]): Comma-separated loan columns to return; all columns if omitted.
+        db (Session): Database session dependency.
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        List[LoanRead]: Loan records of the reader.
+
+    Raises:
+        HTTPException 400: If a field is invalid.
+    """
+    try:
+        columns = parse_fields(fields, BorrowedBooks.__table__)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return ReaderCRUD(db).get_borrowed_books(reader_id, fields=columns)
+
+
+@router.get("/readers/{reader_id}/loans/", response_model=LoanHistoryPage)
+def get_loan_history(
+    reader_id: int,
+    limit: int = Query(Settings.PAGE_DEFAULT_LIMIT, ge=1, le=Settings.PAGE_MAX_LIMIT),
+    after: Optional[str] = None,
+    active: Optional[bool] = None,
+    borrowed_from: Optional[datetime] = None,
+    borrowed_to: Optional[datetime] = None,
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_read_only_user)
+):
+    """
+    Get a page of a reader's loan history with book title and author inlined.
+
+    Args:
+        reader_id (int): ID of the reader.
+        limit (int): Maximum number of loans in the page.
+        after (Optional[str]): `next_cursor` value from the previous page.
+        active (Optional[bool]): True for open loans only, False for returned loans only.
+        borrowed_from (Optional[datetime]): Only loans borrowed at or after this moment.
+        borrowed_to (Optional[datetime]): Only loans borrowed before this moment.
         db (Session): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        List[Dict]: List of borrowed book records for the reader.
+        LoanHistoryPage: Loans of the page, newest first, and the cursor of the next page.
     """
-    return ReaderCRUD(db).get_borrowed_books(reader_id)
+    loans, next_cursor = ReaderCRUD(db).get_loan_history(
+        reader_id,
+        limit=limit,
+        after=after,
+        active=active,
+        borrowed_from=borrowed_from,
+        borrowed_to=borrowed_to
+    )
+    return {"items": loans, "next_cursor": next_cursor}
@@ -0,0 +1,19 @@
+from fastapi import APIRouter, Response
+
+from ..core.metrics import CONTENT_TYPE, REGISTRY
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+def get_metrics() -> Response:
+    """
+    Expose the process metrics in the Prometheus text format.
+
+    The endpoint is unauthenticated so Prometheus can scrape it; restrict it at
+    the network or proxy level in production.
+
+    Returns:
+        Response: Metrics exposition.
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
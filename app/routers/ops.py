@@ -0,0 +1,38 @@
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends
+
+from ..core.database import get_async_engines, get_engines
+from ..core.engine import pool_stats
+from ..core.security import get_read_only_user
+from ..schemas.user import UserCreate
+
+router = APIRouter()
+
+
+@router.get("/pool")
+def get_pool_stats(current_user: UserCreate = Depends(get_read_only_user)) -> Dict[str, Any]:
+    """
+    Report live connection pool statistics of this worker process.
+
+    Use it to size `SQLALCHEMY_POOL_SIZE`/`SQLALCHEMY_MAX_OVERFLOW` per worker: a
+    growing wait time or a pool constantly at `size + overflow` means requests
+    are queueing for connections.
+
+    Args:
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        Dict[str, Any]: Statistics of the sync (write) engine, the read engines if reads are
+        split off and, once created, the async engines.
+    """
+    engine, read_engines = get_engines()
+    stats = {"sync": pool_stats(engine)}
+    if read_engines != [engine]:
+        stats["read"] = [pool_stats(read_engine) for read_engine in read_engines]
+    if get_async_engines.cache_info().currsize:
+        async_engine, async_read_engines = get_async_engines()
+        stats["async"] = pool_stats(async_engine.sync_engine)
+        if async_read_engines != [async_engine]:
+            stats["async_read"] = [pool_stats(read_engine.sync_engine) for read_engine in async_read_engines]
+    return stats
@@ -1,95 +1,185 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-
-from ..core.security import get_current_user
-from ..core.database import get_db
+from typing import Dict, List, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
+
+from ..core.conditional import (
+    VersionConflict,
+    conditional_response,
+    if_match_any,
+    resolve_expected_version,
+    version_etag
+)
+from ..core.security import get_current_user_async, get_read_only_user_async
+from ..core.database import RequestSession, get_request_db
+from ..core.projection import parse_fields
+from ..models.reader import Reader
 from ..schemas.user import UserCreate
-from ..schemas.reader import ReaderCreate
-from ..crud.reader import ReaderCRUD
+from ..schemas.reader import ReaderCreate, ReaderRead
+from ..crud.async_crud import AsyncReaderCRUD
 
 router = APIRouter()
 
 
-@router.get("/readers/")
-async def get_readers(db: Session = Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+def reader_fields(fields: Optional[str]) -> List[str]:
     """
-    Retrieve all readers from the database.
+    Parse the `fields` query parameter of the reader lookups.
 
     Args:
-        db (Session): Database session dependency.
-        current_user (UserCreate): Currently authenticated user.
+        fields (Optional[str]): Comma-separated reader columns; all columns if empty.
 
     Returns:
-        List[Reader]: List of all reader records.
+        List[str]: Reader columns to load.
+
+    Raises:
+        HTTPException 400: If a name is not a reader column.
+    """
+    try:
+        return parse_fields(fields, Reader.__table__)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/readers/", response_model=Dict[int, ReaderRead], response_model_exclude_unset=True)
+async def get_readers(
+    fields: Optional[str] = None,
+    db: RequestSession = Depends(get_request_db),
+    current_user: UserCreate = Depends(get_read_only_user_async)
+):
     """
-    reader_crud = ReaderCRUD(db)
-    return reader_crud.get_all()
+    Retrieve all readers from the database.
 
+    Args:
+        fields (Optional[str]): Comma-separated reader columns to return; all columns if omitted.
+        db (RequestSession): Database session dependency.
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        Dict[int, ReaderRead]: All readers keyed by their ID.
 
-@router.get("/readers/{reader_id}")
-async def get_reader(reader_id: int, db: Session = Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+    Raises:
+        HTTPException 400: If a field is invalid.
+    """
+    reader_crud = AsyncReaderCRUD(db)
+    return await reader_crud.get_all(fields=reader_fields(fields))
+
+
+@router.get("/readers/{reader_id}", response_model=Optional[ReaderRead], response_model_exclude_unset=True)
+async def get_reader(
+    reader_id: int,
+    request: Request,
+    response: Response,
+    fields: Optional[str] = None,
+    db: RequestSession = Depends(get_request_db),
+    current_user: UserCreate = Depends(get_read_only_user_async)
+):
     """
     Retrieve a single reader by their ID.
 
+    The full representation carries the reader's ETag, to be sent back in
+    If-Match when updating it, and is answered with 304 when If-None-Match
+    still matches.
+
     Args:
         reader_id (int): ID of the reader to retrieve.
-        db (Session): Database session dependency.
+        request (Request): Incoming request, for If-None-Match.
+        response (Response): Response whose ETag header is set.
+        fields (Optional[str]): Comma-separated reader columns to return; all columns if omitted.
+        db (RequestSession): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        Optional[Reader]: Reader object if found, else None.
+        Optional[ReaderRead]: Reader if found, else None; or an empty 304 response.
+
+    Raises:
+        HTTPException 400: If a field is invalid.
     """
-    reader_crud = ReaderCRUD(db)
-    return reader_crud.get_by_id(reader_id)
+    reader_crud = AsyncReaderCRUD(db)
+    reader = await reader_crud.get_by_id(reader_id, fields=reader_fields(fields))
+    if reader is not None and fields is None:
+        not_modified = conditional_response(request, response, version_etag(reader.version))
+        if not_modified is not None:
+            return not_modified
+    return reader
 
 
-@router.post("/readers/")
-async def create_reader(reader: ReaderCreate, db: Session = Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+@router.post("/readers/", response_model=ReaderRead)
+async def create_reader(reader: ReaderCreate, db: RequestSession = Depends(get_request_db), current_user: UserCreate = Depends(get_current_user_async)):
     """
     Create a new reader entry.
 
     Args:
         reader (ReaderCreate): Reader data to create.
-        db (Session): Database session dependency.
+        db (RequestSession): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        Reader: Created reader object.
+        ReaderRead: Created reader.
     """
-    reader_crud = ReaderCRUD(db)
-    return reader_crud.create(reader)
-
-
-@router.put("/readers/{reader_id}")
-async def update_reader(reader_id: int, reader: ReaderCreate, db: Session = Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+    reader_crud = AsyncReaderCRUD(db)
+    return await reader_crud.create(reader)
+
+
+@router.put("/readers/{reader_id}", response_model=ReaderRead)
+async def update_reader(
+    reader_id: int,
+    reader: ReaderCreate,
+    response: Response,
+    expected_version: Optional[int] = None,
+    if_match: Optional[str] = Header(None),
+    db: RequestSession = Depends(get_request_db),
+    current_user: UserCreate = Depends(get_current_user_async)
+):
     """
     Update an existing reader's information.
 
+    Send the reader's ETag in If-Match (or its `version` as `expected_version`)
+    to make the update conditional: it is rejected with 412 if someone else
+    changed the reader in the meantime, instead of overwriting their edit.
+
     Args:
         reader_id (int): ID of the reader to update.
         reader (ReaderCreate): Updated reader data.
-        db (Session): Database session dependency.
+        response (Response): Response whose ETag header is set.
+        expected_version (Optional[int]): Version the client last saw; ignored if If-Match is sent.
+        if_match (Optional[str]): ETag the client last saw, from GET /api/reader/readers/{reader_id}.
+        db (RequestSession): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
-        Optional[Reader]: Updated reader object or None if not found.
-    """
-    reader_crud = ReaderCRUD(db)
-    return reader_crud.update(reader_id, reader)
+        ReaderRead: Updated reader.
 
-
-@router.delete("/readers/{reader_id}")
-async def delete_reader(reader_id: int, db: Session = Depends(get_db), current_user: UserCreate = Depends(get_current_user)):
+    Raises:
+        HTTPException 404: If the reader does not exist.
+        HTTPException 412: If the reader is no longer at the expected version, or
+            does not exist under `If-Match: *`.
+    """
+    try:
+        version = resolve_expected_version(if_match, expected_version)
+    except VersionConflict as e:
+        raise HTTPException(status_code=412, detail=str(e))
+    reader_crud = AsyncReaderCRUD(db)
+    try:
+        updated = await reader_crud.update(reader_id, reader, expected_version=version)
+    except HTTPException as e:
+        if e.status_code == 404 and if_match_any(if_match):
+            raise HTTPException(status_code=412, detail="Reader does not exist")
+        raise
+    response.headers["ETag"] = version_etag(updated.version)
+    return updated
+
+
+@router.delete("/readers/{reader_id}", response_model=bool)
+async def delete_reader(reader_id: int, db: RequestSession = Depends(get_request_db), current_user: UserCreate = Depends(get_current_user_async)):
     """
     Delete a reader by their ID.
 
     Args:
         reader_id (int): ID of the reader to delete.
-        db (Session): Database session dependency.
+        db (RequestSession): Database session dependency.
         current_user (UserCreate): Currently authenticated user.
 
     Returns:
         bool: True if deletion was successful, False otherwise.
     """
-    reader_crud = ReaderCRUD(db)
-    return reader_crud.delete(reader_id)
+    reader_crud = AsyncReaderCRUD(db)
+    return await reader_crud.delete(reader_id)
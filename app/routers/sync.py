@@ -0,0 +1,45 @@
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+
+from ..config import Settings
+from ..core.database import get_db
+from ..core.security import get_read_only_user
+from ..crud.sync import SyncCRUD
+from ..schemas.sync import SyncChanges
+from ..schemas.user import UserCreate
+
+router = APIRouter()
+
+
+@router.get("/changes", response_model=SyncChanges)
+def get_changes(
+    since: Optional[str] = None,
+    limit: int = Query(Settings.SYNC_PAGE_DEFAULT_LIMIT, ge=1, le=Settings.SYNC_PAGE_MAX_LIMIT),
+    db=Depends(get_db),
+    current_user: UserCreate = Depends(get_read_only_user)
+):
+    """
+    Return the books and readers created, updated or deleted since a sync token.
+
+    Without `since` the feed starts from the beginning, which is a full sync in
+    pages. Clients apply `upserted` and `deleted` of each page, then request the
+    next one with `next_token` while `has_more` is true, and keep the last token
+    for their next sync.
+
+    Args:
+        since (Optional[str]): `next_token` of the previous page or sync.
+        limit (int): Maximum number of changes per entity in the page.
+        db (Session): Database session dependency.
+        current_user (UserCreate): Currently authenticated user.
+
+    Returns:
+        SyncChanges: Changes of the page, the next token and whether more changes are pending.
+
+    Raises:
+        HTTPException 400: If the sync token is invalid.
+    """
+    try:
+        return SyncCRUD(db).get_changes(since, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
 
 class BookCreate(BaseModel):
     """
@@ -10,6 +12,7 @@ class BookCreate(BaseModel):
         publication_year (int): The year the book was published.
         isbn (str): The unique ISBN identifier for the book.
         copies_available (int): Number of copies of the book available in the library.
+        description (Optional[str]): Free-text description or annotation of the book.
     """
 
     title: str
@@ -17,3 +20,78 @@ class BookCreate(BaseModel):
     publication_year: int
     isbn: str
     copies_available: int
+    description: Optional[str] = None
+
+
+class BookRead(BaseModel):
+    """
+    Schema for a book returned by the API.
+
+    Attributes:
+        id (int): ID of the book.
+        title (str | None): The title of the book.
+        author (str | None): The author of the book.
+        publication_year (int | None): The year the book was published.
+        isbn (str | None): The unique ISBN identifier for the book.
+        copies_available (int | None): Number of copies of the book available in the library.
+        description (str | None): Free-text description or annotation of the book.
+        version (int | None): Change version of the book; it grows with every change.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    title: Optional[str] = None
+    author: Optional[str] = None
+    publication_year: Optional[int] = None
+    isbn: Optional[str] = None
+    copies_available: Optional[int] = None
+    description: Optional[str] = None
+    version: Optional[int] = None
+
+
+class BookPage(BaseModel):
+    """
+    Schema for one page of books.
+
+    Attributes:
+        items (List[BookRead]): Books of the page.
+        next_cursor (str | None): Cursor of the next page; None on the last page.
+    """
+
+    items: List[BookRead]
+    next_cursor: Optional[str] = None
+
+
+class BookImportError(BaseModel):
+    """
+    Schema describing a row that could not be imported.
+
+    Attributes:
+        row (int): 1-based number of the record in the uploaded file.
+        isbn (Optional[str]): ISBN of the record, if it could be read.
+        error (str): Reason the row was rejected.
+    """
+
+    row: int
+    isbn: Optional[str] = None
+    error: str
+
+
+class BookImportReport(BaseModel):
+    """
+    Schema summarizing the outcome of a bulk book import.
+
+    Attributes:
+        inserted (int): Number of new books created.
+        updated (int): Number of existing books overwritten (upsert mode).
+        skipped (int): Number of rows skipped because the ISBN already exists (skip mode).
+        failed (int): Number of rows rejected; each one is listed in `errors`.
+        errors (List[BookImportError]): Per-row error report.
+    """
+
+    inserted: int = 0
+    updated: int = 0
+    skipped: int = 0
+    failed: int = 0
+    errors: List[BookImportError] = []
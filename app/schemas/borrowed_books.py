@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field
 from datetime import datetime
+from typing import List, Literal, Optional
+from ..config import Settings
 
 
 class BorrowedBookCreate(BaseModel):
@@ -13,3 +15,105 @@ class BorrowedBookCreate(BaseModel):
 
     book_id: int
     reader_id: int
+
+
+class LoanRead(BaseModel):
+    """
+    Schema for a loan record returned by the API.
+
+    Attributes:
+        id (int): ID of the loan record.
+        reader_id (int | None): ID of the reader who borrowed the book.
+        book_id (int | None): ID of the borrowed book.
+        date_borrowed (datetime | None): When the book was borrowed.
+        date_returned (datetime | None): When the book was returned, if it was.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    reader_id: Optional[int] = None
+    book_id: Optional[int] = None
+    date_borrowed: Optional[datetime] = None
+    date_returned: Optional[datetime] = None
+
+
+class CartOperation(BaseModel):
+    """
+    Schema for a single borrow or return inside a batch (cart) request.
+
+    Attributes:
+        action (str): Either "borrow" or "return".
+        reader_id (int): ID of the reader.
+        book_id (int): ID of the book.
+    """
+
+    action: Literal["borrow", "return"]
+    reader_id: int
+    book_id: int
+
+
+class CartRequest(BaseModel):
+    """
+    Schema for a batch of borrow/return operations applied in one transaction.
+
+    Attributes:
+        operations (List[CartOperation]): Operations, applied in the given order.
+    """
+
+    operations: List[CartOperation] = Field(min_length=1, max_length=Settings.CART_MAX_OPERATIONS)
+
+
+class CartItemResult(BaseModel):
+    """
+    Schema describing the outcome of one operation of a cart.
+
+    Attributes:
+        action (str): Either "borrow" or "return".
+        reader_id (int): ID of the reader.
+        book_id (int): ID of the book.
+        success (bool): Whether the operation was applied.
+        detail (str | None): Reason the operation was rejected, if it was.
+    """
+
+    action: Literal["borrow", "return"]
+    reader_id: int
+    book_id: int
+    success: bool
+    detail: Optional[str] = None
+
+
+class LoanHistoryItem(BaseModel):
+    """
+    Schema for one loan in a reader's history, with the book details inlined.
+
+    Attributes:
+        id (int): ID of the loan record.
+        book_id (int): ID of the borrowed book.
+        title (str | None): Title of the book; None if the book has been deleted.
+        author (str | None): Author of the book; None if the book has been deleted.
+        date_borrowed (datetime): When the book was borrowed.
+        date_returned (datetime | None): When the book was returned, if it was.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    book_id: int
+    title: Optional[str] = None
+    author: Optional[str] = None
+    date_borrowed: Optional[datetime] = None
+    date_returned: Optional[datetime] = None
+
+
+class LoanHistoryPage(BaseModel):
+    """
+    Schema for one page of a reader's loan history.
+
+    Attributes:
+        items (List[LoanHistoryItem]): Loans of the page, newest first.
+        next_cursor (str | None): Cursor of the next page; None on the last page.
+    """
+
+    items: List[LoanHistoryItem]
+    next_cursor: Optional[str] = None
@@ -1,4 +1,6 @@
-from pydantic import BaseModel
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
 
 class ReaderCreate(BaseModel):
     """
@@ -11,3 +13,24 @@ class ReaderCreate(BaseModel):
 
     name: str
     email: str
+
+
+class ReaderRead(BaseModel):
+    """
+    Schema for a reader returned by the API.
+
+    Attributes:
+        id (int): ID of the reader.
+        name (str | None): Full name of the reader.
+        email (str | None): Email address of the reader.
+        active_loans (int | None): Number of books the reader currently holds.
+        version (int | None): Change version of the reader; it grows with every change.
+    """
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: Optional[str] = None
+    email: Optional[str] = None
+    active_loans: Optional[int] = None
+    version: Optional[int] = None
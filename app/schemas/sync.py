@@ -0,0 +1,50 @@
+from typing import List
+
+from pydantic import BaseModel
+
+from .book import BookRead
+from .reader import ReaderRead
+
+
+class BookChanges(BaseModel):
+    """
+    Schema for the book changes of one sync page.
+
+    Attributes:
+        upserted (List[BookRead]): Books created or updated, in version order.
+        deleted (List[int]): IDs of deleted books, in version order.
+    """
+
+    upserted: List[BookRead] = []
+    deleted: List[int] = []
+
+
+class ReaderChanges(BaseModel):
+    """
+    Schema for the reader changes of one sync page.
+
+    Attributes:
+        upserted (List[ReaderRead]): Readers created or updated, in version order.
+        deleted (List[int]): IDs of deleted readers, in version order.
+    """
+
+    upserted: List[ReaderRead] = []
+    deleted: List[int] = []
+
+
+class SyncChanges(BaseModel):
+    """
+    Schema for one page of the change feed.
+
+    Attributes:
+        books (BookChanges): Book changes of the page.
+        readers (ReaderChanges): Reader changes of the page.
+        next_token (str): Token to pass as `since` to get the changes after this page.
+        has_more (bool): Whether more changes are available right away; if False the
+            client is up to date and should keep `next_token` for its next sync.
+    """
+
+    books: BookChanges
+    readers: ReaderChanges
+    next_token: str
+    has_more: bool
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 class UserCreate(BaseModel):
     """
@@ -10,3 +10,17 @@ class UserCreate(BaseModel):
     """
     email: str
     password: str
+
+
+class UserRead(BaseModel):
+    """
+    Schema for a user returned by the API; the password hash is never exposed.
+
+    Attributes:
+        id (int): ID of the user.
+        email (str): User's email address.
+    """
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    email: str
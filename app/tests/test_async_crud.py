@@ -0,0 +1,132 @@
+import asyncio
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.base import Base
+from app.core.database import to_async_url
+from app.crud.async_crud import AsyncBookCRUD, AsyncReaderCRUD
+from app.models.book import Book
+from app.models.reader import Reader
+from app.schemas.reader import ReaderCreate
+
+pytest.importorskip("aiosqlite")
+
+
+def seed(url):
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Book(title="Book", author="Author", publication_year=2000, isbn="isbn-1", copies_available=1),
+        Reader(name="Reader", email="reader@example.com"),
+    ])
+    session.commit()
+    session.close()
+    return engine
+
+
+def test_to_async_url_selects_async_drivers():
+    assert to_async_url("postgresql://u:p@db/library") == "postgresql+asyncpg://u:p@db/library"
+    assert to_async_url("postgresql+psycopg2://u:p@db/library") == "postgresql+asyncpg://u:p@db/library"
+    assert to_async_url("sqlite:///library.db") == "sqlite+aiosqlite:///library.db"
+
+
+def test_adapters_run_on_an_async_session(tmp_path):
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    url = f"sqlite:///{tmp_path / 'library.db'}"
+    seed(url).dispose()
+
+    async def scenario():
+        engine = create_async_engine(to_async_url(url))
+        async with async_sessionmaker(bind=engine, expire_on_commit=False)() as db:
+            borrowed = await AsyncReaderCRUD(db).borrow_book(1, 1)
+            book = await AsyncBookCRUD(db).get_by_id(1)
+            reader = await AsyncReaderCRUD(db).create(ReaderCreate(name="New", email="new@example.com"))
+        await engine.dispose()
+        return borrowed, book, reader
+
+    borrowed, book, reader = asyncio.run(scenario())
+
+    assert borrowed is True
+    assert book.copies_available == 0
+    assert reader.id == 2
+
+
+def test_adapters_move_sync_sessions_off_the_event_loop(tmp_path, monkeypatch):
+    from app.crud.reader import ReaderCRUD
+
+    engine = seed(f"sqlite:///{tmp_path / 'library.db'}")
+    db = sessionmaker(bind=engine, expire_on_commit=False)()
+    original = ReaderCRUD.get_all
+    threads = []
+
+    def get_all(self):
+        threads.append(threading.current_thread())
+        return original(self)
+
+    monkeypatch.setattr(ReaderCRUD, "get_all", get_all)
+
+    async def scenario():
+        return threading.current_thread(), await AsyncReaderCRUD(db).get_all()
+
+    try:
+        loop_thread, readers = asyncio.run(scenario())
+    finally:
+        db.close()
+        engine.dispose()
+
+    assert list(readers) == [1]
+    assert threads and threads[0] is not loop_thread
+
+
+def test_async_sessions_share_the_sqlite_writer_and_routing(tmp_path, monkeypatch):
+    from sqlalchemy import event, func, select
+    from app.config import Config
+    from app.core import database
+
+    url = f"sqlite:///{tmp_path / 'library.db'}"
+    seed(url).dispose()
+    # The URL is required and may be unset here, so preload its descriptor instead of reading the old value.
+    monkeypatch.setattr(vars(Config)["SQLALCHEMY_DATABASE_URL"], "_value", url)
+    monkeypatch.setattr(vars(Config)["SQLALCHEMY_DATABASE_URL"], "_loaded", True)
+    monkeypatch.setattr(Config, "SQLALCHEMY_REPLICA_URLS", [])
+    monkeypatch.setattr(Config, "SQLITE_PRODUCTION_MODE", True)
+    # Fail at once on a lock conflict instead of retrying, so a second writer connection would show up.
+    monkeypatch.setattr(Config, "SQLITE_BUSY_TIMEOUT_MS", 0)
+    database.get_async_engines.cache_clear()
+    database.get_async_sessionmaker.cache_clear()
+
+    async def create(index):
+        async with database.get_async_sessionmaker()() as db:
+            reader = await AsyncReaderCRUD(db).create(ReaderCreate(name=f"Reader {index}", email=f"r{index}@example.com"))
+            return reader.id
+
+    async def scenario():
+        writer, (reader,) = database.get_async_engines()
+        writes, reads = [], []
+        event.listen(writer.sync_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: writes.append(statement))
+        event.listen(reader.sync_engine, "before_cursor_execute", lambda conn, cursor, statement, *args: reads.append(statement))
+        try:
+            ids = await asyncio.gather(*(create(index) for index in range(20)))
+            async with database.get_async_sessionmaker()() as db:
+                total = await db.scalar(select(func.count(Reader.id)))
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+        return ids, total, writes, reads, writer.sync_engine.pool.size()
+
+    try:
+        ids, total, writes, reads, pool_size = asyncio.run(scenario())
+    finally:
+        database.get_async_engines.cache_clear()
+        database.get_async_sessionmaker.cache_clear()
+
+    assert sorted(ids) == list(range(2, 22))
+    assert total == 21
+    assert pool_size == 1
+    assert writes.count("BEGIN IMMEDIATE") == 20
+    assert reads and all(statement.lstrip().upper().startswith(("SELECT", "PRAGMA")) for statement in reads)
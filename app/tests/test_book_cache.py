@@ -0,0 +1,105 @@
+import pytest
+from sqlalchemy import event
+
+from app.core.cache import TTLCache
+from app.crud.book import BookCRUD, book_cache, invalidate_book
+from app.crud.reader import ReaderCRUD
+from app.models.book import Book
+from app.models.reader import Reader
+from app.schemas.book import BookCreate
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title="Cached", author="Author", publication_year=2000, isbn="isbn-1", copies_available=1),
+            Reader(name="Reader", email="reader@example.com"),
+        ])
+        session.commit()
+
+
+def count_book_queries(engine, action):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("SELECT") and "FROM books" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def new_book(title: str) -> BookCreate:
+    return BookCreate(title=title, author="Author", publication_year=2000, isbn="isbn-1", copies_available=1)
+
+
+def test_lookups_by_id_and_isbn_hit_the_cache(engine, db):
+    crud = BookCRUD(db)
+    before = book_cache.stats()
+
+    queries = count_book_queries(engine, lambda: (
+        crud.get_by_isbn("isbn-1"),
+        [crud.get_by_id(1) for _ in range(5)],
+        crud.get_by_isbn("isbn-1"),
+    ))
+
+    stats = book_cache.stats()
+    assert queries == 1
+    assert (stats["misses"] - before["misses"], stats["hits"] - before["hits"]) == (1, 7)
+    assert crud.get_by_id(1).title == "Cached"
+
+
+def test_writes_invalidate_the_cached_book(db):
+    crud = BookCRUD(db)
+    assert crud.get_by_id(1).title == "Cached"
+
+    crud.update(1, new_book("Updated"))
+    assert crud.get_by_id(1).title == "Updated"
+
+    ReaderCRUD(db).borrow_book(1, 1)
+    assert crud.get_by_id(1).copies_available == 0
+
+    crud.delete(1)
+    assert crud.get_by_id(1) is None
+    assert crud.get_by_isbn("isbn-1") is None
+
+
+def test_a_load_racing_an_invalidation_is_not_cached(engine, db, monkeypatch):
+    crud = BookCRUD(db)
+    original = BookCRUD._load_book
+
+    def load_then_write(self, condition):
+        values = original(self, condition)
+        invalidate_book(1)  # a writer commits and invalidates while the row is in flight
+        return values
+
+    monkeypatch.setattr(BookCRUD, "_load_book", load_then_write)
+    assert crud.get_by_id(1).title == "Cached"
+    monkeypatch.setattr(BookCRUD, "_load_book", original)
+
+    assert count_book_queries(engine, lambda: crud.get_by_id(1)) == 1
+    assert count_book_queries(engine, lambda: crud.get_by_id(1)) == 0
+
+
+def test_cache_is_bounded_by_entries_bytes_and_ttl(monkeypatch):
+    now = [0.0]
+    monkeypatch.setattr("app.core.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(max_entries=2, ttl_seconds=10, max_bytes=100)
+
+    cache.set("a", 1, size=40)
+    cache.set("b", 2, size=40)
+    cache.get("a")
+    cache.set("c", 3, size=40)
+    assert (cache.get("a"), cache.get("b"), cache.get("c")) == (1, None, 3)
+
+    cache.set("big", 4, size=90)
+    assert cache.stats()["bytes"] <= 100 and cache.get("big") == 4
+    assert cache.stats()["evictions"] == 3
+
+    now[0] = 11
+    assert cache.get("big") is None
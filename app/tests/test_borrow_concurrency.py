@@ -0,0 +1,121 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.config import Settings
+from app.core.base import Base
+from app.crud.reader import ReaderCRUD
+from app.models.book import Book
+from app.models.borrowed_books import BorrowedBooks
+from app.models.reader import Reader
+
+COPIES = 25
+PARALLEL_BORROWS = 300
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'concurrency.db'}",
+        connect_args={"timeout": 30, "check_same_thread": False},
+        pool_size=50,
+        max_overflow=0,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+    engine.dispose()
+
+
+def test_parallel_borrows_never_oversell(session_factory):
+    db = session_factory()
+    book = Book(title="Hot Book", author="Author", publication_year=2024, isbn=uuid.uuid4().hex, copies_available=COPIES)
+    readers = [Reader(name=f"Reader {i}", email=f"{uuid.uuid4().hex}@example.com") for i in range(PARALLEL_BORROWS)]
+    db.add(book)
+    db.add_all(readers)
+    db.commit()
+    book_id, reader_ids = book.id, [reader.id for reader in readers]
+    db.close()
+
+    def borrow(reader_id):
+        session = session_factory()
+        try:
+            return ReaderCRUD(session).borrow_book(reader_id, book_id)
+        except HTTPException as e:
+            return e.status_code
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=50) as pool:
+        results = list(pool.map(borrow, reader_ids))
+
+    successes = results.count(True)
+    assert successes == COPIES
+    assert results.count(400) == PARALLEL_BORROWS - COPIES
+
+    db = session_factory()
+    assert db.get(Book, book_id).copies_available == 0
+    assert db.query(BorrowedBooks).filter(BorrowedBooks.book_id == book_id).count() == successes
+    db.close()
+
+
+def test_parallel_borrows_respect_reader_limit(session_factory):
+    db = session_factory()
+    books = [
+        Book(title=f"Book {i}", author="Author", publication_year=2024, isbn=uuid.uuid4().hex, copies_available=1)
+        for i in range(20)
+    ]
+    reader = Reader(name="Busy Reader", email=f"{uuid.uuid4().hex}@example.com")
+    db.add_all(books + [reader])
+    db.commit()
+    book_ids, reader_id = [book.id for book in books], reader.id
+    db.close()
+
+    def borrow(book_id):
+        session = session_factory()
+        try:
+            return ReaderCRUD(session).borrow_book(reader_id, book_id)
+        except HTTPException as e:
+            return e.status_code
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(borrow, book_ids))
+
+    assert results.count(True) == Settings.MAX_ACTIVE_LOANS
+
+    db = session_factory()
+    assert db.get(Reader, reader_id).active_loans == Settings.MAX_ACTIVE_LOANS
+    assert ReaderCRUD(db).reconcile_active_loans() == 0
+    db.close()
+
+
+def test_reader_at_the_limit_gets_lookup_errors_first(session_factory):
+    db = session_factory()
+    books = [
+        Book(title=f"Book {i}", author="Author", publication_year=2024, isbn=uuid.uuid4().hex, copies_available=1)
+        for i in range(Settings.MAX_ACTIVE_LOANS + 2)
+    ]
+    reader = Reader(name="Busy Reader", email=f"{uuid.uuid4().hex}@example.com")
+    db.add_all(books + [reader])
+    db.commit()
+    crud = ReaderCRUD(db)
+    for book in books[:Settings.MAX_ACTIVE_LOANS]:
+        crud.borrow_book(reader.id, book.id)
+    books[-1].copies_available = 0
+    db.commit()
+
+    def error(reader_id, book_id):
+        with pytest.raises(HTTPException) as raised:
+            crud.borrow_book(reader_id, book_id)
+        return raised.value.status_code, raised.value.detail
+
+    assert error(reader.id + 1, 10_000) == (404, "Reader not found")
+    assert error(reader.id, 10_000) == (404, "Book not found")
+    assert error(reader.id, books[-1].id) == (400, "No available copies of the book")
+    assert error(reader.id, books[-2].id)[1].startswith("Reader has reached the borrowing limit")
+    db.close()
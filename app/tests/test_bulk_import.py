@@ -0,0 +1,83 @@
+import io
+
+import pytest
+from sqlalchemy import event, select
+
+from app.core.catalog_io import iter_book_records
+from app.crud.book import BookCRUD
+from app.models.book import Book
+
+HEADER = "title,author,publication_year,isbn,copies_available\n"
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add(Book(title="Existing", author="Author", publication_year=1990, isbn="isbn-1", copies_available=1))
+        session.commit()
+
+
+def csv_records(*rows):
+    return iter_book_records(io.StringIO(HEADER + "".join(row + "\n" for row in rows)), "csv")
+
+
+def titles(db):
+    return dict(db.execute(select(Book.isbn, Book.title)).all())
+
+
+def test_rows_are_written_in_batches(engine, db):
+    statements, commits = [], []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    report = BookCRUD(db).bulk_import(csv_records(*(f"T{i},A,2000,new-{i},1" for i in range(5))), batch_size=2)
+
+    assert (report.inserted, report.failed) == (5, 0)
+    assert len(commits) == 3
+    assert sum(statement.startswith("INSERT INTO books") for statement in statements) == 3
+
+
+def test_invalid_rows_are_reported_without_aborting_the_batch(db):
+    report = BookCRUD(db).bulk_import(csv_records("T1,A,2000,new-1,1", "T2,A,notayear,new-2,1", "T3,A,2000,new-3,1"), 10)
+
+    assert (report.inserted, report.failed) == (2, 1)
+    assert report.errors[0].row == 2 and report.errors[0].isbn == "new-2"
+    assert "publication_year" in report.errors[0].error
+
+
+def test_malformed_ndjson_lines_are_reported(db):
+    lines = '{"title":"T","author":"A","publication_year":2000,"isbn":"new-1","copies_available":1}\n{not json\n'
+
+    report = BookCRUD(db).bulk_import(iter_book_records(io.StringIO(lines), "ndjson"), 10)
+
+    assert (report.inserted, report.failed) == (1, 1)
+    assert report.errors[0].row == 2
+
+
+@pytest.mark.parametrize("policy, skipped, failed", [("skip", 2, 0), ("report", 0, 2)])
+def test_existing_and_repeated_isbns_are_left_untouched(db, policy, skipped, failed):
+    records = csv_records("Changed,A,2000,isbn-1,1", "First,A,2000,new-1,1", "Second,A,2000,new-1,1")
+
+    report = BookCRUD(db).bulk_import(records, batch_size=10, on_conflict=policy)
+
+    assert (report.inserted, report.updated, report.skipped, report.failed) == (1, 0, skipped, failed)
+    assert titles(db) == {"isbn-1": "Existing", "new-1": "First"}
+    if policy == "report":
+        assert [error.row for error in report.errors] == [1, 3]
+
+
+def test_upsert_overwrites_existing_books_and_evicts_them_from_the_cache(db):
+    crud = BookCRUD(db)
+    assert crud.get_by_isbn("isbn-1").title == "Existing"
+    version = crud.catalog_version()
+
+    report = crud.bulk_import(
+        csv_records("Changed,A,2001,isbn-1,4", "First,A,2000,new-1,1", "Second,A,2000,new-1,2"),
+        batch_size=10, on_conflict="upsert"
+    )
+
+    assert (report.inserted, report.updated, report.failed) == (1, 2, 0)
+    assert titles(db) == {"isbn-1": "Changed", "new-1": "Second"}
+    assert crud.get_by_isbn("isbn-1").copies_available == 4
+    assert crud.catalog_version() == version + 1
+    assert {book.version for book in db.scalars(select(Book))} == {version + 1}
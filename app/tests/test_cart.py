@@ -0,0 +1,82 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.core.base import Base
+from app.crud.change_counter import ChangeCounterCRUD
+from app.crud.reader import READERS_COUNTER, ReaderCRUD
+from app.models.book import Book
+from app.models.borrowed_books import BorrowedBooks
+from app.models.reader import Reader
+from app.schemas.borrowed_books import CartOperation
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cart.db'}")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Book(title="First", author="Author", publication_year=2000, isbn="1", copies_available=1),
+        Book(title="Second", author="Author", publication_year=2000, isbn="2", copies_available=1),
+        Reader(name="Reader", email="reader@example.com"),
+    ])
+    session.commit()
+    session.close()
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def cart(*operations):
+    return [CartOperation(action=action, reader_id=1, book_id=book_id) for action, book_id in operations]
+
+
+def test_operations_see_the_effect_of_earlier_ones(session_factory):
+    db = session_factory()
+    ReaderCRUD(db).borrow_book(1, 1)
+
+    results = ReaderCRUD(db).process_cart(cart(("return", 1), ("borrow", 1), ("borrow", 2), ("borrow", 2)))
+
+    assert [result.success for result in results] == [True, True, True, False]
+    assert results[3].detail == "No available copies of the book"
+    assert db.get(Reader, 1).active_loans == 2
+    assert db.scalar(select(Book.copies_available).where(Book.id == 2)) == 0
+    db.close()
+
+
+def test_concurrent_change_rolls_back_the_whole_cart(engine, session_factory):
+    db = session_factory()
+    readers_version = ChangeCounterCRUD(db).current(READERS_COUNTER)
+
+    # Another client takes the last copy after the cart read its snapshot, right before its first write.
+    def take_last_copy(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE") and not taken:
+            taken.append(True)
+            other = session_factory()
+            other.execute(update(Book).where(Book.id == 2).values(copies_available=0))
+            other.commit()
+            other.close()
+
+    taken = []
+    event.listen(engine, "before_cursor_execute", take_last_copy)
+    try:
+        with pytest.raises(HTTPException) as conflict:
+            ReaderCRUD(db).process_cart(cart(("borrow", 1), ("borrow", 2)))
+    finally:
+        event.remove(engine, "before_cursor_execute", take_last_copy)
+
+    assert conflict.value.status_code == 409
+    db.close()
+    db = session_factory()
+    assert db.get(Reader, 1).active_loans == 0
+    assert db.get(Reader, 1).version == 0
+    assert db.scalar(select(Book.copies_available).where(Book.id == 1)) == 1
+    assert db.scalars(select(BorrowedBooks)).all() == []
+    assert ChangeCounterCRUD(db).current(READERS_COUNTER) == readers_version
+    db.close()
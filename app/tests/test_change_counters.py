@@ -0,0 +1,136 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.base import Base
+from app.crud.book import BOOKS_COUNTER
+from app.crud.change_counter import ChangeCounterCRUD
+from app.crud.reader import READERS_COUNTER, ReaderCRUD
+from app.models.book import Book
+from app.models.reader import Reader
+
+READERS = 40
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'counters.db'}",
+        connect_args={"timeout": 30, "check_same_thread": False},
+        pool_size=20,
+        max_overflow=0,
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine):
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def seed(session_factory, copies):
+    db = session_factory()
+    book = Book(title="Book", author="Author", publication_year=2024, isbn=uuid.uuid4().hex, copies_available=copies)
+    readers = [Reader(name=f"Reader {i}", email=f"{uuid.uuid4().hex}@example.com") for i in range(READERS)]
+    db.add(book)
+    db.add_all(readers)
+    db.commit()
+    db.close()
+    return book.id, [reader.id for reader in readers]
+
+
+def test_parallel_borrows_and_returns_get_unique_versions(session_factory):
+    book_id, reader_ids = seed(session_factory, copies=READERS)
+
+    def borrow_and_return(reader_id):
+        session = session_factory()
+        try:
+            return ReaderCRUD(session).borrow_book(reader_id, book_id) and ReaderCRUD(session).return_borrowed_book(
+                reader_id, book_id
+            )
+        except HTTPException as e:
+            return e.status_code
+        finally:
+            session.close()
+
+    with ThreadPoolExecutor(max_workers=20) as pool:
+        results = list(pool.map(borrow_and_return, reader_ids))
+
+    db = session_factory()
+    versions = [db.get(Reader, reader_id).version for reader_id in reader_ids]
+    counters = ChangeCounterCRUD(db)
+    readers_version, books_version = counters.current(READERS_COUNTER), counters.current(BOOKS_COUNTER)
+    book_version = db.get(Book, book_id).version
+    db.close()
+
+    assert results == [True] * READERS
+    assert readers_version == books_version == 2 * READERS
+    assert len(set(versions)) == READERS
+    assert max(versions) == readers_version
+    assert book_version == books_version
+
+
+@pytest.mark.parametrize("operation", ["borrow", "return", "cart"])
+def test_counters_are_bumped_by_the_last_writes_before_commit(engine, session_factory, operation):
+    from app.schemas.borrowed_books import CartOperation
+
+    book_id, (reader_id, *_) = seed(session_factory, copies=1)
+    if operation != "borrow":
+        with session_factory() as db:
+            ReaderCRUD(db).borrow_book(reader_id, book_id)
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    with session_factory() as db:
+        crud = ReaderCRUD(db)
+        if operation == "borrow":
+            crud.borrow_book(reader_id, book_id)
+        elif operation == "return":
+            crud.return_borrowed_book(reader_id, book_id)
+        else:
+            crud.process_cart([CartOperation(action="return", reader_id=reader_id, book_id=book_id)])
+
+    writes = [statement.split()[:3] for statement in statements if statement.split()[0] in ("INSERT", "UPDATE")]
+    assert writes[-4:] == [
+        ["UPDATE", "change_counters", "SET"],
+        ["UPDATE", "readers", "SET"],
+        ["UPDATE", "change_counters", "SET"],
+        ["UPDATE", "books", "SET"],
+    ]
+    assert all(write[1] != "change_counters" for write in writes[:-4])
+
+
+@pytest.mark.parametrize("operation", ["create_book", "update_book", "delete_book", "create_reader", "update_reader"])
+def test_single_row_writes_bump_last(engine, session_factory, operation):
+    from app.crud.book import BookCRUD
+    from app.schemas.book import BookCreate
+    from app.schemas.reader import ReaderCreate
+
+    book_id, (reader_id, *_) = seed(session_factory, copies=1)
+    book = BookCreate(title="New", author="Author", publication_year=2000, isbn="new-isbn", copies_available=1)
+    reader = ReaderCreate(name="New", email="new@example.com")
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+    with session_factory() as db:
+        if operation == "create_book":
+            BookCRUD(db).create(book)
+        elif operation == "update_book":
+            BookCRUD(db).update(book_id, book, expected_version=0)
+        elif operation == "delete_book":
+            BookCRUD(db).delete(book_id)
+        elif operation == "create_reader":
+            ReaderCRUD(db).create(reader)
+        else:
+            ReaderCRUD(db).update(reader_id, reader, expected_version=0)
+
+    writes = [statement.split()[:2] for statement in statements if statement.split()[0] in ("INSERT", "UPDATE", "DELETE")]
+    assert writes[-2] == ["UPDATE", "change_counters"]
+    assert writes[-1][0] == "UPDATE"
+    assert all(write[1] != "change_counters" for write in writes[:-2])
@@ -0,0 +1,47 @@
+import threading
+import time
+
+from sqlalchemy import create_engine
+
+from app.config import Config
+from app.core.engine import InstrumentedQueuePool, engine_options, is_memory_database, pool_stats
+
+
+def test_memory_databases_get_no_pool_sizing():
+    assert is_memory_database("sqlite://")
+    assert is_memory_database("sqlite:///file:db?mode=memory&uri=true")
+    assert not is_memory_database("sqlite:///library.db")
+    assert "pool_size" not in engine_options("sqlite://")
+    assert engine_options("sqlite:///library.db")["poolclass"] is InstrumentedQueuePool
+
+
+def test_statement_timeout_is_passed_to_postgresql(monkeypatch):
+    monkeypatch.setattr(Config, "SQLALCHEMY_STATEMENT_TIMEOUT_MS", 5000)
+
+    sync = engine_options("postgresql://u:p@db/library")
+    async_ = engine_options("postgresql+asyncpg://u:p@db/library", is_async=True)
+
+    assert sync["connect_args"]["options"] == "-c statement_timeout=5000"
+    assert async_["connect_args"]["server_settings"] == {"statement_timeout": "5000"}
+    assert "connect_args" not in engine_options("sqlite:///library.db")
+
+
+def test_pool_stats_report_checkouts_and_waits(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SQLALCHEMY_POOL_SIZE", 1)
+    monkeypatch.setattr(Config, "SQLALCHEMY_MAX_OVERFLOW", 0)
+    url = f"sqlite:///{tmp_path / 'pool.db'}"
+    engine = create_engine(url, **engine_options(url))
+
+    held = engine.connect()
+    waiter = threading.Thread(target=lambda: engine.connect().close())
+    waiter.start()
+    time.sleep(0.2)
+    busy = pool_stats(engine)
+    held.close()
+    waiter.join()
+    stats = pool_stats(engine)
+    engine.dispose()
+
+    assert busy["checked_out"] == 1 and busy["size"] == 1
+    assert stats["checkouts"] == 2
+    assert stats["wait_seconds_max"] >= 0.2
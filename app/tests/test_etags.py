@@ -0,0 +1,90 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.core.security import get_read_only_user
+from app.crud.book import BookCRUD
+from app.crud.change_counter import ChangeCounterCRUD
+from app.crud.reader import ReaderCRUD
+from app.models.reader import Reader
+from app.routers.books import router as book_router
+from app.schemas.book import BookCreate
+
+
+def new_book(isbn: str) -> BookCreate:
+    return BookCreate(title="Title", author="Author", publication_year=2000, isbn=isbn, copies_available=1)
+
+
+def test_every_book_change_bumps_the_catalog_version(db):
+    crud = BookCRUD(db)
+    assert crud.catalog_version() == 0
+
+    book = crud.create(new_book("1"))
+    assert book.version == crud.catalog_version() == 1
+
+    crud.update(book.id, new_book("1"))
+    assert crud.get_version(book.id) == crud.catalog_version() == 2
+
+    db.add(Reader(name="Reader", email="reader@example.com"))
+    db.commit()
+    ReaderCRUD(db).borrow_book(1, book.id)
+    ReaderCRUD(db).return_borrowed_book(1, book.id)
+    assert crud.get_version(book.id) == crud.catalog_version() == 4
+
+    crud.delete(book.id)
+    assert crud.get_version(book.id) is None
+    assert crud.catalog_version() == 5
+
+    crud.delete(book.id)
+    assert crud.catalog_version() == 5
+
+
+def test_failed_borrow_does_not_bump(db):
+    crud = BookCRUD(db)
+    book = crud.create(new_book("1").model_copy(update={"copies_available": 0}))
+    db.add(Reader(name="Reader", email="reader@example.com"))
+    db.commit()
+
+    with pytest.raises(Exception):
+        ReaderCRUD(db).borrow_book(1, book.id)
+
+    assert crud.catalog_version() == book.version
+
+
+def test_counter_is_created_on_first_bump(db):
+    counters = ChangeCounterCRUD(db)
+
+    assert counters.current("other") == 0
+    assert [counters.bump("other"), counters.bump("other")] == [1, 2]
+
+
+def test_conditional_get_returns_304_until_the_book_changes(session_factory):
+    app = FastAPI()
+    app.include_router(book_router, prefix="/api/books")
+
+    def session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_only_user] = lambda: None
+    client = TestClient(app)
+    db = session_factory()
+    book = BookCRUD(db).create(new_book("1"))
+
+    for url in (f"/api/books/{book.id}", "/api/books/?limit=5"):
+        first = client.get(url)
+        etag = first.headers["etag"]
+        assert first.status_code == 200
+
+        cached = client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304 and cached.content == b"" and cached.headers["etag"] == etag
+
+        BookCRUD(db).update(book.id, new_book("1").model_copy(update={"title": url}))
+        changed = client.get(url, headers={"If-None-Match": etag})
+        assert changed.status_code == 200 and changed.headers["etag"] != etag
+    db.close()
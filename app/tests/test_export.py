@@ -0,0 +1,71 @@
+import csv
+import io
+import json
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core.catalog_io import EXPORT_COLUMNS, iter_export_chunks
+from app.core.security import get_read_only_user
+from app.crud.book import BookCRUD
+from app.models.book import Book
+from app.routers import books as books_router
+
+BOOKS = 7
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title=f"Title, {i}", author="Author", publication_year=2000 + i, isbn=str(i), copies_available=i,
+                 description='Say "hi"\nor ünïcode' if i == 1 else None)
+            for i in range(1, BOOKS + 1)
+        ])
+        session.commit()
+
+
+def test_export_reads_the_catalog_in_batches_with_one_query(engine, db):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+    batches = [list(batch) for batch in BookCRUD(db).iter_export(["id", "isbn"], batch_size=3)]
+
+    assert [len(batch) for batch in batches] == [3, 3, 1]
+    assert [tuple(row) for batch in batches for row in batch] == [(i, str(i)) for i in range(1, BOOKS + 1)]
+    assert len(statements) == 1
+
+
+def test_chunks_are_emitted_per_batch():
+    batches = [[(1, "T", "A", 2000, "1", 1, None)], [(2, "U", "B", 2001, "2", 0, "x")]]
+
+    csv_chunks = list(iter_export_chunks(iter(batches), "csv"))
+    ndjson_chunks = list(iter_export_chunks(iter(batches), "ndjson"))
+
+    assert len(csv_chunks) == 3 and csv_chunks[0] == ",".join(EXPORT_COLUMNS) + "\r\n"
+    assert len(ndjson_chunks) == 2
+    assert json.loads(ndjson_chunks[1]) == dict(zip(EXPORT_COLUMNS, batches[1][0]))
+    with pytest.raises(ValueError):
+        list(iter_export_chunks(iter(batches), "xml"))
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+def test_export_endpoint_streams_every_book(session_factory, monkeypatch, fmt):
+    monkeypatch.setattr(books_router, "SessionLocal", session_factory)
+    monkeypatch.setattr(books_router.Settings, "BOOK_EXPORT_BATCH_SIZE", 2)
+    app = FastAPI()
+    app.include_router(books_router.router, prefix="/api/books")
+    app.dependency_overrides[get_read_only_user] = lambda: None
+
+    response = TestClient(app).get("/api/books/export", params={"format": fmt})
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == f'attachment; filename="books.{fmt}"'
+    if fmt == "csv":
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+    else:
+        rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [str(row["id"]) for row in rows] == [str(i) for i in range(1, BOOKS + 1)]
+    assert rows[0]["title"] == "Title, 1" and rows[0]["description"] == 'Say "hi"\nor ünïcode'
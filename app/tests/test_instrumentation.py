@@ -0,0 +1,63 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import StaticPool
+
+from app.config import Settings
+from app.core.instrumentation import SQLInstrumentationMiddleware
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool)
+    yield engine
+    engine.dispose()
+
+
+def build_client(engine, sample_rate):
+    app = FastAPI()
+    app.add_middleware(SQLInstrumentationMiddleware, sample_rate=sample_rate)
+
+    @app.get("/lookups/{count}")
+    def lookups(count: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            for i in range(count):
+                conn.execute(text("SELECT :i"), {"i": i})
+        return {}
+
+    return TestClient(app)
+
+
+def test_server_timing_reports_statement_count_and_time(engine):
+    response = build_client(engine, sample_rate=1.0).get("/lookups/2")
+
+    timing = response.headers["server-timing"]
+    assert 'desc="3 queries"' in timing
+    assert timing.startswith("db;dur=") and "app;dur=" in timing
+
+
+def test_repeated_statements_are_logged_as_n_plus_one(engine, caplog):
+    client = build_client(engine, sample_rate=1.0)
+
+    with caplog.at_level(logging.INFO, logger="app.sql"):
+        client.get("/lookups/1")
+        client.get(f"/lookups/{Settings.SQL_N_PLUS_ONE_THRESHOLD}")
+
+    quiet, noisy = caplog.records
+    assert quiet.levelno == logging.INFO and quiet.n_plus_one == []
+    assert noisy.levelno == logging.WARNING
+    assert noisy.n_plus_one == [{"statement": "SELECT ?", "count": Settings.SQL_N_PLUS_ONE_THRESHOLD}]
+    assert noisy.db_statements == Settings.SQL_N_PLUS_ONE_THRESHOLD + 1
+    assert noisy.path == f"/lookups/{Settings.SQL_N_PLUS_ONE_THRESHOLD}" and noisy.status == 200
+
+
+def test_unsampled_requests_are_not_instrumented(engine, caplog):
+    with caplog.at_level(logging.INFO, logger="app.sql"):
+        response = build_client(engine, sample_rate=0.0).get("/lookups/1")
+
+    assert "server-timing" not in response.headers
+    assert not caplog.records
@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.pagination import encode_cursor
+from app.crud.reader import ReaderCRUD
+from app.models.book import Book
+from app.models.borrowed_books import BorrowedBooks
+from app.models.reader import Reader
+
+START = datetime(2026, 1, 1)
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title=f"Book {i}", author="Author", publication_year=2000, isbn=str(i), copies_available=1)
+            for i in range(1, 4)
+        ] + [Reader(name="Reader", email="reader@example.com")])
+        session.add_all([
+            BorrowedBooks(reader_id=1, book_id=i % 3 + 1, date_borrowed=START + timedelta(days=i),
+                          date_returned=None if i >= 5 else START + timedelta(days=i + 1))
+            for i in range(7)
+        ])
+        session.commit()
+
+
+def test_pages_walk_the_history_newest_first_with_book_details(db):
+    crud = ReaderCRUD(db)
+
+    first, after = crud.get_loan_history(1, limit=4)
+    second, last = crud.get_loan_history(1, limit=4, after=after)
+
+    assert [loan.id for loan in first + second] == [7, 6, 5, 4, 3, 2, 1]
+    assert last is None
+    assert first[0].title == "Book 1" and first[0].author == "Author"
+
+
+def test_filters_select_open_loans_and_date_ranges(db):
+    crud = ReaderCRUD(db)
+
+    active, _ = crud.get_loan_history(1, limit=10, active=True)
+    ranged, _ = crud.get_loan_history(1, limit=10, borrowed_from=START + timedelta(days=2),
+                                      borrowed_to=START + timedelta(days=4))
+
+    assert [loan.id for loan in active] == [7, 6]
+    assert [loan.id for loan in ranged] == [4, 3]
+
+
+@pytest.mark.parametrize("cursor", [encode_cursor(["5"]), encode_cursor([5.5]), encode_cursor([True]), "%%%"])
+def test_invalid_cursor_is_a_400(db, cursor):
+    with pytest.raises(HTTPException) as error:
+        ReaderCRUD(db).get_loan_history(1, limit=10, after=cursor)
+
+    assert error.value.status_code == 400
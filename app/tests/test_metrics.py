@@ -0,0 +1,52 @@
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.metrics import REGISTRY, Counter, Histogram, MetricsMiddleware
+from app.routers.metrics import router as metrics_router
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, "/books")
+
+    lines = histogram.collect()
+
+    assert 'latency_seconds_bucket{route="/books",le="0.1"} 1' in lines
+    assert 'latency_seconds_bucket{route="/books",le="1.0"} 3' in lines
+    assert 'latency_seconds_bucket{route="/books",le="+Inf"} 4' in lines
+    assert 'latency_seconds_count{route="/books"} 4' in lines
+    assert 'latency_seconds_sum{route="/books"} 4.05' in lines
+
+
+def test_label_values_are_escaped():
+    counter = Counter("events_total", "Events.", ("name",))
+    counter.inc('say "hi"\n')
+
+    assert 'events_total{name="say \\"hi\\"\\n"} 1.0' in counter.collect()
+
+
+def test_requests_are_labelled_by_route_template_and_status():
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router)
+
+    @app.get("/api/widgets/{widget_id}")
+    def get_widget(widget_id: int):
+        if widget_id == 0:
+            raise HTTPException(status_code=404)
+        return {}
+
+    client = TestClient(app)
+    for widget_id in (1, 2, 0):
+        client.get(f"/api/widgets/{widget_id}")
+    client.get("/does-not-exist")
+    body = client.get("/metrics").text
+
+    assert 'http_requests_total{method="GET",route="/api/widgets/{widget_id}",status="200"} 2.0' in body
+    assert 'http_requests_total{method="GET",route="/api/widgets/{widget_id}",status="404"} 1.0' in body
+    assert 'http_requests_total{method="GET",route="unmatched",status="404"} 1.0' in body
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/widgets/{widget_id}"} 3' in body
+    assert "# TYPE password_hash_queue_depth gauge" in body
+    assert 'cache_entries{cache="book"}' in body
+    assert REGISTRY.render().startswith("# HELP")
@@ -0,0 +1,97 @@
+import pytest
+from fastapi import HTTPException
+
+from app.core.conditional import VersionConflict, resolve_expected_version, version_etag
+from app.crud.book import BookCRUD
+from app.crud.reader import ReaderCRUD
+from app.schemas.book import BookCreate
+from app.schemas.reader import ReaderCreate
+
+
+def new_book(title: str) -> BookCreate:
+    return BookCreate(title=title, author="Author", publication_year=2000, isbn="1", copies_available=1)
+
+
+def test_resolve_expected_version():
+    assert resolve_expected_version(None) is None
+    assert resolve_expected_version(None, 7) == 7
+    assert resolve_expected_version(version_etag(12), 7) == 12
+    assert resolve_expected_version("*", 7) is None
+
+    for header in ('W/"v12"', '"v12", "v13"', '"abc"', "v12"):
+        with pytest.raises(VersionConflict):
+            resolve_expected_version(header)
+
+
+def test_stale_book_update_is_rejected(db):
+    crud = BookCRUD(db)
+    book = crud.create(new_book("Original"))
+
+    mine = crud.update(book.id, new_book("Mine"), expected_version=book.version)
+    assert mine.title == "Mine" and mine.version > book.version
+
+    with pytest.raises(VersionConflict):
+        crud.update(book.id, new_book("Theirs"), expected_version=book.version)
+
+    assert crud.get_by_id(book.id).title == "Mine"
+    assert crud.get_version(book.id) == mine.version
+    assert crud.update(book.id, new_book("Last"), expected_version=None).title == "Last"
+    assert crud.update(999, new_book("Missing"), expected_version=book.version) is None
+
+
+def test_book_update_replaces_every_field(db):
+    crud = BookCRUD(db)
+    book = crud.create(new_book("Original").model_copy(update={"description": "Annotated"}))
+
+    updated = crud.update(book.id, new_book("Replaced"))
+
+    assert (updated.title, updated.description) == ("Replaced", None)
+
+
+def test_stale_reader_update_is_rejected(db):
+    crud = ReaderCRUD(db)
+    reader = crud.create(ReaderCreate(name="Reader", email="reader@example.com"))
+
+    updated = crud.update(reader.id, ReaderCreate(name="Mine", email="reader@example.com"), expected_version=reader.version)
+    assert updated.name == "Mine" and updated.version > reader.version
+
+    with pytest.raises(HTTPException) as conflict:
+        crud.update(reader.id, ReaderCreate(name="Theirs", email="reader@example.com"), expected_version=reader.version)
+    assert conflict.value.status_code == 412
+
+    with pytest.raises(HTTPException) as missing:
+        crud.update(999, ReaderCreate(name="Missing", email="missing@example.com"), expected_version=reader.version)
+    assert missing.value.status_code == 404
+
+    assert crud.get_by_id(reader.id).name == "Mine"
+
+
+def test_if_match_any_requires_an_existing_row(db):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from app.core.database import get_db, get_request_db
+    from app.core.security import get_current_user, get_current_user_async
+    from app.routers.books import router as book_router
+    from app.routers.reader import router as reader_router
+
+    app = FastAPI()
+    app.include_router(book_router, prefix="/api/books")
+    app.include_router(reader_router, prefix="/api/reader")
+    app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_request_db] = lambda: db
+    app.dependency_overrides[get_current_user] = lambda: None
+    app.dependency_overrides[get_current_user_async] = lambda: None
+    client = TestClient(app)
+    book = BookCRUD(db).create(new_book("Original"))
+    reader = ReaderCRUD(db).create(ReaderCreate(name="Reader", email="reader@example.com"))
+    headers = {"If-Match": "*"}
+    book_body = new_book("Mine").model_dump()
+    reader_body = {"name": "Mine", "email": "reader@example.com"}
+
+    assert client.put(f"/api/books/{book.id}", json=book_body, headers=headers).status_code == 200
+    assert client.put("/api/books/999", json=book_body, headers=headers).status_code == 412
+    assert client.put("/api/books/999", json=book_body).json() is None
+    assert client.put(f"/api/reader/readers/{reader.id}", json=reader_body, headers=headers).status_code == 200
+    assert client.put("/api/reader/readers/999", json=reader_body, headers=headers).status_code == 412
+    assert client.put("/api/reader/readers/999", json=reader_body).status_code == 404
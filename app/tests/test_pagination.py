@@ -0,0 +1,88 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.database import get_db
+from app.core.pagination import decode_cursor, encode_cursor
+from app.core.security import get_read_only_user
+from app.crud.book import BookCRUD
+from app.models.book import Book
+from app.routers.books import router as book_router
+
+TITLES = ["B", None, "A", None, "C", "A", None]
+YEARS = [2001, None, 1999, 2001, None, 1999, 2000]
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title=title, author="Author", publication_year=year, isbn=str(i), copies_available=1)
+            for i, (title, year) in enumerate(zip(TITLES, YEARS), start=1)
+        ])
+        session.commit()
+
+
+def walk(crud, sort, limit):
+    ids, after = [], None
+    while True:
+        books, after = crud.get_page(limit=limit, after=after, sort=sort)
+        ids.extend(book.id for book in books)
+        if after is None:
+            return ids
+
+
+@pytest.mark.parametrize("sort", ["id", "title", "publication_year"])
+@pytest.mark.parametrize("limit", [1, 2, 3, 10])
+def test_pages_cover_every_book_once_across_null_sort_values(db, sort, limit):
+    def key(book):
+        value = getattr(book, sort)
+        return (value is not None, value if value is not None else 0, book.id)
+
+    expected = [book.id for book in sorted(db.query(Book).all(), key=key)]
+
+    assert walk(BookCRUD(db), sort, limit) == expected
+
+
+@pytest.mark.parametrize("sort, cursor", [
+    ("id", encode_cursor(["1"])),
+    ("id", encode_cursor([True])),
+    ("id", encode_cursor([1, 2])),
+    ("title", encode_cursor(["A", "3"])),
+    ("title", encode_cursor([1999, 3])),
+    ("publication_year", encode_cursor(["A", 3])),
+    ("publication_year", encode_cursor([{"year": 1999}, 3])),
+    ("id", "not a cursor"),
+])
+def test_cursors_of_the_wrong_shape_or_type_are_rejected(db, sort, cursor):
+    with pytest.raises(ValueError):
+        BookCRUD(db).get_page(limit=2, after=cursor, sort=sort)
+
+
+def test_decode_cursor_accepts_null_only_where_allowed():
+    cursor = encode_cursor([None, 4])
+
+    assert decode_cursor(cursor, 2, types=[(str, type(None)), (int,)]) == [None, 4]
+    with pytest.raises(ValueError):
+        decode_cursor(cursor, 2, types=[(str,), (int,)])
+
+
+def test_invalid_cursor_is_a_400(session_factory):
+    app = FastAPI()
+    app.include_router(book_router, prefix="/api/books")
+
+    def session():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = session
+    app.dependency_overrides[get_read_only_user] = lambda: None
+    client = TestClient(app)
+
+    response = client.get("/api/books/", params={"after": encode_cursor(["1"])})
+
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+import time
+
+import pytest
+from fastapi import HTTPException
+
+from app.core.hashing import PasswordHasher
+
+
+def slow_hash(seconds):
+    time.sleep(seconds)
+    return "hashed"
+
+
+def test_event_loop_keeps_running_while_hashing():
+    hasher = PasswordHasher(workers=2, max_pending=10, queue_timeout=5)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        results = await asyncio.gather(*(hasher.run(slow_hash, 0.2) for _ in range(2)))
+        task.cancel()
+        return results, ticks
+
+    results, ticks = asyncio.run(scenario())
+
+    assert results == ["hashed", "hashed"]
+    assert ticks >= 10
+    assert hasher.stats()["completed"] == 2
+
+
+def test_saturated_pool_rejects_new_jobs():
+    hasher = PasswordHasher(workers=1, max_pending=2, queue_timeout=5)
+    release = threading.Event()
+
+    async def scenario():
+        running = [asyncio.ensure_future(hasher.run(release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as exc:
+            await hasher.run(release.wait)
+        release.set()
+        await asyncio.gather(*running)
+        return exc.value
+
+    error = asyncio.run(scenario())
+
+    assert error.status_code == 503
+    stats = hasher.stats()
+    assert stats["rejected"] == 1
+    assert stats["queue_depth"] == 0 and stats["in_flight"] == 0
+
+
+def test_jobs_waiting_past_the_timeout_are_dropped():
+    hasher = PasswordHasher(workers=1, max_pending=10, queue_timeout=0.05)
+
+    async def scenario():
+        return await asyncio.gather(
+            hasher.run(slow_hash, 0.2), hasher.run(slow_hash, 0.2), return_exceptions=True
+        )
+
+    first, second = asyncio.run(scenario())
+
+    assert first == "hashed"
+    assert isinstance(second, HTTPException) and second.status_code == 503
+    assert hasher.stats()["timed_out"] == 1
+
+
+def test_queued_job_fails_at_the_deadline_without_running():
+    hasher = PasswordHasher(workers=1, max_pending=10, queue_timeout=0.05)
+    release = threading.Event()
+    calls = []
+
+    async def scenario():
+        blocker = asyncio.ensure_future(hasher.run(release.wait))
+        await asyncio.sleep(0.01)
+        started = time.perf_counter()
+        with pytest.raises(HTTPException) as exc:
+            await hasher.run(calls.append, "queued")
+        waited = time.perf_counter() - started
+        release.set()
+        await blocker
+        return exc.value, waited
+
+    error, waited = asyncio.run(scenario())
+
+    assert error.status_code == 503
+    assert waited < 1
+    assert calls == []
+    stats = hasher.stats()
+    assert stats["timed_out"] == 1 and stats["completed"] == 1 and stats["queue_depth"] == 0
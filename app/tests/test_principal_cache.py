@@ -0,0 +1,141 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event
+
+from app.config import Config
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    get_current_user,
+    get_read_only_user,
+    refresh_tokens
+)
+from app.crud.refresh_token import RefreshTokenCRUD
+from app.models.user import User
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add(User(email="user@example.com", password="hash"))
+        session.commit()
+
+
+def count_user_queries(engine, action):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "FROM users" in statement:
+            statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return len(statements)
+
+
+def test_principal_is_loaded_once_per_subject(engine, db):
+    token = create_access_token({"sub": "user@example.com"})
+
+    queries = count_user_queries(engine, lambda: [get_current_user(token, db) for _ in range(10)])
+
+    assert queries == 1
+    assert get_current_user(token, db).email == "user@example.com"
+
+
+def test_deleted_user_is_rejected_after_invalidation(engine, db):
+    from app.core.security import invalidate_principal
+
+    token = create_access_token({"sub": "user@example.com"})
+    get_current_user(token, db)
+    db.query(User).delete()
+    db.commit()
+    invalidate_principal("user@example.com")
+
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(token, db)
+    assert exc.value.status_code == 401
+
+
+def test_trusted_claims_skip_the_lookup(engine, db, monkeypatch):
+    monkeypatch.setattr(Config, "AUTH_TRUST_TOKEN_CLAIMS", True)
+    token = create_access_token({"sub": "user@example.com", "uid": 1})
+
+    queries = count_user_queries(engine, lambda: get_read_only_user(token, db))
+
+    assert queries == 0
+    assert get_read_only_user(token, db).id == 1
+
+
+def assert_rejected(token, db):
+    with pytest.raises(HTTPException) as exc:
+        get_current_user(token, db)
+    assert exc.value.status_code == 401
+
+
+def test_rotated_session_is_rejected_immediately(engine, db):
+    first = refresh_tokens(create_refresh_token({"sub": "user@example.com"}, db), db)
+    assert get_current_user(first["access_token"], db).email == "user@example.com"
+
+    second = refresh_tokens(first["refresh_token"], db)
+
+    assert_rejected(first["access_token"], db)
+    assert get_current_user(second["access_token"], db).email == "user@example.com"
+
+
+def test_deleted_session_is_rejected_immediately(engine, db):
+    tokens = refresh_tokens(create_refresh_token({"sub": "user@example.com"}, db), db)
+    get_current_user(tokens["access_token"], db)
+
+    assert RefreshTokenCRUD(db).delete(tokens["refresh_token"])
+
+    assert_rejected(tokens["access_token"], db)
+
+
+def test_purged_session_is_rejected_immediately(engine, db):
+    from datetime import timedelta
+    from app.crud.refresh_token import hash_token, utcnow
+    from app.models.refresh_token import RefreshToken
+
+    tokens = refresh_tokens(create_refresh_token({"sub": "user@example.com"}, db), db)
+    get_current_user(tokens["access_token"], db)
+    db.query(RefreshToken).filter(RefreshToken.token_hash == hash_token(tokens["refresh_token"])).update(
+        {"expires_at": utcnow() - timedelta(minutes=1)}
+    )
+    db.commit()
+
+    assert RefreshTokenCRUD(db).purge_expired(batch_size=10) == 1
+
+    assert_rejected(tokens["access_token"], db)
+
+
+def test_tokens_without_session_skip_the_check(engine, db):
+    create_refresh_token({"sub": "user@example.com"}, db)
+
+    assert get_current_user(create_access_token({"sub": "user@example.com"}), db).email == "user@example.com"
+
+
+def test_async_routes_authenticate_on_the_request_session(engine, db):
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+    from app.core.database import get_db, get_request_db
+    from app.routers.reader import router as reader_router
+
+    def no_sync_session():
+        pytest.fail("an async route opened a sync session")
+
+    app = FastAPI()
+    app.include_router(reader_router, prefix="/api/reader")
+    app.dependency_overrides[get_request_db] = lambda: db
+    app.dependency_overrides[get_db] = no_sync_session
+    client = TestClient(app)
+    tokens = refresh_tokens(create_refresh_token({"sub": "user@example.com"}, db), db)
+
+    response = client.get("/api/reader/readers", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+    RefreshTokenCRUD(db).delete(tokens["refresh_token"])
+    revoked = client.get("/api/reader/readers", headers={"Authorization": f"Bearer {tokens['access_token']}"})
+
+    assert response.status_code == 200
+    assert revoked.status_code == 401
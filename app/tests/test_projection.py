@@ -0,0 +1,57 @@
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import Row
+
+from app.core.projection import parse_fields
+from app.crud.book import BookCRUD
+from app.crud.reader import ReaderCRUD
+from app.models.book import Book
+from app.models.reader import Reader
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title=f"Book {i}", author=f"Author {5 - i}", publication_year=2000, isbn=str(i),
+                 copies_available=1, description="long text")
+            for i in range(1, 6)
+        ] + [Reader(name="Reader", email="reader@example.com")])
+        session.commit()
+
+
+def test_parse_fields_keeps_table_order_and_rejects_unknown_columns():
+    assert parse_fields("title, id,title", Book.__table__) == ["id", "title"]
+    assert parse_fields(None, Book.__table__) == list(Book.__table__.c.keys())
+    with pytest.raises(ValueError):
+        parse_fields("id,password", Book.__table__)
+
+
+def test_page_of_rows_loads_only_requested_columns(db):
+    books, next_cursor = BookCRUD(db).get_page(limit=2, sort="author", fields=["title"])
+
+    assert all(isinstance(book, Row) for book in books)
+    assert books[0]._fields == ("id", "title", "author")
+    assert [book.title for book in books] == ["Book 5", "Book 4"]
+    assert not db.identity_map
+
+    books, _ = BookCRUD(db).get_page(limit=2, sort="author", after=next_cursor, fields=["title"])
+    assert [book.title for book in books] == ["Book 3", "Book 2"]
+
+
+def test_orm_mode_is_kept_without_fields(db):
+    books, _ = BookCRUD(db).get_page(limit=1)
+
+    assert isinstance(books[0], Book)
+
+
+def test_reader_lookups_return_rows(db):
+    crud = ReaderCRUD(db)
+
+    reader = crud.get_by_id(1, fields=["email"])
+    assert reader._fields == ("id", "email") and reader.email == "reader@example.com"
+    assert crud.get_by_id(2, fields=["email"]) is None
+    assert list(crud.get_all(fields=["name"])) == [1]
+    with pytest.raises(HTTPException) as error:
+        crud.get_all(fields=["secret"])
+    assert error.value.status_code == 400
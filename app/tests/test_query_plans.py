@@ -0,0 +1,80 @@
+import pytest
+from sqlalchemy import event, select
+
+from app.crud.reader import ReaderCRUD
+from app.models.book import Book
+from app.models.borrowed_books import BorrowedBooks
+from app.models.reader import Reader
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title=f"Book {i}", author="Author", publication_year=2000, isbn=str(i), copies_available=3)
+            for i in range(1, 6)
+        ] + [
+            Reader(name=f"Reader {i}", email=f"reader{i}@example.com")
+            for i in range(1, 4)
+        ])
+        session.commit()
+
+
+def capture_loan_queries(engine, action):
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "borrowed_books" in statement and not statement.lstrip().upper().startswith("INSERT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        action()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    return statements
+
+
+def query_plan(engine, statement, parameters):
+    with engine.connect() as conn:
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+    return " | ".join(row[-1] for row in rows)
+
+
+def assert_uses_index(engine, statements):
+    assert statements
+    for statement, parameters in statements:
+        plan = query_plan(engine, statement, parameters)
+        assert "SCAN borrowed_books" not in plan, f"{statement}\n{plan}"
+        assert "borrowed_books USING" in plan, f"{statement}\n{plan}"
+
+
+def test_borrow_and_return_queries_use_indexes(engine, db):
+    crud = ReaderCRUD(db)
+    crud.borrow_book(1, 1)
+    crud.borrow_book(1, 2)
+
+    statements = capture_loan_queries(engine, lambda: crud.return_borrowed_book(1, 1))
+
+    assert_uses_index(engine, statements)
+
+
+def test_reader_loan_queries_use_indexes(engine, db):
+    crud = ReaderCRUD(db)
+    crud.borrow_book(2, 3)
+
+    statements = capture_loan_queries(engine, lambda: (
+        crud.get_borrowed_books(2),
+        crud.have_borrowed_book(2),
+        crud.reconcile_active_loans(),
+        crud.get_loan_history(2, limit=10),
+        crud.get_loan_history(2, limit=10, active=True),
+    ))
+
+    assert_uses_index(engine, statements)
+
+
+def test_loans_per_book_query_uses_index(engine, db):
+    statement = select(BorrowedBooks).where(BorrowedBooks.book_id == 1).compile(engine)
+
+    assert_uses_index(engine, [(str(statement), tuple(statement.params.values()))])
@@ -0,0 +1,89 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+from app.config import Config
+from app.core.base import Base
+from app.core.routing import PRIMARY_COOKIE, ReadYourWritesMiddleware, RoutingSession
+from app.models.book import Book
+
+
+def database(path, title):
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(Book(title=title, author="Author", publication_year=2000, isbn="isbn-1", copies_available=1))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    primary = database(tmp_path / "primary.db", "primary")
+    replicas = [database(tmp_path / f"replica{i}.db", f"replica{i}") for i in range(2)]
+    yield sessionmaker(class_=RoutingSession, writer=primary, readers=replicas, expire_on_commit=False)
+    for engine in [primary] + replicas:
+        engine.dispose()
+
+
+def read_title(factory):
+    with factory() as db:
+        return db.scalar(select(Book.title))
+
+
+def test_reads_are_spread_over_replicas_and_writes_go_to_the_primary(sessions):
+    titles = {read_title(sessions) for _ in range(4)}
+
+    with sessions() as db:
+        db.execute(update(Book).values(copies_available=5))
+        written = db.scalar(select(Book.title))
+        db.commit()
+
+    assert titles == {"replica0", "replica1"}
+    assert written == "primary"
+
+
+def test_client_reads_its_own_writes_from_the_primary(sessions, monkeypatch):
+    monkeypatch.setattr(Config, "SQLALCHEMY_REPLICA_URLS", ["sqlite:///replica.db"])
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=60)
+
+    @app.get("/book")
+    def get_book():
+        return read_title(sessions)
+
+    @app.post("/book")
+    def borrow_book():
+        with sessions() as db:
+            db.execute(update(Book).values(copies_available=0))
+            db.commit()
+
+    client = TestClient(app)
+    before = client.get("/book").json()
+    response = client.post("/book")
+    after = {client.get("/book").json() for _ in range(3)}
+    client.cookies.clear()
+
+    assert before.startswith("replica")
+    assert PRIMARY_COOKIE in response.cookies
+    assert after == {"primary"}
+    assert client.get("/book").json().startswith("replica")
+
+
+def test_middleware_passes_through_without_replicas(sessions, monkeypatch):
+    monkeypatch.setattr(Config, "SQLALCHEMY_REPLICA_URLS", [])
+    app = FastAPI()
+    app.add_middleware(ReadYourWritesMiddleware, sticky_seconds=60)
+
+    @app.post("/book")
+    def borrow_book():
+        with sessions() as db:
+            db.execute(update(Book).values(copies_available=0))
+            db.commit()
+
+    response = TestClient(app).post("/book")
+
+    assert response.status_code == 200
+    assert PRIMARY_COOKIE not in response.cookies
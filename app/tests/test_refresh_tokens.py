@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import event, func, insert, select
+
+from app.core.security import create_refresh_token, refresh_tokens
+from app.crud.refresh_token import RefreshTokenCRUD, utcnow
+from app.models.refresh_token import RefreshToken
+
+
+def count_tokens(db):
+    return db.scalar(select(func.count()).select_from(RefreshToken))
+
+
+def test_refresh_rotates_in_one_commit(engine, db):
+    token = create_refresh_token({"sub": "user@example.com"}, db)
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(conn))
+
+    tokens = refresh_tokens(token, db)
+
+    assert len(commits) == 1
+    assert tokens["refresh_token"] != token
+    assert count_tokens(db) == 1
+    stored = db.scalars(select(RefreshToken)).one()
+    assert token not in (stored.token_hash, stored.user_id)
+
+
+def test_refresh_token_can_be_used_once(db):
+    token = create_refresh_token({"sub": "user@example.com"}, db)
+    refresh_tokens(token, db)
+
+    with pytest.raises(HTTPException) as exc:
+        refresh_tokens(token, db)
+    assert exc.value.status_code == 401
+
+
+def test_login_revokes_previous_token(db):
+    first = create_refresh_token({"sub": "user@example.com"}, db)
+    create_refresh_token({"sub": "user@example.com"}, db)
+
+    assert count_tokens(db) == 1
+    with pytest.raises(HTTPException):
+        refresh_tokens(first, db)
+
+
+def test_purge_deletes_expired_tokens_in_batches(db):
+    now = utcnow()
+    db.execute(insert(RefreshToken), [
+        {"user_id": f"user{i}", "token_hash": f"{i:064x}", "expires_at": now + timedelta(days=-1 if i < 25 else 1)}
+        for i in range(30)
+    ])
+    db.commit()
+
+    assert RefreshTokenCRUD(db).purge_expired(batch_size=10) == 25
+    assert count_tokens(db) == 5
@@ -0,0 +1,50 @@
+import json
+from datetime import datetime
+from typing import Dict
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.core.responses import FastJSONResponse
+from app.models.book import Book
+from app.models.reader import Reader
+from app.models.user import User
+from app.schemas.book import BookRead
+from app.schemas.reader import ReaderRead
+from app.schemas.user import UserRead
+
+
+def test_fast_json_response_matches_json_module():
+    content = {"items": [{"id": 1, "title": "Żółw", "when": datetime(2026, 1, 2, 3, 4, 5)}], "next_cursor": None}
+
+    body = FastJSONResponse(content).body
+
+    assert json.loads(body) == {
+        "items": [{"id": 1, "title": "Żółw", "when": "2026-01-02T03:04:05"}],
+        "next_cursor": None,
+    }
+
+
+def test_response_models_read_orm_objects():
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/book", response_model=BookRead)
+    def get_book():
+        return Book(id=1, title="T", author="A", publication_year=2000, isbn="1", copies_available=2)
+
+    @app.get("/readers", response_model=Dict[int, ReaderRead])
+    def get_readers():
+        return {3: Reader(id=3, name="R", email="r@example.com", active_loans=1)}
+
+    @app.get("/user", response_model=UserRead)
+    def get_user():
+        return User(id=5, email="u@example.com", password="$2b$12$hash")
+
+    client = TestClient(app)
+
+    assert client.get("/book").json() == {
+        "id": 1, "title": "T", "author": "A", "publication_year": 2000,
+        "isbn": "1", "copies_available": 2, "description": None, "version": None,
+    }
+    assert client.get("/readers").json() == {"3": {"id": 3, "name": "R", "email": "r@example.com", "active_loans": 1, "version": None}}
+    assert client.get("/user").json() == {"id": 5, "email": "u@example.com"}
@@ -0,0 +1,83 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from app.core.pagination import encode_cursor
+from app.crud.book import BookCRUD
+from app.models.book import BOOK_SEARCH_VECTOR, Book
+from app.schemas.book import BookCreate
+
+
+@pytest.fixture(autouse=True)
+def seed(session_factory):
+    with session_factory() as session:
+        session.add_all([
+            Book(title="Gardening for beginners", author="Ann Smith", isbn="1", description="Soil and seeds"),
+            Book(title="Cooking", author="Garth Gardener", isbn="2", description="Recipes"),
+            Book(title="History", author="John Doe", isbn="3", description="A gardening chapter"),
+            Book(title="Unrelated", author="Nobody", isbn="4", description="Nothing to see"),
+        ])
+        session.commit()
+
+
+def titles(books):
+    return [book.title for book in books]
+
+
+def test_title_matches_rank_above_author_and_description(db):
+    books, next_cursor = BookCRUD(db).search("garden", limit=10)
+
+    assert titles(books) == ["Gardening for beginners", "Cooking", "History"]
+    assert next_cursor is None
+
+
+def test_every_term_must_match_as_a_prefix(db):
+    crud = BookCRUD(db)
+
+    assert titles(crud.search("gard smi", limit=10)[0]) == ["Gardening for beginners"]
+    assert crud.search("garden missing", limit=10) == ([], None)
+    assert crud.search("  ?! ", limit=10) == ([], None)
+
+
+def test_keyset_pages_follow_the_ranking_across_equal_ranks(db):
+    crud = BookCRUD(db)
+    for i in range(5, 25):
+        crud.create(BookCreate(title="Same words", author="Author", publication_year=2000, isbn=str(i),
+                               copies_available=1))
+    expected = [book.id for book in crud.search("same words", limit=100)[0]]
+
+    seen, after = [], None
+    while True:
+        books, after = crud.search("same words", limit=3, after=after, fields=["title"])
+        seen.extend(book.id for book in books)
+        if after is None:
+            break
+
+    assert len(expected) == 20
+    assert seen == expected
+
+
+def test_index_follows_updates_and_deletes(db):
+    crud = BookCRUD(db)
+
+    crud.update(4, BookCreate(title="Garden paths", author="Nobody", publication_year=2000, isbn="4",
+                              copies_available=1))
+    crud.delete(1)
+
+    assert titles(crud.search("garden", limit=10)[0]) == ["Garden paths", "Cooking", "History"]
+
+
+@pytest.mark.parametrize("cursor", [encode_cursor([3]), encode_cursor(["1.5", 3]), encode_cursor([1.5, "3"])])
+def test_invalid_search_cursors_are_rejected(db, cursor):
+    with pytest.raises(ValueError):
+        BookCRUD(db).search("garden", limit=10, after=cursor)
+
+
+def test_postgresql_query_uses_the_indexed_vector_and_ranks_in_single_precision():
+    statement = BookCRUD._ranked_matches("postgresql", ["war", "pea"], 0.25, 7)
+    compiled = statement.compile(dialect=postgresql.dialect())
+    sql = str(compiled)
+
+    assert f"(({BOOK_SEARCH_VECTOR}) @@ to_tsquery(" in sql
+    assert "war:* & pea:*" in compiled.params.values()
+    assert "< CAST(%(param_1)s AS REAL)" in sql and compiled.params["param_1"] == 0.25
+    assert sql.rstrip().endswith("DESC, books.id")
@@ -0,0 +1,60 @@
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.orm import sessionmaker
+
+from app.config import Config
+from app.core.base import Base
+from app.core.engine import create_engines
+from app.core.routing import RoutingSession
+from app.models.book import Book
+
+
+@pytest.fixture
+def engines(tmp_path, monkeypatch):
+    monkeypatch.setattr(Config, "SQLITE_PRODUCTION_MODE", True)
+    writer, (reader,) = create_engines(f"sqlite:///{tmp_path / 'library.db'}")
+    Base.metadata.create_all(bind=writer)
+    yield writer, reader
+    writer.dispose()
+    reader.dispose()
+
+
+def record_statements(engine, statements):
+    event.listen(engine, "before_cursor_execute", lambda conn, cursor, statement, *args: statements.append(statement))
+
+
+def test_connections_use_wal_and_tuned_pragmas(engines):
+    writer, reader = engines
+
+    with reader.connect() as conn:
+        pragmas = {
+            name: conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in ("journal_mode", "synchronous", "busy_timeout", "mmap_size")
+        }
+
+    assert pragmas == {
+        "journal_mode": "wal",
+        "synchronous": 1,
+        "busy_timeout": Config.SQLITE_BUSY_TIMEOUT_MS,
+        "mmap_size": Config.SQLITE_MMAP_SIZE,
+    }
+    assert writer.pool.size() == 1
+
+
+def test_reads_use_the_read_pool_until_the_transaction_writes(engines):
+    writer, reader = engines
+    writes, reads = [], []
+    record_statements(writer, writes)
+    record_statements(reader, reads)
+    db = sessionmaker(class_=RoutingSession, writer=writer, readers=[reader])()
+
+    db.execute(select(Book)).all()
+    db.add(Book(title="Book", author="Author", publication_year=2000, isbn="isbn-1", copies_available=1))
+    db.flush()
+    db.execute(select(Book)).all()
+    db.commit()
+    db.execute(select(Book)).all()
+    db.close()
+
+    assert [s.split()[0] for s in reads] == ["SELECT", "SELECT"]
+    assert [s.split()[0] for s in writes] == ["BEGIN", "INSERT", "SELECT"]
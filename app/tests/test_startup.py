@@ -0,0 +1,62 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+IMPORT_BUDGET_SECONDS = 3.0
+
+
+def run_python(code, tmp_path, **env):
+    environment = {
+        **os.environ,
+        "SECRET_KEY": "secret",
+        "ALGORITHM": "HS256",
+        "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+        "SQLALCHEMY_DATABASE_URL": f"sqlite:///{tmp_path / 'startup.db'}",
+        **env,
+    }
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=PROJECT_ROOT, env=environment, capture_output=True, text=True, check=True
+    )
+
+
+def cumulative_import_seconds(stderr, module):
+    for line in stderr.splitlines():
+        parts = [part.strip() for part in line.removeprefix("import time:").split("|")]
+        if len(parts) == 3 and parts[2] == module:
+            return int(parts[1]) / 1_000_000
+    raise AssertionError(f"{module} not found in -X importtime output")
+
+
+def test_importing_the_app_stays_within_budget_and_does_not_touch_the_database(tmp_path):
+    result = run_python(
+        "import app.main\n"
+        "from app import config\n"
+        "from app.core.database import get_engines\n"
+        "print(get_engines.cache_info().currsize, config._environment_loaded)",
+        tmp_path
+    )
+
+    assert result.stdout.strip() == "0 False"
+    assert not (tmp_path / "startup.db").exists()
+    assert cumulative_import_seconds(result.stderr, "app.main") < IMPORT_BUDGET_SECONDS
+
+
+@pytest.mark.parametrize("skip, expected", [("false", "True"), ("true", "False")])
+def test_lifespan_creates_tables_unless_schema_check_is_skipped(tmp_path, skip, expected):
+    result = run_python(
+        "from fastapi.testclient import TestClient\n"
+        "from sqlalchemy import inspect\n"
+        "from app.main import app\n"
+        "from app.core.database import get_engine\n"
+        "with TestClient(app):\n"
+        "    print(inspect(get_engine()).has_table('books'))",
+        tmp_path,
+        SKIP_SCHEMA_CHECK=skip
+    )
+
+    assert result.stdout.strip() == expected
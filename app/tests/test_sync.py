@@ -0,0 +1,82 @@
+import pytest
+
+from app.crud.book import BookCRUD
+from app.crud.reader import ReaderCRUD
+from app.crud.sync import SyncCRUD
+from app.schemas.book import BookCreate
+from app.schemas.reader import ReaderCreate
+
+
+def new_book(isbn: str, title: str = "Title") -> BookCreate:
+    return BookCreate(title=title, author="Author", publication_year=2000, isbn=isbn, copies_available=1)
+
+
+def sync(db, token=None, limit=100):
+    """Follow the feed until it is drained; return the applied state and the final token."""
+    books, readers = {}, {}
+    while True:
+        page = SyncCRUD(db).get_changes(token, limit=limit)
+        for state, changes in ((books, page["books"]), (readers, page["readers"])):
+            state.update({row.id: row for row in changes["upserted"]})
+            for deleted_id in changes["deleted"]:
+                state.pop(deleted_id, None)
+            assert len(changes["upserted"]) + len(changes["deleted"]) <= limit
+        token = page["next_token"]
+        if not page["has_more"]:
+            return books, readers, token
+
+
+def test_full_sync_is_paged(db):
+    crud = BookCRUD(db)
+    for i in range(7):
+        crud.create(new_book(str(i)))
+    ReaderCRUD(db).create(ReaderCreate(name="Reader", email="reader@example.com"))
+
+    books, readers, token = sync(db, limit=2)
+
+    assert sorted(books) == list(range(1, 8))
+    assert list(readers) == [1]
+    assert sync(db, token) == ({}, {}, token)
+
+
+def test_delta_sync_returns_only_changes_and_tombstones(db):
+    books_crud, readers_crud = BookCRUD(db), ReaderCRUD(db)
+    for i in range(5):
+        books_crud.create(new_book(str(i)))
+    reader = readers_crud.create(ReaderCreate(name="Reader", email="reader@example.com"))
+    _, _, token = sync(db)
+
+    books_crud.update(2, new_book("1", title="Renamed"))
+    books_crud.delete(4)
+    readers_crud.borrow_book(reader.id, 3)
+    temporary = readers_crud.create(ReaderCreate(name="Temp", email="temp@example.com"))
+    readers_crud.delete(temporary.id)
+
+    page = SyncCRUD(db).get_changes(token, limit=100)
+
+    assert [(row.id, row.title) for row in page["books"]["upserted"]] == [(2, "Renamed"), (3, "Title")]
+    assert page["books"]["deleted"] == [4]
+    assert [(row.id, row.active_loans) for row in page["readers"]["upserted"]] == [(1, 1)]
+    assert page["readers"]["deleted"] == [temporary.id]
+
+
+def test_invalid_token_is_rejected(db):
+    with pytest.raises(ValueError):
+        SyncCRUD(db).get_changes("not-a-token", limit=10)
+
+
+def test_reconciled_loan_counters_reach_synced_clients(db):
+    from app.models.reader import Reader
+
+    crud = ReaderCRUD(db)
+    drifted = crud.create(ReaderCreate(name="Drifted", email="drifted@example.com"))
+    crud.create(ReaderCreate(name="Exact", email="exact@example.com"))
+    db.query(Reader).filter(Reader.id == drifted.id).update({"active_loans": 3})
+    db.commit()
+    _, readers, token = sync(db)
+    assert readers[drifted.id].active_loans == 3
+
+    assert crud.reconcile_active_loans() == 1
+
+    _, readers, _ = sync(db, token)
+    assert [(row.id, row.active_loans) for row in readers.values()] == [(drifted.id, 0)]
@@ -0,0 +1,113 @@
+"""
+Memory and CPU cost of loading one large page of books.
+
+Loads the same page three ways through `BookCRUD.get_page`:
+
+* ``orm`` - full ORM instances (identity map, attribute instrumentation);
+* ``core`` - a Core select of every column returned as `Row` objects;
+* ``core, no description`` - a Core select of the columns a listing needs,
+  leaving out the long `description` text.
+
+Each run uses a fresh session; the CPU time of the load and the peak memory
+allocated while it ran (tracemalloc, page still held) are measured in separate
+runs and reported as medians.
+
+Usage:
+    python -m benchmarks.read_path --rows 50000 --repeat 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Dict, List, Optional, Sequence, Tuple
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.base import Base  # noqa: E402
+from app.crud.book import BookCRUD  # noqa: E402
+from app.models.book import Book  # noqa: E402
+
+LISTING_FIELDS = ("id", "title", "author", "publication_year", "isbn", "copies_available")
+
+STRATEGIES: Tuple[Tuple[str, Optional[Sequence[str]]], ...] = (
+    ("orm", None),
+    ("core", tuple(Book.__table__.c.keys())),
+    ("core, no description", LISTING_FIELDS),
+)
+
+
+def seed(url: str, rows: int) -> None:
+    """Create the schema and `rows` books with a realistic description."""
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Book.__table__), [
+            {
+                "title": f"Book {i}", "author": f"Author {i % 997}", "publication_year": 1900 + i % 120,
+                "isbn": f"978-{i:09d}", "copies_available": i % 7,
+                "description": f"Description of book {i}. " + "Lorem ipsum dolor sit amet. " * 12,
+            }
+            for i in range(rows)
+        ])
+    engine.dispose()
+
+
+def load(factory: sessionmaker, rows: int, fields: Optional[Sequence[str]], trace: bool) -> float:
+    """Load one page of `rows` books; return its CPU time, or its peak memory if `trace`."""
+    db = factory()
+    try:
+        if trace:
+            tracemalloc.start()
+        started = time.process_time()
+        books, _ = BookCRUD(db).get_page(limit=rows, fields=fields)
+        elapsed = time.process_time() - started
+        assert len(books) == rows
+        if trace:
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            return peak
+        return elapsed
+    finally:
+        db.close()
+
+
+def measure(factory: sessionmaker, rows: int, fields: Optional[Sequence[str]], repeat: int) -> Dict[str, float]:
+    """
+    Return the median CPU time and peak memory of loading the page.
+
+    CPU is timed with tracemalloc off, since tracing slows allocation down.
+    """
+    cpu = [load(factory, rows, fields, trace=False) for _ in range(repeat)]
+    peak = [load(factory, rows, fields, trace=True) for _ in range(repeat)]
+    return {"cpu_ms": statistics.median(cpu) * 1000, "peak_mb": statistics.median(peak) / 1024 / 1024}
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        seed(url, args.rows)
+        engine = create_engine(url)
+        factory = sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        for name, fields in STRATEGIES:
+            result = measure(factory, args.rows, fields, args.repeat)
+            print(f"{name:<22} cpu {result['cpu_ms']:>8.0f} ms   peak {result['peak_mb']:>7.1f} MiB")
+        engine.dispose()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
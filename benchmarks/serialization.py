@@ -0,0 +1,102 @@
+"""
+Cost of turning a page of Book rows into a JSON response body.
+
+Compares, per 1,000 books loaded through the ORM:
+
+* ``jsonable_encoder`` - what FastAPI does for a route without a `response_model`:
+  every instance is walked reflectively and the result goes through `json.dumps`;
+* ``response_model`` - validation through `BookRead` (`from_attributes`), then the
+  stock `JSONResponse`;
+* ``response_model + FastJSONResponse`` - the same validation, rendered by
+  pydantic-core, which is what the routes now do.
+
+Usage:
+    python -m benchmarks.serialization --books 1000 --repeat 50
+"""
+import argparse
+import os
+import statistics
+import time
+from typing import Callable, Dict, List
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.core.base import Base  # noqa: E402
+from app.core.responses import FastJSONResponse  # noqa: E402
+from app.models.book import Book  # noqa: E402
+from app.schemas.book import BookRead  # noqa: E402
+
+BOOK_LIST = TypeAdapter(List[BookRead])
+
+
+def load_books(count: int) -> List[Book]:
+    """Create an in-memory catalog and load it back as ORM instances."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Book(
+            title=f"Book {i}", author=f"Author {i % 97}", publication_year=1900 + i % 120,
+            isbn=f"978-{i:09d}", copies_available=i % 7, description="A fairly ordinary description. " * 4
+        )
+        for i in range(count)
+    ])
+    session.commit()
+    session.expunge_all()
+    return session.query(Book).order_by(Book.id).all()
+
+
+def legacy(books: List[Book]) -> bytes:
+    """No response model: reflective encoding and json.dumps."""
+    return JSONResponse(jsonable_encoder(books)).body
+
+
+def response_model(books: List[Book]) -> bytes:
+    """Response model validation with the stock JSON response."""
+    return JSONResponse(BOOK_LIST.dump_python(BOOK_LIST.validate_python(books, from_attributes=True), mode="json")).body
+
+
+def response_model_fast_json(books: List[Book]) -> bytes:
+    """Response model validation rendered by pydantic-core."""
+    return FastJSONResponse(BOOK_LIST.dump_python(BOOK_LIST.validate_python(books, from_attributes=True), mode="json")).body
+
+
+def measure(serialize: Callable[[List[Book]], bytes], books: List[Book], repeat: int) -> Dict[str, float]:
+    """Time `repeat` serializations and return the median and best time per 1k books."""
+    serialize(books)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        serialize(books)
+        timings.append((time.perf_counter() - started) * 1000 * 1000 / len(books))
+    return {"median_ms": statistics.median(timings), "best_ms": min(timings)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--books", type=int, default=1000, help="Books per response.")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed runs per strategy.")
+    args = parser.parse_args()
+
+    books = load_books(args.books)
+    print(f"{'strategy':<36} {'median ms/1k':>12} {'best ms/1k':>12}")
+    for name, serialize in (
+        ("jsonable_encoder", legacy),
+        ("response_model", response_model),
+        ("response_model + FastJSONResponse", response_model_fast_json),
+    ):
+        result = measure(serialize, books, args.repeat)
+        print(f"{name:<36} {result['median_ms']:>12.2f} {result['best_ms']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
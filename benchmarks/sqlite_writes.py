@@ -0,0 +1,151 @@
+"""
+Write throughput and latency of concurrent borrow/return traffic on SQLite.
+
+Runs the same workload twice against a fresh file database: once with the
+default engine setup (rollback journal, a regular connection pool shared by
+readers and writers) and once in SQLite production mode (WAL, tuned pragmas, a
+single serialized writer connection and a separate read pool).
+
+Every worker thread owns one reader and one book and loops over
+borrow -> list borrowed books -> return, so each iteration performs two write
+transactions and one read.
+
+Usage:
+    python -m benchmarks.sqlite_writes --threads 16 --iterations 100
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from typing import Dict, List, Tuple
+
+os.environ.setdefault("SECRET_KEY", "benchmark")
+os.environ.setdefault("ALGORITHM", "HS256")
+os.environ.setdefault("ACCESS_TOKEN_EXPIRE_MINUTES", "30")
+os.environ.setdefault("SQLALCHEMY_DATABASE_URL", "sqlite://")
+
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.config import Config  # noqa: E402
+from app.core.base import Base  # noqa: E402
+from app.core.engine import create_engines  # noqa: E402
+from app.core.routing import RoutingSession  # noqa: E402
+from app.crud.reader import ReaderCRUD  # noqa: E402
+from app.models.book import Book  # noqa: E402
+from app.models.reader import Reader  # noqa: E402
+
+
+def baseline_sessions(url: str) -> sessionmaker:
+    """Session factory matching the previous setup: one default pool, no pragmas."""
+    engine = create_engine(url, pool_size=Config.SQLALCHEMY_POOL_SIZE, max_overflow=Config.SQLALCHEMY_MAX_OVERFLOW)
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def production_sessions(url: str) -> sessionmaker:
+    """Session factory of SQLite production mode."""
+    Config.SQLITE_PRODUCTION_MODE = True
+    writer, readers = create_engines(url)
+    return sessionmaker(class_=RoutingSession, writer=writer, readers=readers, autoflush=False, expire_on_commit=False)
+
+
+def seed(url: str, threads: int) -> None:
+    """Create the schema with one book and one reader per worker thread."""
+    engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    session.add_all([
+        Book(title=f"Book {i}", author="Author", publication_year=2000, isbn=f"isbn-{i}", copies_available=1)
+        for i in range(threads)
+    ] + [
+        Reader(name=f"Reader {i}", email=f"reader{i}@example.com")
+        for i in range(threads)
+    ])
+    session.commit()
+    session.close()
+    engine.dispose()
+
+
+def run(factory: sessionmaker, threads: int, iterations: int) -> Tuple[List[float], int, float]:
+    """
+    Run the workload.
+
+    Returns:
+        Tuple[List[float], int, float]: Write latencies in seconds, failed operations and wall time.
+    """
+    latencies: List[float] = []
+    failures = [0]
+    lock = threading.Lock()
+
+    def worker(index: int) -> None:
+        reader_id = book_id = index + 1
+        local: List[float] = []
+        failed = 0
+        for _ in range(iterations):
+            for action in ("borrow", "read", "return"):
+                db = factory()
+                started = time.perf_counter()
+                try:
+                    crud = ReaderCRUD(db)
+                    if action == "borrow":
+                        crud.borrow_book(reader_id, book_id)
+                    elif action == "return":
+                        crud.return_borrowed_book(reader_id, book_id)
+                    else:
+                        crud.get_borrowed_books(reader_id)
+                except Exception:
+                    failed += 1
+                finally:
+                    db.close()
+                if action != "read":
+                    local.append(time.perf_counter() - started)
+        with lock:
+            latencies.extend(local)
+            failures[0] += failed
+
+    started = time.perf_counter()
+    pool = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return latencies, failures[0], time.perf_counter() - started
+
+
+def summarize(name: str, latencies: List[float], failures: int, elapsed: float) -> Dict[str, float]:
+    """Print and return throughput and latency percentiles of one run."""
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    result = {
+        "writes_per_second": (len(latencies) - failures) / elapsed,
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p99_ms": p99 * 1000,
+        "failed": failures,
+    }
+    print(
+        f"{name:<12} {result['writes_per_second']:>10.0f} writes/s   "
+        f"p50 {result['p50_ms']:>8.1f} ms   p99 {result['p99_ms']:>8.1f} ms   "
+        f"failed {failures}"
+    )
+    return result
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--iterations", type=int, default=100)
+    args = parser.parse_args(argv)
+
+    for name, factory in (("baseline", baseline_sessions), ("production", production_sessions)):
+        with tempfile.TemporaryDirectory() as directory:
+            url = f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+            seed(url, args.threads)
+            summarize(name, *run(factory(url), args.threads, args.iterations))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())